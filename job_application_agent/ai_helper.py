@@ -1,8 +1,102 @@
 import os
-from typing import Optional, Dict, Any
-from openai import OpenAI
+import json
+import asyncio
+import hashlib
+from typing import Optional, Dict, Any, List, Tuple, Callable
+import tiktoken
+from openai import OpenAI, AsyncOpenAI
 from loguru import logger
 
+from .verdict_cache import get_verdict_cache, make_verdict_key
+from .llm_cache import get_completion_cache, make_completion_key
+from .rate_limiter import TokenBucket
+from config import LLM_CACHE_BYPASS, LLM_RPM_LIMIT, LLM_TPM_LIMIT
+
+
+# Prompt de classification du domaine: sa version (empreinte du texte) invalide les
+# verdicts mis en cache dès que le prompt change
+DOMAIN_DESCRIPTION_CHARS = 500
+DOMAIN_SYSTEM_MESSAGE = """Tu es un expert en classification d'offres d'emploi.
+        Réponds uniquement par 'OUI' ou 'NON'."""
+DOMAIN_PROMPT = """Ce poste est-il lié à la communication, l'événementiel, le marketing événementiel, 
+ou la gestion de projets événementiels ?
+
+Titre: {title}
+Description: {description}
+
+Réponds uniquement par 'OUI' ou 'NON'."""
+
+# Classification groupée: plusieurs offres numérotées par requête, réponse JSON structurée
+DOMAIN_BATCH_SYSTEM_MESSAGE = """Tu es un expert en classification d'offres d'emploi.
+        Pour chaque offre numérotée, indique si elle est pertinente, au format JSON demandé."""
+DOMAIN_BATCH_PROMPT = """Pour chacune des offres suivantes: ce poste est-il lié à la communication, l'événementiel,
+le marketing événementiel, ou la gestion de projets événementiels ?
+
+{offers}
+
+Réponds avec un verdict par offre (id = numéro de l'offre, relevant = true ou false)."""
+DOMAIN_BATCH_ITEM = """Offre {id}
+Titre: {title}
+Description: {description}
+"""
+DOMAIN_BATCH_SCHEMA = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "domain_verdicts",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "verdicts": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "relevant": {"type": "boolean"}
+                        },
+                        "required": ["id", "relevant"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["verdicts"],
+            "additionalProperties": False
+        }
+    }
+}
+# Tokens de réponse par offre (un objet {"id": n, "relevant": bool}, ~12 tokens, avec marge)
+# et fixes; une réponse tronquée malgré tout fait rediviser le lot en deux
+DOMAIN_BATCH_ANSWER_TOKENS = 16
+DOMAIN_BATCH_ANSWER_OVERHEAD = 40
+
+# Limites de débit d'AsyncAIHelper: rafale autorisée (en secondes de quota) et tokens
+# de réponse comptés pour une requête sans max_tokens
+LLM_BURST_SECONDS = 10
+DEFAULT_COMPLETION_TOKENS = 1000
+
+# Chaque verdict est enregistré sous la version du prompt qui l'a produit; les deux
+# versions sont acceptées à la lecture
+DOMAIN_PROMPT_VERSION = hashlib.sha256(
+    f"{DOMAIN_SYSTEM_MESSAGE}\n{DOMAIN_PROMPT}\n{DOMAIN_DESCRIPTION_CHARS}".encode("utf-8")
+).hexdigest()[:12]
+DOMAIN_BATCH_PROMPT_VERSION = hashlib.sha256(
+    "\n".join([
+        DOMAIN_BATCH_SYSTEM_MESSAGE, DOMAIN_BATCH_PROMPT, DOMAIN_BATCH_ITEM,
+        json.dumps(DOMAIN_BATCH_SCHEMA, sort_keys=True), str(DOMAIN_DESCRIPTION_CHARS)
+    ]).encode("utf-8")
+).hexdigest()[:12]
+DOMAIN_PROMPT_VERSIONS = (DOMAIN_PROMPT_VERSION, DOMAIN_BATCH_PROMPT_VERSION)
+
+
+def _is_json(text: str) -> bool:
+    """Vrai si la réponse est un JSON valide (seules ces réponses sont mises en cache pour l'analyse et le CV)"""
+    try:
+        json.loads(text)
+        return True
+    except ValueError:
+        return False
+
 
 class AIHelper:
     """Helper pour interactions avec OpenAI API"""
@@ -21,6 +115,10 @@ class AIHelper:
         
         self.model = model
         self.client = OpenAI(api_key=self.api_key)
+        self.verdict_cache = get_verdict_cache()
+        self.completion_cache = get_completion_cache()
+        self.cache_bypass = LLM_CACHE_BYPASS
+        self._encoding = None
         logger.info(f"AIHelper initialized with model: {model}")
     
     def generate_completion(
@@ -28,49 +126,112 @@ class AIHelper:
         prompt: str,
         system_message: str = "You are a helpful assistant.",
         temperature: float = 0.7,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
+        cache_if: Optional[Callable[[str], bool]] = None
     ) -> str:
         """
         Génère une completion avec OpenAI
         
+        Les réponses sont mises en cache par (modèle, message système, prompt,
+        température, max_tokens, format): une requête identique est servie sans
+        appel à l'API. Avec cache_bypass, le cache n'est pas lu mais est rafraîchi.
+        
         Args:
             prompt: Le prompt utilisateur
             system_message: Le message système
             temperature: Température (0-1)
             max_tokens: Nombre maximum de tokens
+            response_format: Format de réponse imposé (ex: schéma JSON structuré)
+            use_cache: Lire et alimenter le cache de complétions
+            cache_if: Condition sur la réponse pour la mettre en cache (ex: JSON valide)
             
         Returns:
             La réponse générée
         """
+        cache_key = self._completion_key(prompt, system_message, temperature, max_tokens, response_format) if use_cache else None
+        cached = self._cached_completion(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=temperature,
-                max_tokens=max_tokens
+                **self._completion_params(prompt, system_message, temperature, max_tokens, response_format)
             )
             
             content = response.choices[0].message.content
             logger.debug(f"Generated completion: {len(content)} characters")
-            return content
             
         except Exception as e:
             logger.error(f"Error generating completion: {e}")
             raise
+        
+        self._store_completion(cache_key, content, response, cache_if)
+        return content
     
-    def analyze_job_offer(self, job_description: str) -> Dict[str, Any]:
-        """
-        Analyse une offre d'emploi et extrait les informations clés
+    def _completion_params(
+        self,
+        prompt: str,
+        system_message: str,
+        temperature: float,
+        max_tokens: Optional[int],
+        response_format: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Paramètres de chat.completions.create"""
+        params = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        }
+        if response_format:
+            params["response_format"] = response_format
+        return params
+    
+    def _completion_key(
+        self,
+        prompt: str,
+        system_message: str,
+        temperature: float,
+        max_tokens: Optional[int],
+        response_format: Optional[Dict[str, Any]]
+    ) -> Optional[str]:
+        """Clé du cache de complétions (None si le cache est désactivé)"""
+        if not self.completion_cache:
+            return None
+        return make_completion_key(self.model, system_message, prompt, temperature, max_tokens, response_format)
+    
+    def _cached_completion(self, cache_key: Optional[str]) -> Optional[str]:
+        """Réponse en cache pour une clé (None sans clé, en mode bypass ou si absente)"""
+        if cache_key is None or self.cache_bypass:
+            return None
         
-        Args:
-            job_description: Description complète de l'offre
-            
-        Returns:
-            Dictionnaire avec les informations extraites
-        """
+        cached = self.completion_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Generated completion: {len(cached)} characters (cached)")
+        return cached
+    
+    def _store_completion(self, cache_key: Optional[str], content: Optional[str], response: Any, cache_if: Optional[Callable[[str], bool]]):
+        """Met une réponse de l'API en cache (avec les tokens facturés)"""
+        if cache_key is None or content is None or (cache_if is not None and not cache_if(content)):
+            return
+        
+        usage = response.usage
+        self.completion_cache.store(
+            cache_key,
+            self.model,
+            content,
+            prompt_tokens=usage.prompt_tokens if usage else 0,
+            completion_tokens=usage.completion_tokens if usage else 0
+        )
+    
+    @staticmethod
+    def _analysis_request(job_description: str) -> Dict[str, Any]:
+        """Requête d'analyse d'une offre (paramètres de generate_completion)"""
         system_message = """Tu es un expert en analyse d'offres d'emploi. 
         Analyse l'offre et extrais les informations clés au format JSON."""
         
@@ -87,47 +248,50 @@ Offre d'emploi:
 
 Réponds uniquement avec le JSON, sans texte additionnel."""
 
+        return {
+            "prompt": prompt,
+            "system_message": system_message,
+            "temperature": 0.3,
+            "cache_if": _is_json
+        }
+    
+    @staticmethod
+    def _empty_analysis() -> Dict[str, Any]:
+        """Analyse vide (offre non analysée)"""
+        return {
+            "required_skills": [],
+            "preferred_skills": [],
+            "experience_years": None,
+            "keywords": [],
+            "company_values": [],
+            "main_responsibilities": []
+        }
+    
+    def analyze_job_offer(self, job_description: str) -> Dict[str, Any]:
+        """
+        Analyse une offre d'emploi et extrait les informations clés
+        
+        Args:
+            job_description: Description complète de l'offre
+        
+        Returns:
+            Dictionnaire avec les informations extraites
+        """
         try:
-            response = self.generate_completion(
-                prompt=prompt,
-                system_message=system_message,
-                temperature=0.3
-            )
+            response = self.generate_completion(**self._analysis_request(job_description))
             
             # Parser le JSON
-            import json
             analysis = json.loads(response)
             logger.info("Job offer analyzed successfully")
             return analysis
             
         except Exception as e:
             logger.error(f"Error analyzing job offer: {e}")
-            return {
-                "required_skills": [],
-                "preferred_skills": [],
-                "experience_years": None,
-                "keywords": [],
-                "company_values": [],
-                "main_responsibilities": []
-            }
+            return self._empty_analysis()
     
-    def optimize_cv_content(
-        self,
-        cv_data: Dict[str, Any],
-        job_analysis: Dict[str, Any],
-        target_language: str = "fr"
-    ) -> Dict[str, Any]:
-        """
-        Optimise le contenu du CV selon l'analyse de l'offre
-        
-        Args:
-            cv_data: Données structurées du CV
-            job_analysis: Analyse de l'offre d'emploi
-            target_language: Langue cible (fr ou en)
-            
-        Returns:
-            CV optimisé
-        """
+    @staticmethod
+    def _cv_request(cv_data: Dict[str, Any], job_analysis: Dict[str, Any], target_language: str) -> Dict[str, Any]:
+        """Requête d'optimisation du CV (paramètres de generate_completion)"""
         system_message = """Tu es un expert en rédaction de CV et optimisation ATS.
         Tu dois adapter le CV pour maximiser les chances de succès."""
         
@@ -151,15 +315,34 @@ Instructions:
 
 Réponds uniquement avec le JSON du CV optimisé, sans texte additionnel."""
 
+        return {
+            "prompt": prompt,
+            "system_message": system_message,
+            "temperature": 0.5,
+            "max_tokens": 3000,
+            "cache_if": _is_json
+        }
+    
+    def optimize_cv_content(
+        self,
+        cv_data: Dict[str, Any],
+        job_analysis: Dict[str, Any],
+        target_language: str = "fr"
+    ) -> Dict[str, Any]:
+        """
+        Optimise le contenu du CV selon l'analyse de l'offre
+        
+        Args:
+            cv_data: Données structurées du CV
+            job_analysis: Analyse de l'offre d'emploi
+            target_language: Langue cible (fr ou en)
+        
+        Returns:
+            CV optimisé
+        """
         try:
-            response = self.generate_completion(
-                prompt=prompt,
-                system_message=system_message,
-                temperature=0.5,
-                max_tokens=3000
-            )
+            response = self.generate_completion(**self._cv_request(cv_data, job_analysis, target_language))
             
-            import json
             optimized_cv = json.loads(response)
             logger.info(f"CV optimized for language: {target_language}")
             return optimized_cv
@@ -168,25 +351,14 @@ Réponds uniquement avec le JSON du CV optimisé, sans texte additionnel."""
             logger.error(f"Error optimizing CV: {e}")
             return cv_data
     
-    def generate_cover_letter(
-        self,
+    @staticmethod
+    def _cover_letter_request(
         job_offer: Dict[str, Any],
         cv_data: Dict[str, Any],
         reference_letter: str,
-        target_language: str = "fr"
-    ) -> str:
-        """
-        Génère une lettre de motivation personnalisée
-        
-        Args:
-            job_offer: Informations sur l'offre d'emploi
-            cv_data: Données du CV
-            reference_letter: Lettre de motivation de référence
-            target_language: Langue cible (fr ou en)
-            
-        Returns:
-            Lettre de motivation générée
-        """
+        target_language: str
+    ) -> Dict[str, Any]:
+        """Requête de rédaction de la lettre de motivation (paramètres de generate_completion)"""
         system_message = """Tu es un expert en rédaction de lettres de motivation.
         Tu dois créer une lettre personnalisée, professionnelle et convaincante."""
         
@@ -219,12 +391,35 @@ Instructions:
 
 Génère uniquement la lettre, sans titre ni métadonnées."""
 
+        return {
+            "prompt": prompt,
+            "system_message": system_message,
+            "temperature": 0.7,
+            "max_tokens": 800
+        }
+    
+    def generate_cover_letter(
+        self,
+        job_offer: Dict[str, Any],
+        cv_data: Dict[str, Any],
+        reference_letter: str,
+        target_language: str = "fr"
+    ) -> str:
+        """
+        Génère une lettre de motivation personnalisée
+        
+        Args:
+            job_offer: Informations sur l'offre d'emploi
+            cv_data: Données du CV
+            reference_letter: Lettre de motivation de référence
+            target_language: Langue cible (fr ou en)
+        
+        Returns:
+            Lettre de motivation générée
+        """
         try:
             cover_letter = self.generate_completion(
-                prompt=prompt,
-                system_message=system_message,
-                temperature=0.7,
-                max_tokens=800
+                **self._cover_letter_request(job_offer, cv_data, reference_letter, target_language)
             )
             
             logger.info(f"Cover letter generated for {job_offer.get('company')}")
@@ -238,6 +433,9 @@ Génère uniquement la lettre, sans titre ni métadonnées."""
         """
         Détecte si un poste est lié à la communication/événementiel
         
+        Les verdicts sont mis en cache (titre + début de description normalisés):
+        une offre republiée est classée sans appel à l'API.
+        
         Args:
             job_title: Titre du poste
             job_description: Description du poste
@@ -245,28 +443,362 @@ Génère uniquement la lettre, sans titre ni métadonnées."""
         Returns:
             True si le poste est pertinent, False sinon
         """
-        system_message = """Tu es un expert en classification d'offres d'emploi.
-        Réponds uniquement par 'OUI' ou 'NON'."""
+        cache_key = make_verdict_key(job_title, job_description, DOMAIN_DESCRIPTION_CHARS)
+        if self.verdict_cache:
+            cached = self.verdict_cache.get(cache_key, self.model, DOMAIN_PROMPT_VERSIONS)
+            if cached is not None:
+                logger.debug(f"Job domain detection for '{job_title}': {cached} (cached)")
+                return cached
         
-        prompt = f"""Ce poste est-il lié à la communication, l'événementiel, le marketing événementiel, 
-ou la gestion de projets événementiels ?
-
-Titre: {job_title}
-Description: {job_description[:500]}
-
-Réponds uniquement par 'OUI' ou 'NON'."""
+        prompt = DOMAIN_PROMPT.format(
+            title=job_title,
+            description=job_description[:DOMAIN_DESCRIPTION_CHARS]
+        )
 
         try:
             response = self.generate_completion(
                 prompt=prompt,
-                system_message=system_message,
-                temperature=0.1
+                system_message=DOMAIN_SYSTEM_MESSAGE,
+                temperature=0.1,
+                use_cache=False  # verdicts déjà mis en cache par offre (verdict_cache)
             )
             
             is_relevant = response.strip().upper() == "OUI"
             logger.debug(f"Job domain detection for '{job_title}': {is_relevant}")
-            return is_relevant
             
         except Exception as e:
+            # Propagée: l'appelant applique son repli (un faux NON fausserait les verdicts enregistrés)
             logger.error(f"Error detecting job domain: {e}")
-            return False
+            raise
+        
+        if self.verdict_cache:
+            self.verdict_cache.store(cache_key, self.model, DOMAIN_PROMPT_VERSION, is_relevant, job_title)
+        return is_relevant
+    
+    def count_tokens(self, text: str) -> int:
+        """
+        Compte les tokens d'un texte pour le modèle (tiktoken)
+        
+        Si l'encodage n'est pas disponible (pas de réseau au premier chargement),
+        le nombre est estimé à partir de la longueur du texte.
+        
+        Args:
+            text: Texte à mesurer
+        
+        Returns:
+            Nombre de tokens
+        """
+        if self._encoding is None:
+            try:
+                try:
+                    self._encoding = tiktoken.encoding_for_model(self.model)
+                except KeyError:
+                    self._encoding = tiktoken.get_encoding("o200k_base")
+            except Exception as e:
+                logger.warning(f"tiktoken encoding unavailable, estimating token counts: {e}")
+                self._encoding = False
+        
+        if self._encoding is False:
+            return len(text) // 3 + 1
+        return len(self._encoding.encode(text))
+    
+    def _split_domain_batches(self, items: List[str], max_tokens: int, max_size: int) -> List[List[int]]:
+        """
+        Répartit des offres en lots dont le prompt tient dans le budget de tokens
+        
+        Args:
+            items: Texte de chaque offre dans le prompt
+            max_tokens: Budget de tokens du prompt d'un lot
+            max_size: Nombre maximum d'offres par lot
+        
+        Returns:
+            Lots d'indices dans items
+        """
+        base_tokens = self.count_tokens(DOMAIN_BATCH_SYSTEM_MESSAGE + DOMAIN_BATCH_PROMPT)
+        batches, batch, batch_tokens = [], [], base_tokens
+        
+        for index, item in enumerate(items):
+            tokens = self.count_tokens(item)
+            if batch and (batch_tokens + tokens > max_tokens or len(batch) >= max_size):
+                batches.append(batch)
+                batch, batch_tokens = [], base_tokens
+            batch.append(index)
+            batch_tokens += tokens
+        
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    def _classify_domain_batch(self, jobs: List[Tuple[str, str]]) -> Dict[int, bool]:
+        """
+        Classe un lot d'offres en une seule requête
+        
+        Une réponse illisible (ex: tronquée par max_tokens) fait reclasser chaque
+        moitié du lot séparément, jusqu'à une offre par requête.
+        
+        Args:
+            jobs: Offres du lot (titre, description)
+        
+        Returns:
+            Verdicts valides par position dans le lot (les réponses manquantes ou invalides sont absentes)
+        """
+        offers = "\n".join(
+            DOMAIN_BATCH_ITEM.format(id=number, title=title, description=description[:DOMAIN_DESCRIPTION_CHARS])
+            for number, (title, description) in enumerate(jobs, 1)
+        )
+        response = self.generate_completion(
+            prompt=DOMAIN_BATCH_PROMPT.format(offers=offers),
+            system_message=DOMAIN_BATCH_SYSTEM_MESSAGE,
+            temperature=0.1,
+            max_tokens=DOMAIN_BATCH_ANSWER_OVERHEAD + DOMAIN_BATCH_ANSWER_TOKENS * len(jobs),
+            response_format=DOMAIN_BATCH_SCHEMA,
+            use_cache=False
+        )
+        
+        try:
+            verdicts = json.loads(response)["verdicts"]
+        except (ValueError, KeyError, TypeError) as e:
+            if len(jobs) == 1:
+                logger.warning(f"Malformed batch domain answer ({e}), falling back to a single call")
+                return {}
+            middle = len(jobs) // 2
+            logger.warning(f"Malformed batch domain answer ({e}), splitting the batch of {len(jobs)} offers")
+            results = self._classify_domain_batch(jobs[:middle])
+            results.update({middle + position: verdict for position, verdict in self._classify_domain_batch(jobs[middle:]).items()})
+            return results
+        
+        results: Dict[int, bool] = {}
+        duplicates = set()
+        for verdict in verdicts if isinstance(verdicts, list) else []:
+            if not isinstance(verdict, dict):
+                continue
+            number, relevant = verdict.get("id"), verdict.get("relevant")
+            if not isinstance(number, int) or not isinstance(relevant, bool) or not 1 <= number <= len(jobs):
+                continue
+            if number - 1 in results:
+                duplicates.add(number - 1)
+            results[number - 1] = relevant
+        
+        # Un numéro présent deux fois est ambigu: reclassé individuellement
+        for index in duplicates:
+            del results[index]
+        return results
+    
+    def detect_job_domains(
+        self,
+        jobs: List[Tuple[str, str]],
+        max_prompt_tokens: int = 6000,
+        max_batch_size: int = 25
+    ) -> List[Optional[bool]]:
+        """
+        Détecte le domaine de plusieurs offres avec le moins de requêtes possible
+        
+        Les offres déjà en cache ne sont pas envoyées; les autres sont regroupées en
+        lots (découpés selon le budget de tokens) classés chacun en une requête à
+        réponse JSON structurée. Les offres sans verdict valide dans la réponse sont
+        reclassées une par une avec detect_job_domain.
+        
+        Args:
+            jobs: Offres (titre, description)
+            max_prompt_tokens: Budget de tokens du prompt d'un lot
+            max_batch_size: Nombre maximum d'offres par lot
+        
+        Returns:
+            Verdict de chaque offre, dans l'ordre (None si la classification a échoué)
+        """
+        results: List[Optional[bool]] = [None] * len(jobs)
+        keys = [make_verdict_key(title, description, DOMAIN_DESCRIPTION_CHARS) for title, description in jobs]
+        
+        pending = []
+        for index, key in enumerate(keys):
+            if self.verdict_cache:
+                results[index] = self.verdict_cache.get(key, self.model, DOMAIN_PROMPT_VERSIONS)
+            if results[index] is None:
+                pending.append(index)
+        
+        items = [
+            DOMAIN_BATCH_ITEM.format(id=0, title=jobs[index][0], description=jobs[index][1][:DOMAIN_DESCRIPTION_CHARS])
+            for index in pending
+        ]
+        batches = self._split_domain_batches(items, max_prompt_tokens, max_batch_size)
+        retries = []
+        
+        for batch in batches:
+            indices = [pending[position] for position in batch]
+            verdicts = self._classify_domain_batch([jobs[index] for index in indices])
+            
+            for position, index in enumerate(indices):
+                if position not in verdicts:
+                    retries.append(index)
+                    continue
+                results[index] = verdicts[position]
+                if self.verdict_cache:
+                    self.verdict_cache.store(keys[index], self.model, DOMAIN_BATCH_PROMPT_VERSION, verdicts[position], jobs[index][0])
+        
+        for index in retries:
+            try:
+                results[index] = self.detect_job_domain(*jobs[index])
+            except Exception:
+                results[index] = None
+        
+        logger.info(
+            f"Batch domain detection: {len(jobs)} offers, {len(jobs) - len(pending)} cached, "
+            f"{len(batches)} batch requests, {len(retries)} single-call fallbacks"
+        )
+        return results
+
+
+class AsyncAIHelper(AIHelper):
+    """
+    Variante asyncio d'AIHelper (client AsyncOpenAI) pour traiter plusieurs offres à la fois
+    
+    Les méthodes *_async partagent les prompts et le cache de complétions des
+    méthodes synchrones (toujours disponibles). Chaque requête attend son tour
+    dans deux seaux à jetons: requêtes par minute et tokens par minute (prompt
+    compté par tiktoken + max_tokens de la réponse).
+    """
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gpt-4.1-mini",
+        rpm_limit: float = LLM_RPM_LIMIT,
+        tpm_limit: float = LLM_TPM_LIMIT
+    ):
+        """
+        Initialise les clients OpenAI et les limites de débit
+        
+        Args:
+            api_key: Clé API OpenAI (utilise OPENAI_API_KEY si None)
+            model: Modèle à utiliser
+            rpm_limit: Requêtes par minute autorisées
+            tpm_limit: Tokens par minute autorisés
+        """
+        super().__init__(api_key=api_key, model=model)
+        self.request_bucket = TokenBucket(rate=rpm_limit / 60, capacity=rpm_limit / 60 * LLM_BURST_SECONDS)
+        self.token_bucket = TokenBucket(rate=tpm_limit / 60, capacity=tpm_limit / 60 * LLM_BURST_SECONDS)
+        self.rate_limit_wait = 0.0
+        self._async_client = None
+        self._async_client_loop = None
+    
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Client AsyncOpenAI de la boucle asyncio courante (recréé à chaque asyncio.run, fermé par aclose)"""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = AsyncOpenAI(api_key=self.api_key)
+            self._async_client_loop = loop
+        return self._async_client
+    
+    async def aclose(self):
+        """Ferme le client AsyncOpenAI (à appeler avant la fin de la boucle asyncio qui l'utilise)"""
+        client, self._async_client, self._async_client_loop = self._async_client, None, None
+        if client is not None:
+            await client.close()
+    
+    async def _acquire(self, prompt: str, system_message: str, max_tokens: Optional[int]):
+        """Attend que les quotas de requêtes et de tokens permettent l'envoi"""
+        tokens = self.count_tokens(system_message) + self.count_tokens(prompt) + (max_tokens or DEFAULT_COMPLETION_TOKENS)
+        wait = await self.request_bucket.acquire_async()
+        wait += await self.token_bucket.acquire_async(tokens)
+        if wait:
+            self.rate_limit_wait += wait
+            logger.debug(f"Waited {wait:.1f}s for the OpenAI rate limits")
+    
+    async def generate_completion_async(
+        self,
+        prompt: str,
+        system_message: str = "You are a helpful assistant.",
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
+        cache_if: Optional[Callable[[str], bool]] = None
+    ) -> str:
+        """
+        Génère une completion sans bloquer la boucle asyncio (voir generate_completion)
+        
+        Args:
+            prompt: Le prompt utilisateur
+            system_message: Le message système
+            temperature: Température (0-1)
+            max_tokens: Nombre maximum de tokens
+            response_format: Format de réponse imposé
+            use_cache: Lire et alimenter le cache de complétions
+            cache_if: Condition sur la réponse pour la mettre en cache
+        
+        Returns:
+            La réponse générée
+        """
+        cache_key = self._completion_key(prompt, system_message, temperature, max_tokens, response_format) if use_cache else None
+        # Cache SQLite: lecture et écriture hors de la boucle asyncio
+        cached = await asyncio.to_thread(self._cached_completion, cache_key)
+        if cached is not None:
+            return cached
+        
+        await self._acquire(prompt, system_message, max_tokens)
+        try:
+            response = await self.async_client.chat.completions.create(
+                **self._completion_params(prompt, system_message, temperature, max_tokens, response_format)
+            )
+            
+            content = response.choices[0].message.content
+            logger.debug(f"Generated completion: {len(content)} characters")
+        
+        except Exception as e:
+            logger.error(f"Error generating completion: {e}")
+            raise
+        
+        await asyncio.to_thread(self._store_completion, cache_key, content, response, cache_if)
+        return content
+    
+    async def analyze_job_offer_async(self, job_description: str) -> Dict[str, Any]:
+        """Version asyncio d'analyze_job_offer"""
+        try:
+            response = await self.generate_completion_async(**self._analysis_request(job_description))
+            
+            analysis = json.loads(response)
+            logger.info("Job offer analyzed successfully")
+            return analysis
+        
+        except Exception as e:
+            logger.error(f"Error analyzing job offer: {e}")
+            return self._empty_analysis()
+    
+    async def optimize_cv_content_async(
+        self,
+        cv_data: Dict[str, Any],
+        job_analysis: Dict[str, Any],
+        target_language: str = "fr"
+    ) -> Dict[str, Any]:
+        """Version asyncio d'optimize_cv_content"""
+        try:
+            response = await self.generate_completion_async(**self._cv_request(cv_data, job_analysis, target_language))
+            
+            optimized_cv = json.loads(response)
+            logger.info(f"CV optimized for language: {target_language}")
+            return optimized_cv
+        
+        except Exception as e:
+            logger.error(f"Error optimizing CV: {e}")
+            return cv_data
+    
+    async def generate_cover_letter_async(
+        self,
+        job_offer: Dict[str, Any],
+        cv_data: Dict[str, Any],
+        reference_letter: str,
+        target_language: str = "fr"
+    ) -> str:
+        """Version asyncio de generate_cover_letter"""
+        try:
+            cover_letter = await self.generate_completion_async(
+                **self._cover_letter_request(job_offer, cv_data, reference_letter, target_language)
+            )
+            
+            logger.info(f"Cover letter generated for {job_offer.get('company')}")
+            return cover_letter.strip()
+        
+        except Exception as e:
+            logger.error(f"Error generating cover letter: {e}")
+            return ""
@@ -1,11 +1,36 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from selenium import webdriver
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Set, Tuple
+import requests
 from loguru import logger
 
 from utils.models import JobOffer
-from utils.web_utils import setup_selenium_driver, sleep_random
-from config import HEADLESS_BROWSER, CHROME_PROFILE_DIR
+from utils.web_utils import wait_for_content
+from utils.driver_pool import get_driver_pool
+from utils.fetch_engine import AsyncFetchEngine, get_host
+from utils.http_session import get_session_pool
+from utils.rate_limiter import get_rate_limiter
+from utils.resilience import get_resilience, is_retryable
+from utils.response_cache import get_response_cache, make_cache_key
+from utils.streaming import BoundedStream, aiterate
+from .watermarks import HighWaterMarkStore
+from .query_planner import QueryPlanner, SearchQuery, build_search_queries
+from config import (
+    SCRAPING_MAX_CONCURRENCY_PER_HOST,
+    HTTP_TIMEOUT,
+    HTTP_CONNECT_TIMEOUT,
+    INCREMENTAL_SCRAPING,
+    WATERMARK_STOP_AFTER,
+    SCRAPING_MAX_PAGES,
+    SCRAPER_TRANSPORT_MODE,
+    STREAM_QUEUE_SIZE
+)
+
+if TYPE_CHECKING:
+    from selenium import webdriver
 
 
 class BaseScraper(ABC):
@@ -21,28 +46,700 @@ class BaseScraper(ABC):
         """
         self.name = name
         self.use_selenium = use_selenium
-        self.driver: Optional[webdriver.Chrome] = None
+        self.driver: Optional["webdriver.Chrome"] = None
+        self.pages_loaded = 0
+        self.fetch_engine = AsyncFetchEngine(max_concurrency_per_host=SCRAPING_MAX_CONCURRENCY_PER_HOST)
+        self.session_pool = get_session_pool()
+        # En enregistrement/rejeu de fixtures, chaque page doit réellement passer par le
+        # transport: pas de cache disque ni de scraping incrémental (et pas de rate limiting en rejeu)
+        offline_transport = SCRAPER_TRANSPORT_MODE in ("record", "replay")
+        self.rate_limiter = get_rate_limiter() if SCRAPER_TRANSPORT_MODE != "replay" else None
+        self.resilience = get_resilience()
+        self.response_cache = get_response_cache() if not offline_transport else None
+        self.watermarks = HighWaterMarkStore() if INCREMENTAL_SCRAPING and not offline_transport else None
+        # Le plan de requêtes reste fixe hors ligne pour correspondre aux fixtures
+        self.query_planner = QueryPlanner() if not offline_transport else None
+        # Offres vues pendant l'exécution courante: job_key -> requête qui l'a parsée
+        self._claimed_keys: Dict[str, str] = {}
+        self._query_keys: Dict[str, Set[str]] = {}
+        self._claims_lock = threading.Lock()
+        # Flux de l'itération en cours (iter_offer_batches), alimenté page par page
+        self._offer_stream: Optional[BoundedStream] = None
+        self.stats = {
+            "pages": 0, "cards": 0, "duplicate_cards": 0, "offers": 0,
+            "fetch_seconds": 0.0, "parse_seconds": 0.0
+        }
+        self._stats_lock = threading.Lock()
         logger.info(f"Initializing {name} scraper")
     
     def setup_driver(self):
-        """Configure le WebDriver Selenium"""
+        """Emprunte un WebDriver Selenium au pool partagé"""
         if self.use_selenium and not self.driver:
-            self.driver = setup_selenium_driver(
-                headless=HEADLESS_BROWSER,
-                user_data_dir=str(CHROME_PROFILE_DIR / self.name)
-            )
+            self.driver = get_driver_pool().acquire()
+            self.pages_loaded = 0
             logger.info(f"WebDriver setup for {self.name}")
     
     def close_driver(self):
-        """Ferme le WebDriver proprement"""
+        """Rend le WebDriver au pool (nettoyé, ou recyclé après DRIVER_MAX_PAGES pages)"""
         if self.driver:
             try:
-                self.driver.quit()
+                get_driver_pool().release(self.driver, pages=self.pages_loaded)
                 self.driver = None
-                logger.info(f"WebDriver closed for {self.name}")
+                logger.info(f"WebDriver released for {self.name}")
             except Exception as e:
                 logger.error(f"Error closing WebDriver: {e}")
     
+    def load_page(self, url: str, item_selector: Optional[str] = None, min_items: Optional[int] = None):
+        """
+        Charge une page dans le WebDriver (comptabilisée pour le recyclage du navigateur)
+        et attend que son contenu dynamique soit chargé
+        
+        Args:
+            url: URL à charger
+            item_selector: Sélecteur CSS des éléments attendus (cartes d'offres)
+            min_items: Nombre d'éléments à attendre (sinon: page stable)
+        """
+        self.driver.get(url)
+        self.pages_loaded += 1
+        wait_for_content(self.driver, item_selector, min_items)
+    
+    def fetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        """
+        Effectue une requête GET via la session keep-alive de l'hôte
+        
+        Le débit est limité par hôte (token bucket partagé entre scrapers) et les
+        échecs transitoires sont retentés avec backoff (circuit breaker par hôte).
+        Les réponses sont mises en cache sur disque: une entrée fraîche est servie
+        sans requête, une entrée expirée est revalidée par GET conditionnel.
+        
+        Args:
+            url: URL à récupérer
+            params: Paramètres de la query string
+            headers: En-têtes HTTP
+        
+        Returns:
+            Réponse HTTP (raise_for_status déjà appliqué), avec les attributs
+            from_cache et cache_key
+        """
+        headers = dict(headers or {})
+        cache_key = make_cache_key(url, params)
+        entry = self.response_cache.get(cache_key) if self.response_cache else None
+        
+        if entry and self.response_cache.is_fresh(entry):
+            self.response_cache.record_hit()
+            return self.response_cache.to_response(entry)
+        
+        if entry:
+            headers.update(self.response_cache.conditional_headers(entry))
+        
+        response = self._send_with_retries(url, params, headers)
+        
+        if response.status_code == 304 and entry:
+            logger.debug(f"Not modified: {url}")
+            self.response_cache.touch(cache_key)
+            self.response_cache.record_hit(revalidated=True)
+            return self.response_cache.to_response(entry)
+        
+        response.raise_for_status()
+        response.from_cache = False
+        response.cache_key = cache_key
+        
+        if self.response_cache:
+            self.response_cache.record_miss()
+            if response.status_code == 200:
+                self.response_cache.store(cache_key, response)
+        
+        return response
+    
+    def _send_with_retries(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str]
+    ) -> requests.Response:
+        """
+        Envoie la requête en retentant les échecs transitoires (429, 5xx, timeouts, connexion)
+        
+        Chaque tentative passe par le circuit breaker de l'hôte: un hôte hors service
+        échoue immédiatement (CircuitOpenError) au lieu de coûter un timeout par requête.
+        
+        Args:
+            url: URL à récupérer
+            params: Paramètres de la query string
+            headers: En-têtes HTTP
+        
+        Returns:
+            Dernière réponse reçue (éventuellement en erreur si les retries sont épuisés)
+        """
+        host = get_host(url)
+        session = self.session_pool.get_session(host)
+        attempt = 0
+        
+        while True:
+            self.resilience.check(host)
+            if self.rate_limiter:
+                self.rate_limiter.acquire(host)
+            
+            try:
+                response = session.get(url, params=params, headers=headers, timeout=(HTTP_CONNECT_TIMEOUT, HTTP_TIMEOUT))
+            except requests.RequestException as e:
+                if not is_retryable(error=e):
+                    raise
+                self.resilience.record_failure(host)
+                if not self.resilience.wait_before_retry(host, attempt):
+                    raise
+                logger.warning(f"{type(e).__name__} fetching {url}, retrying")
+                attempt += 1
+                continue
+            
+            if not is_retryable(response=response):
+                self.resilience.record_success(host)
+                return response
+            
+            # Un 429 signale un débit trop élevé, pas un hôte hors service: l'hôte répond,
+            # ce qui termine aussi une éventuelle requête d'essai du circuit semi-ouvert
+            if response.status_code == 429:
+                self.resilience.record_success(host)
+            else:
+                self.resilience.record_failure(host)
+            if not self.resilience.wait_before_retry(host, attempt, response):
+                return response
+            logger.warning(f"HTTP {response.status_code} fetching {url}, retrying")
+            attempt += 1
+    
+    def add_stats(self, **values: float):
+        """Incrémente les compteurs de performance du scraper (pages, cards, duplicate_cards, offers, fetch/parse_seconds)"""
+        with self._stats_lock:
+            for name, value in values.items():
+                self.stats[name] += value
+    
+    def get_stats(self) -> Dict[str, float]:
+        """Retourne une copie des compteurs de performance"""
+        with self._stats_lock:
+            return dict(self.stats)
+    
+    def reset_stats(self):
+        """Remet à zéro les compteurs de performance"""
+        with self._stats_lock:
+            for name in self.stats:
+                self.stats[name] = 0
+    
+    def get_cached_offers(self, response: requests.Response) -> Optional[List[JobOffer]]:
+        """
+        Retourne les offres déjà parsées pour une page servie depuis le cache
+        
+        Args:
+            response: Réponse retournée par fetch()
+        
+        Returns:
+            Liste d'offres si la page est inchangée et déjà parsée, None sinon
+        """
+        if not self.response_cache or not getattr(response, "from_cache", False):
+            return None
+        
+        cached = self.response_cache.get_parsed(response.cache_key)
+        if cached is None:
+            return None
+        
+        logger.debug(f"Reusing {len(cached)} parsed offers for unchanged page {response.url}")
+        return [JobOffer(**data) for data in cached]
+    
+    def cache_parsed_offers(self, response: requests.Response, offers: List[JobOffer]):
+        """
+        Mémorise les offres parsées d'une page pour les prochaines exécutions
+        
+        Args:
+            response: Réponse retournée par fetch()
+            offers: Toutes les offres extraites de la page (avant high-water mark,
+                déduplication entre requêtes et max_results)
+        """
+        if self.response_cache and getattr(response, "cache_key", None):
+            self.response_cache.set_parsed(
+                response.cache_key,
+                [offer.model_dump(mode="json") for offer in offers]
+            )
+    
+    def watermark_key(self, query: SearchQuery) -> str:
+        """
+        Identifiant de la high-water mark d'une requête
+        
+        Les scrapers dont les high-water marks précèdent le plan de recherches
+        redéfinissent cette méthode pour garder leur ancien format de clé.
+        
+        Args:
+            query: Recherche planifiée
+        
+        Returns:
+            Clé de la ligne scrape_watermarks
+        """
+        return query.key
+    
+    def get_watermark(self, query_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Récupère la high-water mark d'une requête (None si scraping incrémental désactivé)
+        
+        Args:
+            query_key: Identifiant de la requête
+        
+        Returns:
+            Dictionnaire {newest_posted_at, seen_keys, updated_at} ou None
+        """
+        if not self.watermarks:
+            return None
+        return self.watermarks.get(self.name, query_key)
+    
+    def save_watermark(self, query_key: str, offers: List[JobOffer]):
+        """Avance la high-water mark d'une requête avec les offres vues"""
+        if self.watermarks:
+            self.watermarks.update(self.name, query_key, offers)
+    
+    def get_date_window(self, watermark: Optional[Dict[str, Any]], max_days: int = 7) -> int:
+        """
+        Calcule la fenêtre de fraîcheur (en jours) à demander au job board
+        
+        Args:
+            watermark: High-water mark de la requête
+            max_days: Fenêtre maximale (première exécution)
+        
+        Returns:
+            Nombre de jours parmi 1, 3 ou max_days couvrant la période depuis la dernière exécution
+        """
+        if not watermark:
+            return max_days
+        
+        elapsed_days = (datetime.now() - watermark["updated_at"]).days + 1
+        for window in (1, 3):
+            if elapsed_days <= window < max_days:
+                return window
+        return max_days
+    
+    def is_already_seen(
+        self,
+        watermark: Optional[Dict[str, Any]],
+        job_key: Optional[str],
+        posted_date: Optional[datetime] = None
+    ) -> bool:
+        """
+        Indique si une offre se trouve derrière la high-water mark
+        
+        Args:
+            watermark: High-water mark de la requête
+            job_key: Identifiant de l'offre chez la source
+            posted_date: Date de publication si connue
+        
+        Returns:
+            True si l'offre a déjà été vue lors d'une exécution précédente
+        """
+        if not watermark:
+            return False
+        
+        if job_key and job_key in watermark["seen_keys"]:
+            return True
+        
+        newest = watermark["newest_posted_at"]
+        return bool(newest and posted_date and posted_date.date() < newest.date())
+    
+    def extract_job_key(self, element) -> Optional[str]:
+        """
+        Extrait l'identifiant d'une carte sans la parser entièrement
+        
+        Args:
+            element: Element HTML de la carte
+        
+        Returns:
+            Identifiant de l'offre ou None (à surcharger par les scrapers)
+        """
+        return None
+    
+    def plan_queries(self) -> List[SearchQuery]:
+        """
+        Démarre une exécution: construit le plan de recherches (DOMAIN_KEYWORDS × LOCATION_KEYWORDS)
+        et réinitialise les offres déjà réclamées par les requêtes
+        
+        Returns:
+            Recherches à exécuter, les plus productives d'abord
+        """
+        with self._claims_lock:
+            self._claimed_keys = {}
+            self._query_keys = {}
+        
+        candidates = build_search_queries()
+        if not self.query_planner:
+            return candidates
+        return self.query_planner.plan(self.name, candidates)
+    
+    def record_query_results(self, plan: List[SearchQuery]):
+        """Enregistre le rendement et le recouvrement des requêtes de l'exécution"""
+        if self.query_planner:
+            with self._claims_lock:
+                query_keys = {key: set(keys) for key, keys in self._query_keys.items()}
+            self.query_planner.record_run(self.name, plan, query_keys, build_search_queries())
+    
+    def claim_card(self, job_key: Optional[str], query_key: Optional[str]) -> bool:
+        """
+        Réclame une offre pour une requête de l'exécution courante
+        
+        Les requêtes d'une source se recouvrent: seule la première requête qui
+        rencontre une offre la parse, les suivantes l'ignorent avant parsing.
+        
+        Args:
+            job_key: Identifiant de l'offre chez la source
+            query_key: Identifiant de la requête (None: pas de déduplication)
+        
+        Returns:
+            True si l'offre doit être parsée par cette requête
+        """
+        if not job_key or not query_key:
+            return True
+        
+        with self._claims_lock:
+            self._query_keys.setdefault(query_key, set()).add(job_key)
+            owner = self._claimed_keys.setdefault(job_key, query_key)
+        return owner == query_key
+    
+    def parse_page_cards(
+        self,
+        response: requests.Response,
+        cards: List[Any],
+        watermark: Optional[Dict[str, Any]],
+        max_results: int,
+        query_key: Optional[str] = None
+    ) -> Tuple[List[JobOffer], bool]:
+        """
+        Parse les cartes d'une page téléchargée et retient les offres nouvelles
+        
+        Si la page peut être resservie par le cache HTTP, toutes ses cartes sont
+        parsées et mémorisées telles quelles (la high-water mark, les autres requêtes
+        et max_results ne filtrent qu'ensuite, comme pour une page servie depuis le
+        cache); sinon les cartes déjà vues sont ignorées avant parsing.
+        
+        Args:
+            response: Réponse retournée par fetch()
+            cards: Cartes d'offres dans l'ordre de la page
+            watermark: High-water mark de la requête
+            max_results: Nombre maximum d'offres à retourner
+            query_key: Identifiant de la requête (déduplication entre requêtes)
+        
+        Returns:
+            Tuple (offres nouvelles, True si la zone déjà vue a été atteinte)
+        """
+        if not self.response_cache or not getattr(response, "cache_key", None):
+            return self.parse_new_cards(cards, watermark, max_results, query_key)
+        
+        self.add_stats(cards=len(cards))
+        offers = [offer for offer in map(self.parse_job_offer, cards) if offer]
+        self.cache_parsed_offers(response, offers)
+        return self.select_new_offers(offers, watermark, max_results, query_key)
+    
+    def parse_new_cards(
+        self,
+        cards: List[Any],
+        watermark: Optional[Dict[str, Any]],
+        max_results: int,
+        query_key: Optional[str] = None
+    ) -> Tuple[List[JobOffer], bool]:
+        """
+        Parse les cartes d'une page triée par date jusqu'à la zone déjà vue
+        
+        Les cartes déjà vues (lors d'une exécution précédente ou par une autre
+        requête de l'exécution) sont ignorées avant parsing; après WATERMARK_STOP_AFTER
+        cartes déjà vues consécutives (les offres sponsorisées peuvent être anciennes),
+        le reste de la page est abandonné.
+        
+        Args:
+            cards: Cartes d'offres dans l'ordre de la page
+            watermark: High-water mark de la requête
+            max_results: Nombre maximum d'offres à retourner
+            query_key: Identifiant de la requête (déduplication entre requêtes)
+        
+        Returns:
+            Tuple (offres nouvelles, True si la zone déjà vue a été atteinte)
+        """
+        self.add_stats(cards=len(cards))
+        return self._select_new(cards, self.extract_job_key, self.parse_job_offer, watermark, max_results, query_key)
+    
+    def select_new_offers(
+        self,
+        offers: List[JobOffer],
+        watermark: Optional[Dict[str, Any]],
+        max_results: int,
+        query_key: Optional[str] = None
+    ) -> Tuple[List[JobOffer], bool]:
+        """
+        Retient les offres nouvelles d'une page déjà parsée (page servie depuis le cache)
+        
+        Même règle d'arrêt que parse_new_cards: la pagination d'une page ne dépend
+        pas du cache.
+        
+        Args:
+            offers: Toutes les offres de la page, dans l'ordre de la page
+            watermark: High-water mark de la requête
+            max_results: Nombre maximum d'offres à retourner
+            query_key: Identifiant de la requête (déduplication entre requêtes)
+        
+        Returns:
+            Tuple (offres nouvelles, True si la zone déjà vue a été atteinte)
+        """
+        return self._select_new(offers, lambda offer: offer.job_key, lambda offer: offer, watermark, max_results, query_key)
+    
+    def _select_new(
+        self,
+        items: List[Any],
+        get_job_key: Callable[[Any], Optional[str]],
+        parse: Callable[[Any], Optional[JobOffer]],
+        watermark: Optional[Dict[str, Any]],
+        max_results: int,
+        query_key: Optional[str]
+    ) -> Tuple[List[JobOffer], bool]:
+        """Parcourt les cartes (ou offres) d'une page jusqu'à la zone déjà vue (voir parse_new_cards)"""
+        offers = []
+        consecutive_seen = 0
+        
+        for item in items:
+            if len(offers) >= max_results:
+                break
+            
+            job_key = get_job_key(item)
+            if self.is_already_seen(watermark, job_key):
+                consecutive_seen += 1
+            elif not self.claim_card(job_key, query_key):
+                # Déjà parsée par une autre requête de cette exécution
+                self.add_stats(duplicate_cards=1)
+            else:
+                offer = parse(item)
+                if not offer:
+                    continue
+                if self.is_already_seen(watermark, offer.job_key, offer.posted_date):
+                    consecutive_seen += 1
+                elif not job_key and not self.claim_card(offer.job_key, query_key):
+                    self.add_stats(duplicate_cards=1)
+                else:
+                    consecutive_seen = 0
+                    offers.append(offer)
+            
+            if consecutive_seen >= WATERMARK_STOP_AFTER:
+                logger.debug(f"{self.name}: reached already-seen offers, stopping")
+                return offers, True
+        
+        return offers, False
+    
+    def paginate(
+        self,
+        fetch_page: Callable[[int], requests.Response],
+        parse_page: Callable[[requests.Response, int], Tuple[List[JobOffer], bool]],
+        max_results: int,
+        max_pages: int = SCRAPING_MAX_PAGES
+    ) -> List[JobOffer]:
+        """
+        Parcourt les pages de résultats d'une requête avec préchargement
+        
+        La page N+1 est téléchargée pendant le parsing de la page N. Le parcours
+        s'arrête dès que max_results est atteint, que parse_page signale la fin
+        (page vide, zone déjà vue) ou qu'un téléchargement échoue.
+        
+        Args:
+            fetch_page: Télécharge la page d'index donné (0 = première page)
+            parse_page: Parse une réponse, reçoit le nombre d'offres encore attendues,
+                retourne (offres, True s'il faut s'arrêter)
+            max_results: Nombre maximum d'offres à retourner
+            max_pages: Nombre maximum de pages à parcourir
+        
+        Returns:
+            Offres de toutes les pages parcourues (sans doublons de job_key),
+            également transmises page par page à iter_offer_batches()
+        """
+        offers = []
+        seen_keys = set()
+        executor = ThreadPoolExecutor(max_workers=1)
+        
+        def timed_fetch(page: int) -> requests.Response:
+            start = time.perf_counter()
+            try:
+                return fetch_page(page)
+            finally:
+                self.add_stats(fetch_seconds=time.perf_counter() - start)
+        
+        try:
+            future = executor.submit(timed_fetch, 0)
+            
+            for page in range(max_pages):
+                try:
+                    response = future.result()
+                except Exception as e:
+                    logger.error(f"{self.name}: error fetching results page {page + 1}: {e}")
+                    break
+                
+                # Préchargement de la page suivante pendant le parsing
+                future = executor.submit(timed_fetch, page + 1) if page + 1 < max_pages else None
+                
+                start = time.perf_counter()
+                page_offers, stop = parse_page(response, max_results - len(offers))
+                self.add_stats(pages=1, offers=len(page_offers), parse_seconds=time.perf_counter() - start)
+                new_offers = []
+                for offer in page_offers:
+                    if offer.job_key and offer.job_key in seen_keys:
+                        continue
+                    seen_keys.add(offer.job_key)
+                    new_offers.append(offer)
+                new_offers = new_offers[:max_results - len(offers)]
+                offers.extend(new_offers)
+                
+                # Transmettre la page au pipeline sans attendre la fin du scraping
+                if not self.emit_offers(new_offers):
+                    logger.debug(f"{self.name}: offer stream closed, stopping pagination")
+                    break
+                
+                if stop or len(offers) >= max_results:
+                    break
+        finally:
+            # Abandonner un préchargement devenu inutile
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return offers[:max_results]
+    
+    def run_queries(self, func: Callable[..., Any], args_list: List[tuple]) -> List[Any]:
+        """
+        Exécute une fonction de scraping pour chaque jeu d'arguments, en parallèle
+        
+        La concurrence est plafonnée par hôte (SCRAPING_MAX_CONCURRENCY_PER_HOST)
+        et le débit est régulé par le rate limiter de fetch().
+        
+        Args:
+            func: Fonction bloquante à exécuter (ex: _scrape_search_page)
+            args_list: Liste des arguments, un tuple par appel
+        
+        Returns:
+            Résultats dans l'ordre de args_list (l'exception levée si un appel échoue)
+        """
+        host = get_host(getattr(self, "base_url", "")) or self.name
+        return self.fetch_engine.run([(host, func, args) for args in args_list])
+    
+    def get_detail_url(self, offer: JobOffer) -> Optional[str]:
+        """
+        Retourne l'URL de la page de détail d'une offre
+        
+        Args:
+            offer: Offre scrapée
+        
+        Returns:
+            URL à télécharger pour l'enrichissement (None pour ne pas enrichir)
+        """
+        return offer.url
+    
+    def parse_job_detail(self, content: bytes) -> Dict[str, str]:
+        """
+        Extrait les champs d'une page de détail
+        
+        Args:
+            content: Corps HTML de la page de détail
+        
+        Returns:
+            Dictionnaire {description, requirements, contract_type, application_email}
+            (vide si non supporté: à surcharger par les scrapers)
+        """
+        return {}
+    
+    def emit_offers(self, offers: List[JobOffer]) -> bool:
+        """
+        Transmet des offres au flux de l'itération en cours
+        
+        Args:
+            offers: Offres d'une page de résultats
+        
+        Returns:
+            False si le consommateur s'est arrêté (le scraping peut s'interrompre)
+        """
+        stream = self._offer_stream
+        if stream is None or not offers:
+            return True
+        return stream.put(offers)
+    
+    def iter_offer_batches(self, max_offers: int = 50, queue_size: int = STREAM_QUEUE_SIZE) -> Iterator[List[JobOffer]]:
+        """
+        Itère sur les offres page par page, pendant le scraping
+        
+        scrape() tourne dans un thread et chaque page parsée par paginate() est
+        transmise dès qu'elle est prête. Le scraping se met en pause tant que
+        queue_size pages attendent d'être consommées, et s'arrête si l'itération
+        est interrompue. Les offres retournées par scrape() sans passer par
+        paginate() sont transmises à la fin.
+        
+        Args:
+            max_offers: Nombre maximum d'offres
+            queue_size: Pages en attente maximum (contre-pression)
+        
+        Yields:
+            Listes d'offres (une par page de résultats)
+        """
+        stream: BoundedStream = BoundedStream(maxsize=queue_size)
+        outcome: Dict[str, Any] = {}
+        
+        def produce():
+            try:
+                outcome["offers"] = self.scrape(max_offers=max_offers)
+            except Exception as e:
+                outcome["error"] = e
+            finally:
+                stream.finish()
+        
+        self._offer_stream = stream
+        thread = threading.Thread(target=produce, name=f"{self.name}-scrape", daemon=True)
+        thread.start()
+        
+        emitted = set()
+        try:
+            for batch in stream:
+                batch = [offer for offer in batch if offer.id not in emitted][:max_offers - len(emitted)]
+                emitted.update(offer.id for offer in batch)
+                if batch:
+                    yield batch
+                if len(emitted) >= max_offers:
+                    return
+            
+            thread.join()
+            if "error" in outcome:
+                raise outcome["error"]
+            
+            remaining = [offer for offer in outcome.get("offers", []) if offer.id not in emitted]
+            remaining = remaining[:max_offers - len(emitted)]
+            if remaining:
+                yield remaining
+        finally:
+            stream.close()
+            thread.join()
+            self._offer_stream = None
+    
+    def iter_offers(self, max_offers: int = 50) -> Iterator[JobOffer]:
+        """
+        Itère sur les offres au fil du scraping (voir iter_offer_batches)
+        
+        Args:
+            max_offers: Nombre maximum d'offres
+        
+        Yields:
+            Offres d'emploi
+        """
+        for batch in self.iter_offer_batches(max_offers):
+            yield from batch
+    
+    async def aiter_offers(self, max_offers: int = 50) -> AsyncIterator[JobOffer]:
+        """
+        Version asynchrone de iter_offers, utilisable depuis une boucle asyncio
+        
+        Args:
+            max_offers: Nombre maximum d'offres
+        
+        Yields:
+            Offres d'emploi
+        """
+        async for offer in aiterate(self.iter_offers(max_offers)):
+            yield offer
+    
     @abstractmethod
     def scrape(self, max_offers: int = 50) -> List[JobOffer]:
         """
@@ -0,0 +1,228 @@
+import re
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from utils.models import JobOffer
+from utils.ai_helper import AIHelper
+from .keyword_matcher import KeywordMatcher
+from .domain_classifier import DomainClassifier
+from .language_detector import get_language_detector
+from config import (
+    DATABASE_PATH,
+    LOCATION_KEYWORDS,
+    CONTRACT_TYPES,
+    EXCLUDE_KEYWORDS,
+    DOMAIN_TITLE_KEYWORDS,
+    DOMAIN_MODEL_ENABLED,
+    DOMAIN_BATCH_SIZE,
+    DOMAIN_BATCH_MAX_TOKENS,
+    FILTER_WORKERS,
+    OPENAI_API_KEY
+)
+
+
+# Règles dans l'ordre d'application (JobFilter.accept_offer les réordonne selon leur coût mesuré)
+RULES = ["location", "contract_type", "exclusions", "domain", "language"]
+
+# En dessous, la détection de langue reste dans le processus courant (démarrage du pool
+# et chargement des profils dans chaque processus plus coûteux que la détection)
+MIN_OFFERS_PER_PROCESS = 2000
+
+
+def _detect_language(text: str) -> str:
+    """Détecte la langue d'un texte (exécuté dans les processus du pool)"""
+    return get_language_detector().detect(text)
+
+
+class BatchFilter:
+    """
+    Filtrage en masse d'offres (rejeu de l'historique job_offers)
+    
+    Mêmes critères que JobFilter, appliqués colonne par colonne sur un DataFrame
+    plutôt qu'offre par offre; la détection de langue, seule étape coûteuse par
+    offre, est répartie sur un pool de processus.
+    """
+    
+    def __init__(self, use_ai: bool = True, workers: int = FILTER_WORKERS):
+        """
+        Initialise le filtre
+        
+        Args:
+            use_ai: Consulter l'IA pour le domaine des offres ambiguës (sinon: mots-clés de la description)
+            workers: Nombre de processus pour la détection de langue
+        """
+        self.workers = workers
+        self.location_matcher = KeywordMatcher(LOCATION_KEYWORDS)
+        self.exclude_matcher = KeywordMatcher(EXCLUDE_KEYWORDS)
+        self.domain_matcher = KeywordMatcher(DOMAIN_TITLE_KEYWORDS)
+        self.domain_classifier = DomainClassifier() if DOMAIN_MODEL_ENABLED else None
+        self.ai_helper = AIHelper(api_key=OPENAI_API_KEY) if use_ai else None
+    
+    @staticmethod
+    def load_backlog(db_path: Path = DATABASE_PATH, limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Charge les offres archivées de la table job_offers
+        
+        Args:
+            db_path: Base SQLite (applications.db par défaut)
+            limit: Nombre maximum d'offres (les plus récentes)
+        
+        Returns:
+            DataFrame des offres
+        """
+        query = "SELECT * FROM job_offers ORDER BY scraped_at DESC"
+        if limit:
+            query += f" LIMIT {int(limit)}"
+        
+        conn = sqlite3.connect(db_path, timeout=30)
+        frame = pd.read_sql_query(query, conn)
+        conn.close()
+        return frame
+    
+    @staticmethod
+    def to_frame(offers: List[JobOffer]) -> pd.DataFrame:
+        """Convertit des offres en DataFrame (une colonne par champ)"""
+        return pd.DataFrame([offer.model_dump() for offer in offers])
+    
+    def _contains(self, column: pd.Series, matcher: KeywordMatcher) -> np.ndarray:
+        """
+        Masque des valeurs contenant un mot-clé du matcher
+        
+        La recherche par ancres du matcher (str.find) est plus rapide qu'un
+        str.contains pandas sur l'alternative de tous les motifs.
+        """
+        values = column.fillna("").tolist()
+        return np.fromiter((matcher.search(value) is not None for value in values), dtype=bool, count=len(values))
+    
+    def _check_domain(self, frame: pd.DataFrame) -> np.ndarray:
+        """Domaine: mots-clés de titre, puis classifieur local, puis IA groupée (ou mots-clés de la description)"""
+        relevant = self._contains(frame["title"], self.domain_matcher)
+        pending = []
+        
+        for position in np.flatnonzero(~relevant):
+            if self.domain_classifier:
+                verdict = self.domain_classifier.classify(frame["title"].iat[position], frame["description"].iat[position] or "")
+                if verdict is not None:
+                    relevant[position] = verdict
+                    continue
+            pending.append(position)
+        
+        if not pending:
+            return relevant
+        
+        verdicts: List[Optional[bool]] = [None] * len(pending)
+        if self.ai_helper:
+            try:
+                verdicts = self.ai_helper.detect_job_domains(
+                    [(frame["title"].iat[position], frame["description"].iat[position] or "") for position in pending],
+                    max_prompt_tokens=DOMAIN_BATCH_MAX_TOKENS,
+                    max_batch_size=DOMAIN_BATCH_SIZE
+                )
+            except Exception as e:
+                logger.error(f"Error in batch AI domain detection: {e}")
+        
+        # Sans verdict de l'IA: même repli que JobFilter.check_domain (mots-clés dans la description)
+        fallback = self._contains(frame["description"].iloc[pending], self.domain_matcher)
+        for index, position in enumerate(pending):
+            relevant[position] = verdicts[index] if verdicts[index] is not None else fallback[index]
+        return relevant
+    
+    def _detect_languages(self, texts: List[str]) -> List[str]:
+        """Détecte la langue de chaque texte, en parallèle au-delà de MIN_OFFERS_PER_PROCESS textes"""
+        if self.workers <= 1 or len(texts) < MIN_OFFERS_PER_PROCESS:
+            return [_detect_language(text) for text in texts]
+        
+        chunksize = max(1, len(texts) // (self.workers * 4))
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(_detect_language, texts, chunksize=chunksize))
+    
+    def filter_frame(self, frame: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int]]:
+        """
+        Applique tous les critères à un DataFrame d'offres
+        
+        Chaque règle n'est évaluée que sur les offres ayant passé les précédentes.
+        
+        Args:
+            frame: Offres (colonnes title, location, contract_type, description...)
+        
+        Returns:
+            (DataFrame complété des colonnes rejected_by (règle ayant rejeté l'offre, "" si acceptée)
+            et language (None si l'offre a été rejetée avant la détection), nombre d'offres rejetées par règle)
+        """
+        frame = frame.reset_index(drop=True).copy()
+        rejected_by = np.full(len(frame), "", dtype=object)
+        languages = np.full(len(frame), None, dtype=object)
+        
+        def reject(rule: str, alive: np.ndarray, passed: np.ndarray):
+            positions = np.flatnonzero(alive)
+            rejected_by[positions[~passed]] = rule
+        
+        # Lieu
+        alive = np.ones(len(frame), dtype=bool)
+        reject("location", alive, self._contains(frame["location"], self.location_matcher))
+        
+        # Contrat ("Non spécifié" accepté, à vérifier manuellement)
+        alive = rejected_by == ""
+        contracts = frame["contract_type"].fillna("").str.upper()[alive]
+        pattern = "|".join(re.escape(contract_type) for contract_type in CONTRACT_TYPES) or r"(?!)"
+        reject("contract_type", alive, ((contracts == "NON SPÉCIFIÉ") | contracts.str.contains(pattern, regex=True)).to_numpy(dtype=bool))
+        
+        # Exclusions (titre et description)
+        alive = rejected_by == ""
+        subset = frame[alive]
+        excluded = self._contains(subset["title"], self.exclude_matcher) | self._contains(subset["description"], self.exclude_matcher)
+        reject("exclusions", alive, ~excluded)
+        
+        # Domaine
+        alive = rejected_by == ""
+        reject("domain", alive, self._check_domain(frame[alive]))
+        
+        # Langue (français et anglais)
+        alive = rejected_by == ""
+        subset = frame[alive]
+        texts = (subset["title"].fillna("") + " " + subset["description"].fillna("")).tolist()
+        detected = np.array(self._detect_languages(texts), dtype=object)
+        languages[alive] = detected
+        reject("language", alive, np.isin(detected, ["fr", "en"]))
+        
+        frame["rejected_by"] = rejected_by
+        frame["language"] = languages
+        breakdown = {rule: int((rejected_by == rule).sum()) for rule in RULES}
+        return frame, breakdown
+    
+    def filter_offers(self, offers: List[JobOffer]) -> Tuple[List[JobOffer], Dict[str, int]]:
+        """
+        Filtre une liste d'offres en mode colonne
+        
+        Args:
+            offers: Offres à filtrer
+        
+        Returns:
+            (offres acceptées avec leur langue, nombre d'offres rejetées par règle)
+        """
+        if not offers:
+            return [], {rule: 0 for rule in RULES}
+        
+        frame, breakdown = self.filter_frame(self.to_frame(offers))
+        accepted = []
+        for offer, rejected, language in zip(offers, frame["rejected_by"], frame["language"]):
+            if not rejected:
+                offer.language = language
+                accepted.append(offer)
+        
+        self.log_breakdown(len(offers), breakdown)
+        return accepted, breakdown
+    
+    @staticmethod
+    def log_breakdown(total: int, breakdown: Dict[str, int]):
+        """Écrit le nombre d'offres rejetées par règle dans les logs"""
+        accepted = total - sum(breakdown.values())
+        logger.info(
+            f"Batch filter: {accepted}/{total} offers accepted, rejected by "
+            + ", ".join(f"{rule} {count}" for rule, count in breakdown.items())
+        )
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Benchmark des vérifications par mots-clés de JobFilter sur des offres synthétiques
+Compare l'ancienne recherche (boucles de sous-chaînes `in` sur le texte en minuscules)
+aux KeywordMatcher compilés (une passe par champ, mots entiers, sans accents)
+
+Usage:
+    python bench_filter.py [--offers 100000] [--seed 42]
+
+Seules les vérifications locales sont mesurées (lieu, exclusions, mots-clés de titre):
+la classification du domaine par l'IA n'est pas appelée.
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+# Ajouter le répertoire au path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from filters.keyword_matcher import KeywordMatcher
+from config import LOCATION_KEYWORDS, EXCLUDE_KEYWORDS, DOMAIN_TITLE_KEYWORDS
+
+
+TITLES = [
+    "Chargé de communication", "Chargée de communication digitale", "Event Manager",
+    "Responsable événementiel", "Chef de projet événementielle", "Assistant marketing",
+    "Stage - Communication interne", "Alternance chargé(e) de communication",
+    "Développeur Python", "Comptable fournisseurs", "Attaché de presse / RP",
+    "Commercial terrain", "Internship Marketing", "Coordinatrice d'événements",
+    "Responsable entrepôt", "Project Manager Communication", "Technicien de maintenance"
+]
+LOCATIONS = [
+    "Lyon", "Lyon 3e", "69003 Lyon", "Villeurbanne", "Paris 11e", "Télétravail",
+    "Full Remote", "Marseille", "Grenoble", "Lyon (hybride)", "Bordeaux", "Distanciel"
+]
+SENTENCES = [
+    "Vous piloterez la communication interne et externe de l'entreprise.",
+    "Organisation des événements clients et des salons professionnels.",
+    "Rattaché(e) au directeur marketing, vous gérez les réseaux sociaux.",
+    "Une première expérience en agence est un plus.",
+    "Le poste est basé dans nos locaux, avec deux jours de télétravail.",
+    "Vous serez en charge des relations presse et des partenariats.",
+    "Maîtrise de la suite Adobe et des outils d'emailing.",
+    "Entreprise internationale en forte croissance.",
+    "Possibilité d'évolution rapide au sein du groupe.",
+    "Contrat en apprentissage possible pour les profils juniors."
+]
+
+
+def build_offers(count: int, seed: int) -> List[Tuple[str, str, str]]:
+    """Génère `count` offres synthétiques (titre, lieu, description)"""
+    rng = random.Random(seed)
+    return [
+        (
+            rng.choice(TITLES),
+            rng.choice(LOCATIONS),
+            " ".join(rng.choice(SENTENCES) for _ in range(rng.randint(3, 8)))
+        )
+        for _ in range(count)
+    ]
+
+
+# Ancienne liste codée en dur dans JobFilter.check_domain (recréée à chaque offre)
+def legacy_check(title: str, location: str, description: str) -> Optional[bool]:
+    """Ancienne logique: lieu, exclusions et mots-clés de titre par sous-chaînes"""
+    location_lower = location.lower()
+    if not any(keyword in location_lower for keyword in LOCATION_KEYWORDS):
+        return False
+    
+    full_text = f"{title} {description}".lower()
+    for keyword in EXCLUDE_KEYWORDS:
+        if keyword in full_text:
+            return False
+    
+    domain_keywords = [
+        "communication", "événementiel", "event", "marketing",
+        "chargé de communication", "chargée de communication",
+        "event manager", "project manager", "coordinateur",
+        "coordinatrice", "relations publiques", "rp"
+    ]
+    title_lower = title.lower()
+    for keyword in domain_keywords:
+        if keyword in title_lower:
+            return True
+    return None  # Passerait à la classification IA
+
+
+def compiled_check(matchers: Tuple[KeywordMatcher, KeywordMatcher, KeywordMatcher]) -> Callable[[str, str, str], Optional[bool]]:
+    """Nouvelle logique de JobFilter avec les matchers compilés"""
+    location_matcher, exclude_matcher, domain_matcher = matchers
+    
+    def check(title: str, location: str, description: str) -> Optional[bool]:
+        if not location_matcher.search(location):
+            return False
+        if exclude_matcher.search(title) or exclude_matcher.search(description):
+            return False
+        if domain_matcher.search(title):
+            return True
+        return None
+    
+    return check
+
+
+def check_costs(matchers: Tuple[KeywordMatcher, KeywordMatcher, KeywordMatcher], offers: List[Tuple[str, str, str]]) -> List[Tuple[str, float, float]]:
+    """
+    Mesure chaque vérification séparément sur toutes les offres (même travail pour les deux implémentations)
+    
+    Returns:
+        Liste de (vérification, secondes legacy, secondes compilé)
+    """
+    location_matcher, exclude_matcher, domain_matcher = matchers
+    domain_keywords = list(DOMAIN_TITLE_KEYWORDS)
+    checks = [
+        (
+            "location",
+            lambda offer: any(keyword in offer[1].lower() for keyword in LOCATION_KEYWORDS),
+            lambda offer: location_matcher.search(offer[1])
+        ),
+        (
+            "exclusions",
+            lambda offer: any(keyword in f"{offer[0]} {offer[2]}".lower() for keyword in EXCLUDE_KEYWORDS),
+            lambda offer: exclude_matcher.search(offer[0]) or exclude_matcher.search(offer[2])
+        ),
+        (
+            "domain (title)",
+            lambda offer: any(keyword in offer[0].lower() for keyword in domain_keywords),
+            lambda offer: domain_matcher.search(offer[0])
+        )
+    ]
+    
+    costs = []
+    for name, legacy, compiled in checks:
+        timings = []
+        for check in (legacy, compiled):
+            start = time.perf_counter()
+            for offer in offers:
+                check(offer)
+            timings.append(time.perf_counter() - start)
+        costs.append((name, timings[0], timings[1]))
+    return costs
+
+
+def measure(check: Callable[[str, str, str], Optional[bool]], offers: List[Tuple[str, str, str]]) -> Tuple[float, List[Optional[bool]]]:
+    """Exécute une vérification sur toutes les offres, retourne (secondes, résultats)"""
+    start = time.perf_counter()
+    results = [check(title, location, description) for title, location, description in offers]
+    return time.perf_counter() - start, results
+
+
+def main():
+    """Point d'entrée"""
+    parser = argparse.ArgumentParser(description="Benchmark des filtres par mots-clés")
+    parser.add_argument("--offers", type=int, default=100_000, help="Nombre d'offres synthétiques")
+    parser.add_argument("--seed", type=int, default=42, help="Graine du générateur")
+    args = parser.parse_args()
+    
+    offers = build_offers(args.offers, args.seed)
+    
+    start = time.perf_counter()
+    matchers = (
+        KeywordMatcher(LOCATION_KEYWORDS),
+        KeywordMatcher(EXCLUDE_KEYWORDS),
+        KeywordMatcher(DOMAIN_TITLE_KEYWORDS)
+    )
+    compile_ms = (time.perf_counter() - start) * 1000
+    
+    legacy_seconds, legacy_results = measure(legacy_check, offers)
+    compiled_seconds, compiled_results = measure(compiled_check(matchers), offers)
+    
+    print(f"{len(offers)} synthetic offers (matchers compiled in {compile_ms:.2f} ms)\n")
+    print(f"{'implementation':<16} {'total s':>9} {'µs/offer':>10} {'accepted':>9} {'to AI':>7} {'rejected':>9}")
+    for name, seconds, results in (
+        ("legacy", legacy_seconds, legacy_results),
+        ("compiled", compiled_seconds, compiled_results)
+    ):
+        print(
+            f"{name:<16} {seconds:9.3f} {seconds / len(offers) * 1e6:10.2f} "
+            f"{results.count(True):9d} {results.count(None):7d} {results.count(False):9d}"
+        )
+    
+    print(f"\n{'check':<16} {'legacy µs':>10} {'compiled µs':>12}")
+    for name, legacy, compiled in check_costs(matchers, offers):
+        print(f"{name:<16} {legacy / len(offers) * 1e6:10.2f} {compiled / len(offers) * 1e6:12.2f}")
+    
+    changed = sum(1 for old, new in zip(legacy_results, compiled_results) if old != new)
+    print(f"\nend-to-end ratio: x{legacy_seconds / compiled_seconds:.2f}, verdicts changed: {changed} "
+          f"(word boundaries and accents: \"rp\" in \"entreprise\", \"intern\" in \"interne\"/\"internationale\"...; "
+          f"offers no longer wrongly rejected go through the later checks)")
+
+
+if __name__ == "__main__":
+    main()
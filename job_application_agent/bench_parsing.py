@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark du parsing des pages de résultats Indeed
+Compare l'ancien parsing BeautifulSoup (html.parser, arbre complet) au parsing lxml ciblé
+
+Usage:
+    python bench_parsing.py [page1.html page2.html ...] [--repeat 20]
+
+Sans fichier en argument, une page Indeed synthétique est générée.
+"""
+
+import sys
+import time
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List
+
+# Ajouter le répertoire au path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bs4 import BeautifulSoup, SoupStrainer
+from loguru import logger
+
+from utils.models import JobOffer
+from utils.html_parsing import select_cards
+from scrapers.indeed_scraper import IndeedScraper
+
+
+CARD_TEMPLATE = """
+<div class="cardOutline"><div class="job_seen_beacon">
+  <table><tr><td>
+    <h2 class="jobTitle css-1psdjh5"><a data-jk="{jk}" href="/rc/clk?jk={jk}&amp;from=serp"><span title="Chargé de communication {i}">Chargé de communication {i}</span></a></h2>
+    <div class="company_location"><span data-testid="company-name">Entreprise {i}</span>
+    <div data-testid="text-location">Lyon {arrondissement}e</div></div>
+    <div class="metadata"><div class="attribute_snippet">CDI</div></div>
+  </td></tr></table>
+  <div class="job-snippet"><ul><li>Piloter la communication interne et externe</li><li>Organiser les événements {i}</li></ul></div>
+  <span class="date">Posted {days} days ago</span>
+</div></div>
+"""
+
+
+def build_synthetic_page(cards: int = 15) -> bytes:
+    """Génère une page de résultats Indeed avec `cards` offres et un habillage réaliste"""
+    chrome = "".join(
+        f'<div class="nav-item"><a href="/nav/{i}">Lien {i}</a><script>var x{i} = {i};</script></div>'
+        for i in range(300)
+    )
+    body = "".join(
+        CARD_TEMPLATE.format(i=i, jk=f"{i:016x}", arrondissement=i % 9 + 1, days=i % 7)
+        for i in range(cards)
+    )
+    return f"<html><head><title>Emplois</title></head><body>{chrome}{body}{chrome}</body></html>".encode("utf-8")
+
+
+def parse_legacy(content: bytes, base_url: str) -> List[JobOffer]:
+    """Ancien parsing: arbre BeautifulSoup complet (html.parser) puis find() par champ"""
+    soup = BeautifulSoup(content, "html.parser")
+    offers = []
+    
+    for card in soup.find_all("div", class_="job_seen_beacon"):
+        title_elem = card.find("h2", class_="jobTitle")
+        if not title_elem:
+            continue
+        company_elem = card.find("span", {"data-testid": "company-name"})
+        location_elem = card.find("div", {"data-testid": "text-location"})
+        link_elem = title_elem.find("a")
+        description_elem = card.find("div", class_="job-snippet")
+        full_text = card.get_text().upper()
+        
+        offers.append(JobOffer(
+            title=title_elem.get_text(strip=True),
+            company=company_elem.get_text(strip=True) if company_elem else "Non spécifié",
+            location=location_elem.get_text(strip=True) if location_elem else "Non spécifié",
+            contract_type="CDI" if "CDI" in full_text else "Non spécifié",
+            description=description_elem.get_text(strip=True) if description_elem else "",
+            url=base_url + link_elem["href"],
+            source="indeed",
+            application_type="form",
+            application_url=base_url + link_elem["href"],
+            scraped_at=datetime.now()
+        ))
+    
+    return offers
+
+
+def parse_strainer(content: bytes) -> int:
+    """BeautifulSoup avec lxml et SoupStrainer (cartes uniquement), sans extraction des champs"""
+    strainer = SoupStrainer("div", class_="job_seen_beacon")
+    soup = BeautifulSoup(content, "lxml", parse_only=strainer)
+    return len(soup.find_all("div", class_="job_seen_beacon"))
+
+
+def bench(name: str, func: Callable[[bytes], object], pages: List[bytes], repeat: int, cards: int) -> float:
+    """Exécute `func` sur toutes les pages `repeat` fois et affiche le temps par page et par carte"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for content in pages:
+            func(content)
+    elapsed = time.perf_counter() - start
+    
+    runs = repeat * len(pages)
+    per_page_ms = elapsed / runs * 1000
+    per_card_us = elapsed / max(1, repeat * cards) * 1_000_000
+    print(f"{name:<38} {per_page_ms:8.2f} ms/page {per_card_us:9.1f} µs/card")
+    return elapsed
+
+
+def main():
+    """Point d'entrée"""
+    parser = argparse.ArgumentParser(description="Benchmark du parsing des pages de résultats Indeed")
+    parser.add_argument("files", nargs="*", help="Pages HTML de résultats Indeed enregistrées")
+    parser.add_argument("--repeat", type=int, default=20, help="Nombre de répétitions")
+    parser.add_argument("--cards", type=int, default=15, help="Cartes par page synthétique")
+    args = parser.parse_args()
+    
+    pages = [Path(f).read_bytes() for f in args.files] or [build_synthetic_page(args.cards)]
+    
+    # Pas de logs pendant les mesures
+    logger.remove()
+    
+    scraper = IndeedScraper()
+    
+    def parse_fast(content: bytes) -> List[JobOffer]:
+        cards = select_cards(content, "div", "job_seen_beacon")
+        return [scraper.parse_job_offer(card) for card in cards]
+    
+    cards = sum(len(select_cards(content, "div", "job_seen_beacon")) for content in pages)
+    print(f"{len(pages)} page(s), {cards} cards, {args.repeat} repetitions\n")
+    
+    legacy = bench("bs4 html.parser + find (legacy)", lambda c: parse_legacy(c, scraper.base_url), pages, args.repeat, cards)
+    bench("bs4 lxml + SoupStrainer (cards only)", parse_strainer, pages, args.repeat, cards)
+    fast = bench("lxml xpath + single pass (current)", parse_fast, pages, args.repeat, cards)
+    
+    print(f"\nSpeedup vs legacy: x{legacy / fast:.1f}")
+
+
+if __name__ == "__main__":
+    main()
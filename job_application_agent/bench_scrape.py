@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark hors ligne des scrapers à partir de réponses enregistrées (fixtures)
+
+Usage:
+    python bench_scrape.py --record                    # enregistre une fois les pages réelles
+    python bench_scrape.py [indeed france_travail] [--latency-ms 150] [--repeat 3]
+
+Le rejeu n'accède jamais au réseau: une page absente des fixtures est une erreur.
+"""
+
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Ajouter le répertoire au path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def parse_args() -> argparse.Namespace:
+    """Lit les arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Benchmark des scrapers sur fixtures enregistrées")
+    parser.add_argument("scrapers", nargs="*", default=["indeed", "france_travail"], help="Scrapers à mesurer")
+    parser.add_argument("--record", action="store_true", help="Enregistrer les réponses réelles au lieu de les rejouer")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Latence artificielle par réponse rejouée")
+    parser.add_argument("--repeat", type=int, default=3, help="Nombre de répétitions")
+    parser.add_argument("--max-offers", type=int, default=50, help="Offres maximum par scraper")
+    return parser.parse_args()
+
+
+def main():
+    """Point d'entrée"""
+    args = parse_args()
+    
+    # Le mode de transport est lu par la configuration: à définir avant les imports
+    os.environ["SCRAPER_TRANSPORT_MODE"] = "record" if args.record else "replay"
+    os.environ["REPLAY_LATENCY_MS"] = str(args.latency_ms)
+    
+    from loguru import logger
+    from config import FIXTURES_DIR
+    from scrapers.indeed_scraper import IndeedScraper
+    from scrapers.france_travail_scraper import FranceTravailScraper
+    
+    scraper_classes = {
+        "indeed": IndeedScraper,
+        "france_travail": FranceTravailScraper
+    }
+    
+    if args.record:
+        for name in args.scrapers:
+            with scraper_classes[name]() as scraper:
+                offers = scraper.scrape(max_offers=args.max_offers)
+            print(f"{name}: recorded {scraper.get_stats()['pages']} pages ({len(offers)} offers) in {FIXTURES_DIR}")
+        return
+    
+    # Pas de logs pendant les mesures
+    logger.remove()
+    
+    print(f"Replaying fixtures from {FIXTURES_DIR} ({args.latency_ms:g} ms latency, {args.repeat} repetitions)\n")
+    print(f"{'scraper':<16} {'pages/s':>9} {'fetch ms/page':>14} {'parse ms/card':>14} {'offers/s':>9} {'offers':>7}")
+    
+    for name in args.scrapers:
+        scraper = scraper_classes[name]()
+        elapsed = 0.0
+        offers = []
+        
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            with scraper:
+                offers = scraper.scrape(max_offers=args.max_offers)
+            elapsed += time.perf_counter() - start
+        
+        stats = scraper.get_stats()
+        if not stats["pages"]:
+            print(f"{name:<16} no page replayed (record fixtures first with --record)")
+            continue
+        
+        print(
+            f"{name:<16} {stats['pages'] / elapsed:9.1f} "
+            f"{stats['fetch_seconds'] / stats['pages'] * 1000:14.1f} "
+            f"{stats['parse_seconds'] / max(1, stats['cards']) * 1000:14.3f} "
+            f"{stats['offers'] / elapsed:9.1f} {len(offers):7d}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
+import asyncio
 import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -13,15 +14,21 @@ from reportlab.pdfbase.ttfonts import TTFont
 from loguru import logger
 
 from utils.models import JobOffer
-from utils.ai_helper import AIHelper
+from utils.ai_helper import AsyncAIHelper
 from config import CV_BASE_PATH, OUTPUT_DIR, OPENAI_API_KEY
 
 
 class CVGenerator:
     """Génère des CV optimisés pour chaque offre d'emploi"""
     
-    def __init__(self):
-        self.ai_helper = AIHelper(api_key=OPENAI_API_KEY)
+    def __init__(self, ai_helper: Optional[AsyncAIHelper] = None):
+        """
+        Initialise le générateur
+        
+        Args:
+            ai_helper: Client IA partagé avec les autres générateurs (mêmes limites de débit)
+        """
+        self.ai_helper = ai_helper or AsyncAIHelper(api_key=OPENAI_API_KEY)
         self.cv_base = self._load_cv_base()
         logger.info("CVGenerator initialized")
     
@@ -62,19 +69,53 @@ class CVGenerator:
             )
             
             # Générer le PDF
-            output_filename = self._generate_filename(job_offer)
-            output_path = OUTPUT_DIR / output_filename
-            
-            self._create_pdf(optimized_cv, output_path, job_offer.language)
-            
-            logger.info(f"CV generated successfully: {output_path}")
-            return str(output_path)
+            return self._write_cv(optimized_cv, job_offer)
             
         except Exception as e:
             logger.error(f"Error generating CV: {e}")
             # En cas d'erreur, générer un CV basique
             return self._generate_basic_cv(job_offer)
     
+    async def generate_optimized_cv_async(self, job_offer: JobOffer) -> str:
+        """
+        Version asyncio de generate_optimized_cv (appels à l'IA sans bloquer les autres offres)
+        
+        Args:
+            job_offer: Offre d'emploi cible
+        
+        Returns:
+            Chemin du fichier PDF généré
+        """
+        logger.info(f"Generating optimized CV for: {job_offer.title} at {job_offer.company}")
+        
+        try:
+            job_analysis = await self.ai_helper.analyze_job_offer_async(
+                job_description=f"{job_offer.title}\n\n{job_offer.description}\n\n{job_offer.requirements}"
+            )
+            
+            optimized_cv = await self.ai_helper.optimize_cv_content_async(
+                cv_data=self.cv_base,
+                job_analysis=job_analysis,
+                target_language=job_offer.language
+            )
+            
+            # reportlab et l'écriture du fichier bloquent: hors de la boucle asyncio
+            return await asyncio.to_thread(self._write_cv, optimized_cv, job_offer)
+            
+        except Exception as e:
+            logger.error(f"Error generating CV: {e}")
+            return await asyncio.to_thread(self._generate_basic_cv, job_offer)
+    
+    def _write_cv(self, cv_data: Dict[str, Any], job_offer: JobOffer) -> str:
+        """Crée le PDF du CV optimisé et retourne son chemin"""
+        output_filename = self._generate_filename(job_offer)
+        output_path = OUTPUT_DIR / output_filename
+        
+        self._create_pdf(cv_data, output_path, job_offer.language)
+        
+        logger.info(f"CV generated successfully: {output_path}")
+        return str(output_path)
+    
     def _generate_basic_cv(self, job_offer: JobOffer) -> str:
         """Génère un CV basique sans optimisation AI"""
         logger.warning("Generating basic CV without AI optimization")
@@ -95,7 +136,8 @@ class CVGenerator:
         # Timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        return f"CV_Camille_Coupet_{company_clean}_{timestamp}.pdf"
+        # Identifiant de l'offre: deux offres d'une même entreprise traitées dans la même seconde
+        return f"CV_Camille_Coupet_{company_clean}_{timestamp}_{job_offer.id[:6]}.pdf"
     
     def _create_pdf(self, cv_data: Dict[str, Any], output_path: Path, language: str = "fr"):
         """
@@ -0,0 +1,427 @@
+import json
+import math
+import random
+import sqlite3
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from loguru import logger
+
+from utils.models import JobOffer
+from .duplicate_detector import normalize_text
+from config import (
+    DATABASE_PATH,
+    DOMAIN_MODEL_PATH,
+    DOMAIN_MODEL_CONFIDENCE,
+    DOMAIN_MODEL_MIN_SAMPLES
+)
+
+
+# Caractéristiques hachées (mots et paires de mots du titre, mots de la description)
+# dans un vecteur de taille fixe: pas de vocabulaire à stocker ni à maintenir
+FEATURE_BUCKETS = 1 << 18
+
+# Même portion de description que le prompt de AIHelper.detect_job_domain
+DESCRIPTION_CHARS = 500
+
+# Régression logistique: descente de gradient sur tout le jeu, régularisation L2
+TRAINING_EPOCHS = 300
+LEARNING_RATE = 2.0
+L2_PENALTY = 1e-4
+
+# (titre, description, pertinent)
+Sample = Tuple[str, str, bool]
+
+
+def offer_features(title: str, description: str) -> Dict[int, float]:
+    """
+    Extrait les caractéristiques hachées d'une offre (fréquences logarithmiques)
+    
+    Args:
+        title: Titre du poste
+        description: Description (seuls les DESCRIPTION_CHARS premiers caractères sont utilisés)
+    
+    Returns:
+        Dictionnaire {indice de caractéristique: poids}
+    """
+    title_tokens = normalize_text(title)
+    features = [f"t:{token}" for token in title_tokens]
+    features += [f"t:{first}_{second}" for first, second in zip(title_tokens, title_tokens[1:])]
+    features += [f"d:{token}" for token in normalize_text((description or "")[:DESCRIPTION_CHARS])]
+    
+    counts: Dict[int, float] = {}
+    for feature in features:
+        index = zlib.crc32(feature.encode("utf-8")) & (FEATURE_BUCKETS - 1)
+        counts[index] = counts.get(index, 0.0) + 1.0
+    return {index: 1.0 + math.log(count) for index, count in counts.items()}
+
+
+class DomainModel:
+    """Modèle TF-IDF haché + régression logistique (NumPy uniquement)"""
+    
+    def __init__(self, weights: np.ndarray, idf: np.ndarray, bias: float, metrics: Optional[Dict] = None):
+        """
+        Initialise le modèle
+        
+        Args:
+            weights: Poids de chaque caractéristique (FEATURE_BUCKETS)
+            idf: Fréquence documentaire inverse de chaque caractéristique (FEATURE_BUCKETS)
+            bias: Biais de la régression logistique
+            metrics: Métriques d'évaluation enregistrées avec le modèle
+        """
+        self.weights = weights
+        self.idf = idf
+        self.bias = bias
+        self.metrics = metrics or {}
+    
+    def predict_proba(self, title: str, description: str) -> float:
+        """
+        Probabilité que le poste relève du domaine communication/événementiel
+        
+        Args:
+            title: Titre du poste
+            description: Description du poste
+        
+        Returns:
+            Probabilité entre 0 et 1
+        """
+        features = offer_features(title, description)
+        if not features:
+            return 1.0 / (1.0 + math.exp(-self.bias))
+        
+        indices = np.fromiter(features.keys(), dtype=np.int64, count=len(features))
+        values = np.fromiter(features.values(), dtype=np.float64, count=len(features)) * self.idf[indices]
+        norm = np.sqrt(values @ values)
+        score = self.bias + (values @ self.weights[indices]) / (norm or 1.0)
+        return float(1.0 / (1.0 + np.exp(-score)))
+    
+    def save(self, path: Path):
+        """Enregistre le modèle (fichier .npz)"""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as handle:
+            np.savez_compressed(
+                handle,
+                weights=self.weights.astype(np.float32),
+                idf=self.idf.astype(np.float32),
+                bias=np.array([self.bias]),
+                metrics=np.array(json.dumps(self.metrics))
+            )
+    
+    @classmethod
+    def load(cls, path: Path) -> "DomainModel":
+        """Charge un modèle enregistré par save()"""
+        with np.load(path) as data:
+            return cls(
+                weights=data["weights"].astype(np.float64),
+                idf=data["idf"].astype(np.float64),
+                bias=float(data["bias"][0]),
+                metrics=json.loads(str(data["metrics"]))
+            )
+
+
+def _vectorize(samples: List[Sample]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Représentation creuse du jeu: (ligne, indice, valeur) de chaque caractéristique non nulle"""
+    rows, indices, values = [], [], []
+    for row, (title, description, _) in enumerate(samples):
+        for index, value in offer_features(title, description).items():
+            rows.append(row)
+            indices.append(index)
+            values.append(value)
+    return np.array(rows, dtype=np.int64), np.array(indices, dtype=np.int64), np.array(values, dtype=np.float64)
+
+
+def train_model(samples: List[Sample], epochs: int = TRAINING_EPOCHS) -> DomainModel:
+    """
+    Entraîne le modèle sur des offres étiquetées
+    
+    Les classes sont pondérées pour compenser leur déséquilibre (les offres hors
+    domaine sont bien plus nombreuses).
+    
+    Args:
+        samples: Offres étiquetées (titre, description, pertinent)
+        epochs: Nombre d'itérations de la descente de gradient
+    
+    Returns:
+        Modèle entraîné
+    """
+    count = len(samples)
+    labels = np.array([1.0 if relevant else 0.0 for _, _, relevant in samples])
+    rows, indices, values = _vectorize(samples)
+    
+    document_frequency = np.bincount(indices, minlength=FEATURE_BUCKETS)
+    idf = np.log((1.0 + count) / (1.0 + document_frequency)) + 1.0
+    
+    values = values * idf[indices]
+    norms = np.sqrt(np.bincount(rows, weights=values ** 2, minlength=count))
+    values = values / np.where(norms > 0, norms, 1.0)[rows]
+    
+    positives = labels.sum()
+    sample_weights = np.where(
+        labels == 1.0,
+        count / (2.0 * max(positives, 1.0)),
+        count / (2.0 * max(count - positives, 1.0))
+    )
+    
+    weights = np.zeros(FEATURE_BUCKETS)
+    bias = 0.0
+    for _ in range(epochs):
+        scores = bias + np.bincount(rows, weights=values * weights[indices], minlength=count)
+        errors = (1.0 / (1.0 + np.exp(-scores)) - labels) * sample_weights / count
+        weights -= LEARNING_RATE * (np.bincount(indices, weights=values * errors[rows], minlength=FEATURE_BUCKETS) + L2_PENALTY * weights)
+        bias -= LEARNING_RATE * errors.sum()
+    
+    return DomainModel(weights, idf, bias)
+
+
+def evaluate_model(model: DomainModel, samples: List[Sample], confidence: float = DOMAIN_MODEL_CONFIDENCE) -> Dict[str, float]:
+    """
+    Mesure la précision et le rappel du modèle sur des offres étiquetées
+    
+    Args:
+        model: Modèle à évaluer
+        samples: Offres étiquetées non vues à l'entraînement
+        confidence: Seuil de confiance en dessous duquel l'IA est consultée
+    
+    Returns:
+        Dictionnaire {samples, precision, recall, f1, coverage, covered_precision, covered_recall}:
+        les métriques "covered_" ne portent que sur les offres décidées localement
+    """
+    def scores(pairs: List[Tuple[bool, bool]]) -> Tuple[float, float]:
+        true_positives = sum(1 for predicted, relevant in pairs if predicted and relevant)
+        predicted_positives = sum(1 for predicted, _ in pairs if predicted)
+        positives = sum(1 for _, relevant in pairs if relevant)
+        precision = true_positives / predicted_positives if predicted_positives else 0.0
+        recall = true_positives / positives if positives else 0.0
+        return precision, recall
+    
+    predictions = [(model.predict_proba(title, description), relevant) for title, description, relevant in samples]
+    precision, recall = scores([(probability >= 0.5, relevant) for probability, relevant in predictions])
+    covered = [
+        (probability >= 0.5, relevant) for probability, relevant in predictions
+        if probability >= confidence or probability <= 1.0 - confidence
+    ]
+    covered_precision, covered_recall = scores(covered)
+    
+    return {
+        "samples": len(samples),
+        "precision": precision,
+        "recall": recall,
+        "f1": 2 * precision * recall / (precision + recall) if precision + recall else 0.0,
+        "coverage": len(covered) / len(samples) if samples else 0.0,
+        "covered_precision": covered_precision,
+        "covered_recall": covered_recall
+    }
+
+
+class DomainClassifier:
+    """
+    Classification locale du domaine d'une offre, avant tout appel à l'IA
+    
+    Le modèle est entraîné sur les verdicts déjà rendus par l'IA et sur les offres
+    ayant donné lieu à une candidature; seules les offres sur lesquelles il n'est pas
+    assez confiant sont encore envoyées à l'IA.
+    """
+    
+    def __init__(
+        self,
+        db_path: Path = DATABASE_PATH,
+        model_path: Path = DOMAIN_MODEL_PATH,
+        confidence: float = DOMAIN_MODEL_CONFIDENCE,
+        min_samples: int = DOMAIN_MODEL_MIN_SAMPLES
+    ):
+        """
+        Initialise le classifieur et charge le modèle s'il a déjà été entraîné
+        
+        Args:
+            db_path: Base SQLite (applications.db par défaut)
+            model_path: Fichier du modèle entraîné
+            confidence: Probabilité minimale (d'un côté ou de l'autre) pour décider sans l'IA
+            min_samples: Nombre minimum d'offres étiquetées pour entraîner un modèle
+        """
+        self.db_path = db_path
+        self.model_path = model_path
+        self.confidence = confidence
+        self.min_samples = min_samples
+        self.stats = {"relevant": 0, "not_relevant": 0, "uncertain": 0}
+        self._init_database()
+        
+        self.model: Optional[DomainModel] = None
+        if Path(self.model_path).exists():
+            try:
+                self.model = DomainModel.load(self.model_path)
+                logger.info(f"Domain model loaded: {self.model.metrics}")
+            except Exception as e:
+                logger.error(f"Error loading domain model {self.model_path}: {e}")
+    
+    def _init_database(self):
+        """Crée la table des verdicts de domaine"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS domain_verdicts (
+                offer_id TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                description TEXT,
+                relevant BOOLEAN NOT NULL,
+                source TEXT NOT NULL,
+                created_at TIMESTAMP NOT NULL
+            )
+        ''')
+        
+        conn.commit()
+        conn.close()
+    
+    def predict(self, offer: JobOffer) -> Optional[bool]:
+        """
+        Décide localement si une offre relève du domaine
+        
+        Args:
+            offer: Offre à classer
+        
+        Returns:
+            True/False si le modèle est assez confiant, None s'il faut consulter l'IA
+        """
+        return self.classify(offer.title, offer.description)
+    
+    def classify(self, title: str, description: str) -> Optional[bool]:
+        """
+        Décide localement à partir du titre et de la description (voir predict)
+        
+        Args:
+            title: Titre du poste
+            description: Description du poste
+        
+        Returns:
+            True/False si le modèle est assez confiant, None s'il faut consulter l'IA
+        """
+        if self.model is None:
+            return None
+        
+        probability = self.model.predict_proba(title, description)
+        if probability >= self.confidence:
+            self.stats["relevant"] += 1
+            verdict = True
+        elif probability <= 1.0 - self.confidence:
+            self.stats["not_relevant"] += 1
+            verdict = False
+        else:
+            self.stats["uncertain"] += 1
+            verdict = None
+        
+        logger.debug(f"Domain model for '{title}': p={probability:.3f} -> {verdict}")
+        return verdict
+    
+    def record_verdict(self, offer: JobOffer, relevant: bool, source: str = "llm"):
+        """
+        Enregistre un verdict (donnée d'entraînement du prochain modèle)
+        
+        Args:
+            offer: Offre classée
+            relevant: Verdict
+            source: Origine du verdict (llm, manual...)
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            INSERT OR REPLACE INTO domain_verdicts (offer_id, title, description, relevant, source, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (
+            offer.id,
+            offer.title,
+            (offer.description or "")[:DESCRIPTION_CHARS],
+            relevant,
+            source,
+            datetime.now()
+        ))
+        
+        conn.commit()
+        conn.close()
+    
+    def load_samples(self) -> List[Sample]:
+        """
+        Charge les offres étiquetées: verdicts enregistrés, puis offres ayant donné
+        lieu à une candidature (positives) sans verdict
+        
+        Returns:
+            Liste de (titre, description, pertinent)
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        cursor = conn.cursor()
+        
+        cursor.execute("SELECT title, description, relevant FROM domain_verdicts")
+        samples = [(title, description or "", bool(relevant)) for title, description, relevant in cursor.fetchall()]
+        
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ('job_offers', 'applications')")
+        if len(cursor.fetchall()) == 2:
+            cursor.execute('''
+                SELECT DISTINCT o.title, o.description
+                FROM job_offers o
+                JOIN applications a ON a.job_offer_id = o.id
+                WHERE o.id NOT IN (SELECT offer_id FROM domain_verdicts)
+            ''')
+            samples += [(title, description or "", True) for title, description in cursor.fetchall()]
+        
+        conn.close()
+        return samples
+    
+    def train(self, holdout: float = 0.2, seed: int = 42) -> Optional[Dict[str, float]]:
+        """
+        Réentraîne le modèle et l'enregistre
+        
+        Le modèle est d'abord évalué sur une part des offres mise de côté, puis
+        réentraîné sur toutes les offres.
+        
+        Args:
+            holdout: Part des offres réservée à l'évaluation
+            seed: Graine du tirage de l'échantillon d'évaluation
+        
+        Returns:
+            Métriques d'évaluation, ou None si les données sont insuffisantes
+        """
+        samples = self.load_samples()
+        positives = sum(1 for _, _, relevant in samples if relevant)
+        if len(samples) < self.min_samples or positives in (0, len(samples)):
+            logger.warning(
+                f"Not enough labeled offers to train the domain model: {len(samples)} "
+                f"({positives} relevant), need {self.min_samples} with both classes"
+            )
+            return None
+        
+        random.Random(seed).shuffle(samples)
+        split = max(1, int(len(samples) * holdout))
+        metrics = evaluate_model(train_model(samples[split:]), samples[:split], self.confidence)
+        
+        model = train_model(samples)
+        model.metrics = {
+            **metrics,
+            "trained_on": len(samples),
+            "confidence": self.confidence,
+            "trained_at": datetime.now().isoformat()
+        }
+        model.save(self.model_path)
+        self.model = model
+        
+        logger.info(
+            f"Domain model trained on {len(samples)} offers: precision {metrics['precision']:.2f}, "
+            f"recall {metrics['recall']:.2f}, {metrics['coverage']:.0%} decided locally at "
+            f"confidence {self.confidence} (precision {metrics['covered_precision']:.2f}, "
+            f"recall {metrics['covered_recall']:.2f})"
+        )
+        return metrics
+    
+    def log_stats(self):
+        """Écrit la répartition des décisions locales dans les logs (résumé d'exécution)"""
+        if self.model is None:
+            return
+        
+        decided = self.stats["relevant"] + self.stats["not_relevant"]
+        logger.info(
+            f"Domain model: {decided} offers decided locally ({self.stats['relevant']} relevant, "
+            f"{self.stats['not_relevant']} not relevant), {self.stats['uncertain']} sent to the AI"
+        )
@@ -0,0 +1,194 @@
+"""
+Pool de navigateurs Selenium partagé entre les scrapers (démarrage à chaud, recyclage)
+"""
+
+import queue
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional
+from loguru import logger
+
+from .web_utils import setup_selenium_driver
+from config import HEADLESS_BROWSER, CHROME_PROFILE_DIR, DRIVER_POOL_SIZE, DRIVER_MAX_PAGES
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+
+class DriverPool:
+    """Prête des WebDriver Chrome déjà démarrés et les recycle après un nombre de pages donné"""
+    
+    def __init__(self, size: int = 2, max_pages: int = 50, headless: bool = True):
+        """
+        Initialise le pool (les navigateurs sont démarrés à la demande ou via warm_up)
+        
+        Args:
+            size: Nombre maximum de navigateurs ouverts simultanément
+            max_pages: Pages chargées par un navigateur avant son remplacement
+            headless: Exécuter les navigateurs en mode headless
+        """
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self.headless = headless
+        self._idle: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+        self._free_slots: List[int] = list(range(self.size))
+        self._slots: Dict[int, int] = {}
+        self._pages: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.stats = {"started": 0, "reused": 0, "recycled": 0}
+    
+    def _start_driver(self, slot: int) -> "webdriver.Chrome":
+        """Démarre un navigateur dans le profil du slot donné"""
+        driver = setup_selenium_driver(
+            headless=self.headless,
+            user_data_dir=str(CHROME_PROFILE_DIR / f"pool_{slot}")
+        )
+        with self._lock:
+            self._slots[id(driver)] = slot
+            self._pages[id(driver)] = 0
+            self.stats["started"] += 1
+        return driver
+    
+    def warm_up(self, count: Optional[int] = None):
+        """
+        Démarre à l'avance des navigateurs pour que les scrapers n'attendent pas le démarrage
+        
+        Args:
+            count: Nombre de navigateurs à démarrer (taille du pool par défaut)
+        """
+        for _ in range(min(count or self.size, self.size)):
+            with self._lock:
+                if not self._free_slots:
+                    return
+                slot = self._free_slots.pop(0)
+            try:
+                self._idle.put(self._start_driver(slot))
+            except Exception:
+                with self._lock:
+                    self._free_slots.append(slot)
+                raise
+    
+    def acquire(self, timeout: Optional[float] = None) -> "webdriver.Chrome":
+        """
+        Emprunte un navigateur (réutilise un navigateur libre, sinon en démarre un)
+        
+        Args:
+            timeout: Attente maximale d'un navigateur libre quand le pool est plein
+        
+        Returns:
+            WebDriver Chrome prêt à l'emploi
+        """
+        try:
+            driver = self._idle.get_nowait()
+            with self._lock:
+                self.stats["reused"] += 1
+            return driver
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            slot = self._free_slots.pop(0) if self._free_slots else None
+        
+        if slot is None:
+            driver = self._idle.get(timeout=timeout)
+            with self._lock:
+                self.stats["reused"] += 1
+            return driver
+        
+        try:
+            return self._start_driver(slot)
+        except Exception:
+            with self._lock:
+                self._free_slots.append(slot)
+            raise
+    
+    def release(self, driver: "webdriver.Chrome", pages: int = 0):
+        """
+        Rend un navigateur au pool après avoir nettoyé son état
+        
+        Args:
+            driver: Navigateur emprunté via acquire()
+            pages: Nombre de pages chargées pendant l'emprunt
+        """
+        with self._lock:
+            self._pages[id(driver)] = self._pages.get(id(driver), 0) + pages
+            worn_out = self._pages[id(driver)] >= self.max_pages
+        
+        if not worn_out:
+            try:
+                self._reset(driver)
+                self._idle.put(driver)
+                return
+            except Exception as e:
+                logger.warning(f"Browser reset failed, recycling it: {e}")
+        
+        with self._lock:
+            self.stats["recycled"] += 1
+        self._discard(driver)
+    
+    def _reset(self, driver: "webdriver.Chrome"):
+        """Ferme les onglets supplémentaires et efface cookies et stockage local"""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        
+        driver.delete_all_cookies()
+        driver.execute_script("try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+        driver.get("about:blank")
+    
+    def _discard(self, driver: "webdriver.Chrome"):
+        """Ferme un navigateur et libère son slot"""
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.error(f"Error closing WebDriver: {e}")
+        
+        with self._lock:
+            slot = self._slots.pop(id(driver), None)
+            self._pages.pop(id(driver), None)
+            if slot is not None:
+                self._free_slots.append(slot)
+    
+    def close_all(self):
+        """Ferme tous les navigateurs inactifs du pool"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+    
+    def log_stats(self):
+        """Écrit les statistiques du pool dans les logs"""
+        with self._lock:
+            stats = dict(self.stats)
+        
+        if stats["started"]:
+            logger.info(
+                f"Browser pool: {stats['started']} started, {stats['reused']} reused, "
+                f"{stats['recycled']} recycled"
+            )
+
+
+_driver_pool: Optional[DriverPool] = None
+_driver_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> DriverPool:
+    """
+    Retourne le pool de navigateurs partagé par tous les scrapers Selenium
+    
+    Returns:
+        Instance unique de DriverPool
+    """
+    global _driver_pool
+    
+    with _driver_pool_lock:
+        if _driver_pool is None:
+            _driver_pool = DriverPool(
+                size=DRIVER_POOL_SIZE,
+                max_pages=DRIVER_MAX_PAGES,
+                headless=HEADLESS_BROWSER
+            )
+        return _driver_pool
@@ -0,0 +1,385 @@
+import hashlib
+import json
+import random
+import re
+import sqlite3
+import unicodedata
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+from loguru import logger
+
+from utils.models import JobOffer
+from config import DUPLICATE_INDEX_PATH, DUPLICATE_SIMILARITY, DUPLICATE_TTL_DAYS
+
+
+# Signature MinHash de 64 valeurs, découpée en 16 bandes de 4 lignes pour la LSH:
+# deux offres de similarité de Jaccard >= 0.6 ont ~90% de chances de partager une bande
+NUM_PERMUTATIONS = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+MERSENNE_PRIME = (1 << 61) - 1
+
+_rng = random.Random(20240101)
+PERMUTATIONS = [
+    (_rng.randrange(1, MERSENNE_PRIME), _rng.randrange(0, MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+# Poids des champs (nombre de copies de chaque mot dans l'ensemble) et taille de
+# description retenue: un snippet de recherche et une description complète commencent pareil
+TITLE_WEIGHT = 3
+COMPANY_WEIGHT = 3
+DESCRIPTION_MAX_TOKENS = 80
+
+# Synonymes de télétravail: "Remote" et "Télétravail" désignent le même lieu
+REMOTE_LOCATIONS = {"remote", "teletravail", "distanciel"}
+
+COMPANY_SUFFIXES = {"sas", "sasu", "sarl", "sa", "eurl", "sci", "scop", "group", "groupe", "france"}
+STOPWORDS = {
+    "le", "la", "les", "de", "des", "du", "un", "une", "et", "en", "au", "aux", "pour", "par",
+    "the", "of", "and", "to", "in", "hf", "fh"
+}
+
+
+def normalize_text(text: str) -> List[str]:
+    """
+    Normalise un texte en liste de mots (minuscules, sans accents, ponctuation, mots vides ni lettres isolées)
+    
+    Args:
+        text: Texte brut
+    
+    Returns:
+        Liste de mots normalisés
+    """
+    text = unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode("ascii").lower()
+    return [token for token in re.findall(r"[a-z0-9]+", text) if len(token) > 1 and token not in STOPWORDS]
+
+
+def title_tokens(offer: JobOffer) -> Set[str]:
+    """Mots normalisés du titre"""
+    return set(normalize_text(offer.title))
+
+
+def company_tokens(offer: JobOffer) -> Set[str]:
+    """Mots normalisés de l'entreprise, sans forme juridique"""
+    return set(normalize_text(offer.company)) - COMPANY_SUFFIXES - {"non", "specifie"}
+
+
+def location_tokens(offer: JobOffer) -> Set[str]:
+    """Mots normalisés du lieu, télétravail regroupé sous "remote" """
+    tokens = set(normalize_text(offer.location)) - {"non", "specifie", "france", "full"}
+    return {"remote" if token in REMOTE_LOCATIONS else token for token in tokens}
+
+
+def offer_features(offer: JobOffer) -> Set[str]:
+    """
+    Construit l'ensemble de caractéristiques d'une offre (titre + entreprise + début de description)
+    
+    Le lieu n'en fait pas partie ("Lyon" et "Lyon 3e" désignent la même offre): il
+    est comparé à part par DuplicateDetector._is_duplicate.
+    
+    Args:
+        offer: Offre
+    
+    Returns:
+        Ensemble de caractéristiques préfixées par champ
+    """
+    features = set()
+    
+    for token in title_tokens(offer):
+        features.update(f"t{copy}:{token}" for copy in range(TITLE_WEIGHT))
+    
+    for token in company_tokens(offer):
+        features.update(f"c{copy}:{token}" for copy in range(COMPANY_WEIGHT))
+    
+    description = normalize_text(offer.description)[:DESCRIPTION_MAX_TOKENS]
+    features.update(f"d:{first}_{second}" for first, second in zip(description, description[1:]))
+    
+    return features
+
+
+def minhash_signature(features: Set[str]) -> List[int]:
+    """
+    Calcule la signature MinHash d'un ensemble de caractéristiques
+    
+    Args:
+        features: Ensemble de caractéristiques
+    
+    Returns:
+        NUM_PERMUTATIONS valeurs minimales (estimateur de la similarité de Jaccard)
+    """
+    hashes = [
+        int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+        for feature in features
+    ]
+    if not hashes:
+        return [MERSENNE_PRIME] * NUM_PERMUTATIONS
+    
+    return [min((a * value + b) % MERSENNE_PRIME for value in hashes) for a, b in PERMUTATIONS]
+
+
+def estimate_similarity(first: List[int], second: List[int]) -> float:
+    """Similarité de Jaccard estimée à partir de deux signatures MinHash"""
+    return sum(1 for a, b in zip(first, second) if a == b) / NUM_PERMUTATIONS
+
+
+def jaccard(first: Set[str], second: Set[str]) -> float:
+    """Similarité de Jaccard de deux ensembles"""
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+
+def _band_values(signature: List[int]) -> List[int]:
+    """Empreinte de chaque bande (entier signé 64 bits pour SQLite)"""
+    values = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]
+        digest = hashlib.blake2b(",".join(map(str, rows)).encode("ascii"), digest_size=8).digest()
+        values.append(int.from_bytes(digest, "big", signed=True))
+    return values
+
+
+class DuplicateDetector:
+    """Regroupe les offres quasi identiques (toutes sources confondues) via un index MinHash LSH persistant"""
+    
+    def __init__(
+        self,
+        db_path: Path = DUPLICATE_INDEX_PATH,
+        min_similarity: float = DUPLICATE_SIMILARITY,
+        ttl_days: float = DUPLICATE_TTL_DAYS
+    ):
+        """
+        Initialise le détecteur
+        
+        Args:
+            db_path: Base SQLite de l'index (à côté de applications.db)
+            min_similarity: Similarité de Jaccard estimée à partir de laquelle deux offres sont des doublons
+            ttl_days: Durée de conservation d'une offre dans l'index depuis sa dernière apparition
+        """
+        self.db_path = db_path
+        self.min_similarity = min_similarity
+        self.ttl_days = ttl_days
+        self._init_database()
+        self.expire()
+    
+    def _init_database(self):
+        """Crée les tables de l'index"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS dedup_offers (
+                offer_id TEXT PRIMARY KEY,
+                cluster_id TEXT NOT NULL,
+                title_key TEXT NOT NULL,
+                company_key TEXT NOT NULL,
+                location_key TEXT NOT NULL DEFAULT '',
+                signature TEXT NOT NULL,
+                title TEXT,
+                company TEXT,
+                source TEXT,
+                indexed_at TIMESTAMP NOT NULL
+            )
+        ''')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS dedup_bands (
+                band INTEGER NOT NULL,
+                value INTEGER NOT NULL,
+                offer_id TEXT NOT NULL,
+                PRIMARY KEY (band, value, offer_id)
+            )
+        ''')
+        
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_dedup_offers_keys ON dedup_offers (title_key, company_key)"
+        )
+        
+        # Index créé avant la comparaison des lieux: lieu inconnu pour les anciennes entrées
+        cursor.execute("PRAGMA table_info(dedup_offers)")
+        if "location_key" not in {row[1] for row in cursor.fetchall()}:
+            cursor.execute("ALTER TABLE dedup_offers ADD COLUMN location_key TEXT NOT NULL DEFAULT ''")
+        
+        conn.commit()
+        conn.close()
+    
+    def expire(self):
+        """Retire de l'index les offres plus vues depuis ttl_days (une offre republiée plus tard est de nouveau traitée)"""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        cursor = conn.cursor()
+        
+        cursor.execute(
+            "DELETE FROM dedup_offers WHERE indexed_at < ?",
+            (datetime.now() - timedelta(days=self.ttl_days),)
+        )
+        expired = cursor.rowcount
+        if expired:
+            cursor.execute("DELETE FROM dedup_bands WHERE offer_id NOT IN (SELECT offer_id FROM dedup_offers)")
+        
+        conn.commit()
+        conn.close()
+        
+        if expired:
+            logger.debug(f"Duplicate index: expired {expired} offers older than {self.ttl_days:g} days")
+    
+    def _describe(self, offer: JobOffer) -> Dict[str, Any]:
+        """Calcule les clés et la signature d'une offre"""
+        titles = title_tokens(offer)
+        companies = company_tokens(offer)
+        locations = location_tokens(offer)
+        signature = minhash_signature(offer_features(offer))
+        return {
+            "title_tokens": titles,
+            "company_tokens": companies,
+            "location_tokens": locations,
+            "title_key": " ".join(sorted(titles)),
+            "company_key": " ".join(sorted(companies)),
+            "location_key": " ".join(sorted(locations)),
+            "signature": signature,
+            "bands": _band_values(signature)
+        }
+    
+    def _is_duplicate(self, entry: Dict[str, Any], candidate: Dict[str, Any]) -> bool:
+        """
+        Vérifie qu'un candidat de la LSH est bien un doublon
+        
+        Même entreprise, connue des deux côtés ("Non spécifié" ne rapproche pas deux
+        offres), même lieu (si connu des deux côtés: "Lyon" et "Lyon 3e" oui, "Lyon"
+        et "Remote" non), et soit le même titre, soit des titres proches avec un
+        contenu similaire.
+        """
+        candidate_companies = set(candidate["company_key"].split())
+        if not entry["company_tokens"] or not candidate_companies:
+            return False
+        if jaccard(entry["company_tokens"], candidate_companies) < 0.5:
+            return False
+        
+        candidate_locations = set(candidate["location_key"].split())
+        if entry["location_tokens"] and candidate_locations and not entry["location_tokens"] & candidate_locations:
+            return False
+        
+        if entry["title_key"] == candidate["title_key"]:
+            return True
+        
+        candidate_titles = set(candidate["title_key"].split())
+        return (
+            jaccard(entry["title_tokens"], candidate_titles) >= 0.5
+            and estimate_similarity(entry["signature"], candidate["signature"]) >= self.min_similarity
+        )
+    
+    def _find_indexed(self, cursor: sqlite3.Cursor, entry: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """Cherche dans l'index un doublon de l'offre, retourne (offer_id, cluster_id)"""
+        conditions = " OR ".join(["(b.band = ? AND b.value = ?)"] * BANDS)
+        params = [value for band, band_value in enumerate(entry["bands"]) for value in (band, band_value)]
+        
+        cursor.execute(f'''
+            SELECT o.offer_id, o.cluster_id, o.title_key, o.company_key, o.location_key, o.signature
+            FROM dedup_offers o
+            WHERE o.offer_id IN (SELECT b.offer_id FROM dedup_bands b WHERE {conditions})
+               OR (o.title_key = ? AND o.company_key = ?)
+        ''', params + [entry["title_key"], entry["company_key"]])
+        
+        best = None
+        for offer_id, cluster_id, title_key, company_key, location_key, signature in cursor.fetchall():
+            candidate = {
+                "title_key": title_key,
+                "company_key": company_key,
+                "location_key": location_key,
+                "signature": json.loads(signature)
+            }
+            if not self._is_duplicate(entry, candidate):
+                continue
+            similarity = estimate_similarity(entry["signature"], candidate["signature"])
+            if best is None or similarity > best[0]:
+                best = (similarity, offer_id, cluster_id)
+        
+        return (best[1], best[2]) if best else None
+    
+    def _index(self, cursor: sqlite3.Cursor, offer: JobOffer, entry: Dict[str, Any], cluster_id: str):
+        """Ajoute une offre à l'index"""
+        cursor.execute('''
+            INSERT OR REPLACE INTO dedup_offers (
+                offer_id, cluster_id, title_key, company_key, location_key, signature,
+                title, company, source, indexed_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            offer.id,
+            cluster_id,
+            entry["title_key"],
+            entry["company_key"],
+            entry["location_key"],
+            json.dumps(entry["signature"]),
+            offer.title,
+            offer.company,
+            offer.source,
+            datetime.now()
+        ))
+        
+        cursor.executemany(
+            "INSERT OR IGNORE INTO dedup_bands (band, value, offer_id) VALUES (?, ?, ?)",
+            [(band, value, offer.id) for band, value in enumerate(entry["bands"])]
+        )
+    
+    def deduplicate(self, offers: List[JobOffer]) -> List[JobOffer]:
+        """
+        Élimine les quasi-doublons avant filtrage
+        
+        Une offre doublon d'une offre déjà indexée est écartée: offre d'une exécution
+        précédente (déjà payée) ou d'un lot précédent de cette exécution (déjà transmise
+        au pipeline, c'est donc la première copie rencontrée qui est conservée). Au sein
+        du lot, les doublons sont regroupés et seule l'offre à la description la plus
+        complète est conservée; les runners appellent deduplicate page par page, et une
+        page ne contient les offres que d'une seule source.
+        
+        Args:
+            offers: Offres nouvellement scrapées (un lot)
+        
+        Returns:
+            Une offre par cluster, dans l'ordre d'origine
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        cursor = conn.cursor()
+        
+        kept: Dict[str, JobOffer] = {}
+        known = 0
+        clustered = 0
+        
+        for offer in offers:
+            entry = self._describe(offer)
+            match = self._find_indexed(cursor, entry)
+            
+            if match is None or match[1] == offer.id:
+                # Nouvelle offre (ou offre de référence de son cluster, déjà indexée)
+                cluster_id = offer.id
+                kept[cluster_id] = offer
+            elif match[1] in kept:
+                # Doublon d'une offre du lot courant (autre source, autre formulation)
+                cluster_id = match[1]
+                clustered += 1
+                current = kept[cluster_id]
+                logger.debug(f"Duplicate offers clustered: '{offer.title}' ({offer.source}) ~ '{current.title}' ({current.source})")
+                if len(offer.description) > len(current.description):
+                    kept[cluster_id] = offer
+            else:
+                # Doublon d'une offre vue lors d'une exécution ou d'un lot précédent
+                cluster_id = match[1]
+                known += 1
+                logger.debug(f"Duplicate of a previously seen offer: '{offer.title}' ({offer.source})")
+            
+            self._index(cursor, offer, entry, cluster_id)
+        
+        conn.commit()
+        conn.close()
+        
+        kept_offers = {id(offer) for offer in kept.values()}
+        unique_offers = [offer for offer in offers if id(offer) in kept_offers]
+        
+        logger.info(
+            f"Duplicate detection: {len(unique_offers)}/{len(offers)} unique offers "
+            f"({clustered} clustered in this run, {known} already seen)"
+        )
+        return unique_offers
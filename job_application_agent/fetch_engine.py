@@ -0,0 +1,84 @@
+"""
+Moteur de récupération asynchrone pour les scrapers HTTP
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
+from urllib.parse import urlparse
+from loguru import logger
+
+
+# (hôte, fonction bloquante, arguments)
+FetchJob = Tuple[str, Callable[..., Any], tuple]
+
+
+def get_host(url: str) -> str:
+    """
+    Extrait l'hôte d'une URL
+    
+    Args:
+        url: URL complète
+    
+    Returns:
+        Nom d'hôte en minuscules (chaîne vide si absent)
+    """
+    return urlparse(url).netloc.lower()
+
+
+class AsyncFetchEngine:
+    """Exécute les requêtes des scrapers en parallèle avec un plafond de concurrence par hôte"""
+    
+    def __init__(self, max_concurrency_per_host: int = 2):
+        """
+        Initialise le moteur
+        
+        Args:
+            max_concurrency_per_host: Nombre maximum de requêtes simultanées vers un même hôte
+        """
+        self.max_concurrency_per_host = max(1, max_concurrency_per_host)
+    
+    async def gather(self, jobs: List[FetchJob]) -> List[Any]:
+        """
+        Lance toutes les tâches en parallèle dans la boucle asyncio courante
+        
+        Args:
+            jobs: Liste de tuples (hôte, fonction, arguments)
+        
+        Returns:
+            Résultats dans l'ordre des tâches (l'exception levée si une tâche échoue)
+        """
+        semaphores: Dict[str, asyncio.Semaphore] = {}
+        
+        async def run_job(host: str, func: Callable[..., Any], args: tuple) -> Any:
+            semaphore = semaphores.setdefault(host, asyncio.Semaphore(self.max_concurrency_per_host))
+            async with semaphore:
+                return await asyncio.to_thread(func, *args)
+        
+        logger.debug(f"Running {len(jobs)} fetch jobs concurrently")
+        return await asyncio.gather(
+            *(run_job(host, func, args) for host, func, args in jobs),
+            return_exceptions=True
+        )
+    
+    def run(self, jobs: List[FetchJob]) -> List[Any]:
+        """
+        Version synchrone de gather(), utilisable depuis du code bloquant
+        
+        Args:
+            jobs: Liste de tuples (hôte, fonction, arguments)
+        
+        Returns:
+            Résultats dans l'ordre des tâches (l'exception levée si une tâche échoue)
+        """
+        if not jobs:
+            return []
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.gather(jobs))
+        
+        # Déjà dans une boucle asyncio: exécuter dans un thread dédié
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.gather(jobs)).result()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Rejoue les filtres sur l'historique des offres (table job_offers) en mode colonne
+
+Usage:
+    python filter_backlog.py [--limit N] [--workers 4] [--no-ai] [--export accepted.csv]
+
+Affiche le nombre d'offres rejetées par règle; --no-ai remplace la classification
+du domaine par l'IA par les mots-clés de la description (aucun appel à l'API).
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Ajouter le répertoire au path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.logger import setup_logger
+from filters.batch_filter import BatchFilter, RULES
+from config import FILTER_WORKERS, LOGS_DIR
+
+
+def main():
+    """Point d'entrée"""
+    parser = argparse.ArgumentParser(description="Filtrage en masse de l'historique des offres")
+    parser.add_argument("--limit", type=int, default=None, help="Nombre maximum d'offres (les plus récentes)")
+    parser.add_argument("--workers", type=int, default=FILTER_WORKERS, help="Processus de détection de langue")
+    parser.add_argument("--no-ai", action="store_true", help="Ne pas consulter l'IA pour le domaine")
+    parser.add_argument("--export", type=str, default=None, help="Fichier CSV des offres acceptées")
+    args = parser.parse_args()
+    
+    setup_logger(logs_dir=str(LOGS_DIR))
+    
+    batch_filter = BatchFilter(use_ai=not args.no_ai, workers=args.workers)
+    
+    start = time.perf_counter()
+    frame = batch_filter.load_backlog(limit=args.limit)
+    load_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    frame, breakdown = batch_filter.filter_frame(frame)
+    filter_seconds = time.perf_counter() - start
+    
+    accepted = frame[frame["rejected_by"] == ""]
+    print(f"\n{len(frame)} offers loaded in {load_seconds:.2f} s, filtered in {filter_seconds:.2f} s\n")
+    print(f"{'rule':<16} {'rejected':>9}")
+    for rule in RULES:
+        print(f"{rule:<16} {breakdown[rule]:9d}")
+    print(f"{'accepted':<16} {len(accepted):9d}")
+    
+    if args.export:
+        accepted.drop(columns=["rejected_by"]).to_csv(args.export, index=False)
+        print(f"\nAccepted offers exported to {args.export}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Transport HTTP d'enregistrement / rejeu pour faire tourner les scrapers hors ligne
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from loguru import logger
+
+from .response_cache import normalize_url
+
+
+class FixtureNotFoundError(requests.RequestException):
+    """Levée en rejeu pour une requête sans fixture enregistrée (jamais retentée)"""
+
+
+class FixtureStore:
+    """Stocke les réponses enregistrées sur disque: un fichier JSON de métadonnées et le corps brut par requête"""
+    
+    def __init__(self, root: Path):
+        """
+        Initialise le stockage
+        
+        Args:
+            root: Répertoire des fixtures (un sous-répertoire par hôte)
+        """
+        self.root = Path(root)
+    
+    def _paths(self, method: str, url: str):
+        """Retourne les chemins (métadonnées, corps) d'une requête"""
+        normalized = normalize_url(url)
+        key = hashlib.sha256(f"{method.upper()} {normalized}".encode("utf-8")).hexdigest()[:32]
+        host_dir = self.root / (requests.utils.urlparse(normalized).hostname or "unknown")
+        return host_dir / f"{key}.json", host_dir / f"{key}.body"
+    
+    def load(self, method: str, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Charge la réponse enregistrée pour une requête
+        
+        Args:
+            method: Méthode HTTP
+            url: URL complète (query string comprise)
+        
+        Returns:
+            Dictionnaire {url, status_code, reason, headers, content} ou None
+        """
+        meta_path, body_path = self._paths(method, url)
+        if not meta_path.exists():
+            return None
+        
+        fixture = json.loads(meta_path.read_text(encoding="utf-8"))
+        fixture["content"] = body_path.read_bytes() if body_path.exists() else b""
+        return fixture
+    
+    def save(self, method: str, url: str, response: requests.Response):
+        """
+        Enregistre une réponse
+        
+        Args:
+            method: Méthode HTTP
+            url: URL complète de la requête
+            response: Réponse reçue
+        """
+        meta_path, body_path = self._paths(method, url)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        meta = {
+            "url": normalize_url(url),
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                name: value for name, value in response.headers.items()
+                if name.lower() in ("content-type", "etag", "last-modified", "location")
+            },
+            "recorded_at": time.time()
+        }
+        body_path.write_bytes(response.content)
+        meta_path.write_text(json.dumps(meta, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+class FixtureAdapter(BaseAdapter):
+    """Adaptateur requests qui enregistre les réponses réelles (record) ou les rejoue (replay)"""
+    
+    def __init__(self, store: FixtureStore, mode: str = "replay", latency_ms: float = 0, **adapter_kwargs):
+        """
+        Initialise l'adaptateur
+        
+        Args:
+            store: Stockage des fixtures
+            mode: "record" (réseau + enregistrement) ou "replay" (fixtures uniquement)
+            latency_ms: Latence artificielle ajoutée à chaque réponse rejouée
+            adapter_kwargs: Paramètres de l'HTTPAdapter réel (mode record)
+        """
+        super().__init__()
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown fixture mode: {mode}")
+        
+        self.store = store
+        self.mode = mode
+        self.latency_ms = latency_ms
+        self.adapter = HTTPAdapter(**adapter_kwargs)
+        # Exposé pour les statistiques de réutilisation du SessionPool
+        self.poolmanager = self.adapter.poolmanager
+    
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """Envoie une requête préparée (ou la rejoue depuis les fixtures)"""
+        if self.mode == "record":
+            response = self.adapter.send(request, **kwargs)
+            if response.status_code != 304:
+                self.store.save(request.method, request.url, response)
+                logger.debug(f"Recorded fixture: {request.url}")
+            return response
+        
+        fixture = self.store.load(request.method, request.url)
+        if fixture is None:
+            raise FixtureNotFoundError(f"No fixture recorded for {request.method} {request.url}", request=request)
+        
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        
+        response = requests.Response()
+        response.status_code = fixture["status_code"]
+        response.reason = fixture.get("reason") or ""
+        response.headers = CaseInsensitiveDict(fixture["headers"])
+        response._content = fixture["content"]
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        return response
+    
+    def close(self):
+        """Ferme l'adaptateur réseau sous-jacent"""
+        self.adapter.close()
@@ -1,13 +1,22 @@
-from typing import List, Optional
+import re
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import requests
-from bs4 import BeautifulSoup
 from loguru import logger
 
 from .base_scraper import BaseScraper
+from .query_planner import SearchQuery
 from utils.models import JobOffer
-from utils.web_utils import sleep_random, get_user_agent
-from config import SCRAPING_DELAY_MIN, SCRAPING_DELAY_MAX
+from utils.web_utils import get_user_agent, parse_posted_date
+from utils.html_parsing import (
+    select_cards,
+    get_classes,
+    get_text,
+    get_multiline_text,
+    parse_document,
+    extract_job_details,
+    class_xpath
+)
 
 
 class FranceTravailScraper(BaseScraper):
@@ -16,6 +25,7 @@ class FranceTravailScraper(BaseScraper):
     def __init__(self):
         super().__init__(name="france_travail", use_selenium=False)
         self.base_url = "https://candidat.francetravail.fr"
+        self.page_size = 20  # Taille du paramètre "range"
     
     def scrape(self, max_offers: int = 50) -> List[JobOffer]:
         """
@@ -29,47 +39,61 @@ class FranceTravailScraper(BaseScraper):
         """
         offers = []
         
-        # Recherches multiples
-        search_queries = [
-            "communication",
-            "événementiel",
-            "chargé de communication",
-            "event manager"
-        ]
-        
-        locations = ["Lyon", ""]  # Lyon ou toute la France (pour remote)
-        
-        for query in search_queries:
-            for location in locations:
-                if len(offers) >= max_offers:
-                    break
-                
-                logger.info(f"Searching France Travail for: {query} in {location or 'all France'}")
-                
-                try:
-                    page_offers = self._scrape_search_page(query, location, max_offers - len(offers))
-                    offers.extend(page_offers)
-                    sleep_random(SCRAPING_DELAY_MIN, SCRAPING_DELAY_MAX)
-                    
-                except Exception as e:
-                    logger.error(f"Error scraping France Travail for '{query}': {e}")
-                    continue
+        # Plan de recherches (domaine × lieux), ordonné par rendement des exécutions précédentes
+        plan = self.plan_queries()
+        for query in plan:
+            logger.info(f"Searching France Travail for: {query.keywords} in {'all France' if query.is_remote else query.location}")
+        
+        # Toutes les requêtes partent en parallèle (concurrence plafonnée par hôte)
+        results = self.run_queries(
+            self._scrape_query,
+            [(query, max_offers) for query in plan]
+        )
         
+        for query, result in zip(plan, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error scraping France Travail for '{query.keywords}': {result}")
+                continue
+            offers.extend(result)
+        
+        self.record_query_results(plan)
         logger.info(f"France Travail scraper found {len(offers)} offers")
         return offers[:max_offers]
     
-    def _scrape_search_page(self, query: str, location: str, max_results: int) -> List[JobOffer]:
-        """Scrape une page de résultats de recherche"""
-        offers = []
+    def _scrape_query(self, query: SearchQuery, max_results: int) -> List[JobOffer]:
+        """Scrape les pages de résultats d'une requête (pagination avec préchargement)"""
+        # Toute la France pour le télétravail
+        location = "" if query.is_remote else query.location.title()
         
+        # Frontière des offres déjà vues lors des exécutions précédentes
+        watermark = self.get_watermark(self.watermark_key(query))
+        
+        offers = self.paginate(
+            fetch_page=lambda page: self._fetch_search_page(query.keywords, location, page),
+            parse_page=lambda response, remaining: self._parse_search_page(response, watermark, remaining, query.key),
+            max_results=max_results
+        )
+        
+        self.save_watermark(self.watermark_key(query), offers)
+        return offers
+    
+    def watermark_key(self, query: SearchQuery) -> str:
+        """Clé d'avant le plan de recherches: mots-clés|lieu recherché ("communication|Lyon", "communication|")"""
+        location = "" if query.is_remote else query.location.title()
+        return f"{query.keywords}|{location}"
+    
+    def _fetch_search_page(self, query: str, location: str, page: int) -> requests.Response:
+        """Télécharge une page de résultats de recherche"""
         # URL de recherche France Travail
         search_url = f"{self.base_url}/offres/recherche"
         
+        first = page * self.page_size
         params = {
             "motsCles": query,
             "lieuRecherche": location,
             "rayon": "30",  # 30 km autour de Lyon
-            "tri": "0"  # Tri par date
+            "tri": "0",  # Tri par date
+            "range": f"{first}-{first + self.page_size - 1}"
         }
         
         headers = {
@@ -77,71 +101,134 @@ class FranceTravailScraper(BaseScraper):
             "Accept-Language": "fr-FR,fr;q=0.9"
         }
         
+        return self.fetch(search_url, params=params, headers=headers)
+    
+    def _parse_search_page(
+        self,
+        response: requests.Response,
+        watermark: Optional[dict],
+        max_results: int,
+        query_key: Optional[str] = None
+    ) -> Tuple[List[JobOffer], bool]:
+        """Parse une page de résultats, retourne (offres, True si la pagination doit s'arrêter)"""
         try:
-            response = requests.get(
-                search_url,
-                params=params,
-                headers=headers,
-                timeout=30
-            )
-            response.raise_for_status()
+            # Page inchangée depuis la dernière exécution: pas de nouveau parsing
+            cached_offers = self.get_cached_offers(response)
+            if cached_offers is not None:
+                offers, reached_seen = self.select_new_offers(cached_offers, watermark, max_results, query_key)
+                return offers, reached_seen or not cached_offers
             
-            soup = BeautifulSoup(response.content, "html.parser")
-            
-            # Trouver les offres (structure peut varier)
-            job_cards = soup.find_all("li", class_="result")
+            # Trouver les offres avec lxml (structure peut varier)
+            job_cards = select_cards(response.content, "li", "result")
             
             if not job_cards:
                 # Essayer une autre structure
-                job_cards = soup.find_all("article", class_="card")
+                job_cards = select_cards(response.content, "article", "card")
             
             logger.debug(f"Found {len(job_cards)} job cards on France Travail")
             
-            for card in job_cards[:max_results]:
-                offer = self.parse_job_offer(card)
-                if offer:
-                    offers.append(offer)
-            
+            offers, reached_seen = self.parse_page_cards(response, job_cards, watermark, max_results, query_key)
+            return offers, reached_seen or len(job_cards) < self.page_size
+        
         except Exception as e:
-            logger.error(f"Error fetching France Travail search page: {e}")
+            logger.error(f"Error parsing France Travail search page: {e}")
+            return [], True
+    
+    def get_detail_url(self, offer: JobOffer) -> Optional[str]:
+        """URL de la fiche détaillée de l'offre"""
+        if offer.job_key:
+            return f"{self.base_url}/offres/recherche/detail/{offer.job_key}"
+        return offer.url
+    
+    def parse_job_detail(self, content: bytes) -> Dict[str, str]:
+        """Parse la fiche détaillée France Travail (description + compétences + type de contrat)"""
+        document = parse_document(content)
         
-        return offers
+        description_elems = (
+            document.xpath("//*[@itemprop='description']")
+            or document.xpath(class_xpath("div", "description"))
+        )
+        if not description_elems:
+            return {}
+        
+        details = extract_job_details(get_multiline_text(description_elems[0]))
+        
+        # Les compétences et le contrat sont dans des blocs dédiés de la fiche
+        skills = [get_text(elem) for elem in document.xpath("//*[@itemprop='skills']//li | //*[@itemprop='qualifications']//li")]
+        if skills and not details["requirements"]:
+            details["requirements"] = "\n".join(skill for skill in skills if skill)
+        
+        contract = " ".join(get_text(elem) for elem in document.xpath("//*[@itemprop='employmentType']")).upper()
+        if "CDI" in contract:
+            details["contract_type"] = "CDI"
+        elif "CDD" in contract:
+            details["contract_type"] = "CDD"
+        
+        return details
+    
+    def extract_job_key(self, element) -> Optional[str]:
+        """Extrait le numéro d'offre France Travail d'une carte"""
+        if element.get("data-id-offre"):
+            return element.get("data-id-offre")
+        
+        for href in element.xpath(".//a/@href"):
+            match = re.search(r"/detail/(\w+)", href)
+            if match:
+                return match.group(1)
+        return None
     
     def parse_job_offer(self, element) -> Optional[JobOffer]:
-        """Parse une carte d'offre France Travail"""
+        """Parse une carte d'offre France Travail (élément lxml), en un seul parcours de la carte"""
         try:
+            # Premier élément rencontré pour chaque couple (balise, classe)
+            found = {}
+            for node in element.iter("h2", "h3", "span", "p", "a"):
+                if node.tag in ("h2", "h3", "a"):
+                    found.setdefault((node.tag, None), node)
+                    continue
+                for css_class in get_classes(node):
+                    if css_class in ("company", "location", "description", "date", "contract"):
+                        found.setdefault((node.tag, css_class), node)
+            
+            def first(*keys):
+                for key in keys:
+                    if key in found:
+                        return found[key]
+                return None
+            
             # Titre
-            title_elem = element.find("h2") or element.find("h3")
-            if not title_elem:
+            title_elem = first(("h2", None), ("h3", None))
+            if title_elem is None:
                 return None
-            title = title_elem.get_text(strip=True)
+            title = get_text(title_elem)
             
             # Entreprise
-            company_elem = element.find("span", class_="company") or element.find("p", class_="company")
-            company = company_elem.get_text(strip=True) if company_elem else "Non spécifié"
+            company = get_text(first(("span", "company"), ("p", "company"))) or "Non spécifié"
             
             # Localisation
-            location_elem = element.find("span", class_="location") or element.find("p", class_="location")
-            location = location_elem.get_text(strip=True) if location_elem else "Non spécifié"
+            location = get_text(first(("span", "location"), ("p", "location"))) or "Non spécifié"
             
             # URL
-            link_elem = element.find("a")
-            if not link_elem or not link_elem.get("href"):
+            link_elem = first(("a", None))
+            if link_elem is None or not link_elem.get("href"):
                 return None
             
-            job_url = link_elem["href"]
+            job_url = link_elem.get("href")
             if not job_url.startswith("http"):
                 job_url = self.base_url + job_url
             
             # Description
-            description_elem = element.find("p", class_="description")
-            description = description_elem.get_text(strip=True) if description_elem else ""
+            description = get_text(first(("p", "description")))
+            
+            # Date de publication
+            date_elem = first(("p", "date"), ("span", "date"))
+            posted_date = parse_posted_date(get_text(date_elem)) if date_elem is not None else None
             
             # Type de contrat
-            contract_elem = element.find("span", class_="contract") or element.find("p", class_="contract")
+            contract_elem = first(("span", "contract"), ("p", "contract"))
             contract_type = "Non spécifié"
-            if contract_elem:
-                contract_text = contract_elem.get_text(strip=True).upper()
+            if contract_elem is not None:
+                contract_text = get_text(contract_elem).upper()
                 if "CDI" in contract_text:
                     contract_type = "CDI"
                 elif "CDD" in contract_text:
@@ -156,8 +243,10 @@ class FranceTravailScraper(BaseScraper):
                 description=description,
                 requirements="",
                 url=job_url,
+                job_key=self.extract_job_key(element) or "",
                 source="france_travail",
                 language="fr",
+                posted_date=posted_date,
                 application_type="form",
                 application_url=job_url,
                 scraped_at=datetime.now()
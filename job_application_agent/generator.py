@@ -1,5 +1,7 @@
+import asyncio
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import cm
@@ -9,7 +11,7 @@ from reportlab.lib.enums import TA_LEFT, TA_RIGHT
 from loguru import logger
 
 from utils.models import JobOffer
-from utils.ai_helper import AIHelper
+from utils.ai_helper import AsyncAIHelper
 from config import COVER_LETTER_TEMPLATE_PATH, OUTPUT_DIR, OPENAI_API_KEY, CV_BASE_PATH
 import json
 
@@ -17,8 +19,14 @@ import json
 class CoverLetterGenerator:
     """Génère des lettres de motivation personnalisées"""
     
-    def __init__(self):
-        self.ai_helper = AIHelper(api_key=OPENAI_API_KEY)
+    def __init__(self, ai_helper: Optional[AsyncAIHelper] = None):
+        """
+        Initialise le générateur
+        
+        Args:
+            ai_helper: Client IA partagé avec les autres générateurs (mêmes limites de débit)
+        """
+        self.ai_helper = ai_helper or AsyncAIHelper(api_key=OPENAI_API_KEY)
         self.template = self._load_template()
         self.cv_data = self._load_cv_data()
         logger.info("CoverLetterGenerator initialized")
@@ -57,36 +65,69 @@ class CoverLetterGenerator:
         logger.info(f"Generating cover letter for: {job_offer.title} at {job_offer.company}")
         
         try:
-            # Préparer les informations de l'offre
-            job_info = {
-                "title": job_offer.title,
-                "company": job_offer.company,
-                "description": job_offer.description,
-                "requirements": job_offer.requirements
-            }
-            
             # Générer le contenu avec AI
             letter_content = self.ai_helper.generate_cover_letter(
-                job_offer=job_info,
+                job_offer=self._job_info(job_offer),
                 cv_data=self.cv_data,
                 reference_letter=self.template,
                 target_language=job_offer.language
             )
             
             # Générer le PDF
-            output_filename = self._generate_filename(job_offer)
-            output_path = OUTPUT_DIR / output_filename
-            
-            self._create_pdf(letter_content, job_offer, output_path, job_offer.language)
-            
-            logger.info(f"Cover letter generated: {output_path}")
-            return str(output_path)
+            return self._write_letter(letter_content, job_offer)
             
         except Exception as e:
             logger.error(f"Error generating cover letter: {e}")
             # En cas d'erreur, utiliser le template de base
             return self._generate_basic_letter(job_offer)
     
+    async def generate_cover_letter_async(self, job_offer: JobOffer) -> str:
+        """
+        Version asyncio de generate_cover_letter (appel à l'IA sans bloquer les autres offres)
+        
+        Args:
+            job_offer: Offre d'emploi cible
+            
+        Returns:
+            Chemin du fichier PDF généré
+        """
+        logger.info(f"Generating cover letter for: {job_offer.title} at {job_offer.company}")
+        
+        try:
+            letter_content = await self.ai_helper.generate_cover_letter_async(
+                job_offer=self._job_info(job_offer),
+                cv_data=self.cv_data,
+                reference_letter=self.template,
+                target_language=job_offer.language
+            )
+            
+            # reportlab et l'écriture du fichier bloquent: hors de la boucle asyncio
+            return await asyncio.to_thread(self._write_letter, letter_content, job_offer)
+            
+        except Exception as e:
+            logger.error(f"Error generating cover letter: {e}")
+            return await asyncio.to_thread(self._generate_basic_letter, job_offer)
+    
+    @staticmethod
+    def _job_info(job_offer: JobOffer) -> dict:
+        """Informations de l'offre transmises à l'IA"""
+        return {
+            "title": job_offer.title,
+            "company": job_offer.company,
+            "description": job_offer.description,
+            "requirements": job_offer.requirements
+        }
+    
+    def _write_letter(self, content: str, job_offer: JobOffer) -> str:
+        """Crée le PDF de la lettre et retourne son chemin"""
+        output_filename = self._generate_filename(job_offer)
+        output_path = OUTPUT_DIR / output_filename
+        
+        self._create_pdf(content, job_offer, output_path, job_offer.language)
+        
+        logger.info(f"Cover letter generated: {output_path}")
+        return str(output_path)
+    
     def _generate_basic_letter(self, job_offer: JobOffer) -> str:
         """Génère une lettre basique en cas d'erreur AI"""
         logger.warning("Generating basic cover letter without AI")
@@ -114,7 +155,8 @@ class CoverLetterGenerator:
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        return f"Lettre_Motivation_{company_clean}_{timestamp}.pdf"
+        # Identifiant de l'offre: deux offres d'une même entreprise traitées dans la même seconde
+        return f"Lettre_Motivation_{company_clean}_{timestamp}_{job_offer.id[:6]}.pdf"
     
     def _create_pdf(self, content: str, job_offer: JobOffer, output_path: Path, language: str = "fr"):
         """
@@ -0,0 +1,179 @@
+"""
+Parsing HTML rapide basé sur lxml: extraction ciblée des cartes d'offres
+"""
+
+import re
+from typing import Dict, List, Optional
+from lxml import html as lxml_html
+from lxml import etree
+
+
+# Titres de section introduisant le profil recherché dans une description d'offre
+REQUIREMENTS_HEADINGS = re.compile(
+    r"^\W*(profil( recherché| souhaité)?|votre profil|compétences( requises| attendues)?|"
+    r"qualifications|prérequis|ce que nous recherchons|requirements|your profile|"
+    r"who you are|what we are looking for)\b",
+    re.IGNORECASE
+)
+
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)*\.[a-z]{2,}", re.IGNORECASE)
+
+# Formulations qui introduisent une adresse de candidature (et non un contact RGPD ou générique)
+APPLICATION_WORDING = re.compile(
+    r"candidature|candidater|postuler|\bcv\b|lettre de motivation|\bapply\b|application|resume|résumé",
+    re.IGNORECASE
+)
+APPLICATION_WORDING_WINDOW = 80  # Caractères examinés avant l'adresse
+
+
+def class_xpath(tag: str, css_class: str) -> str:
+    """
+    Construit une expression XPath sélectionnant les éléments `tag` portant la classe `css_class`
+    
+    Args:
+        tag: Nom de la balise (div, li, article...)
+        css_class: Classe CSS recherchée
+    
+    Returns:
+        Expression XPath relative à l'élément courant
+    """
+    return f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')]"
+
+
+def select_cards(content: bytes, tag: str, css_class: str, encoding: Optional[str] = None) -> List[etree._Element]:
+    """
+    Parse une page avec lxml et retourne uniquement les cartes d'offres
+    
+    Args:
+        content: Corps HTML brut
+        tag: Balise des cartes
+        css_class: Classe CSS des cartes
+        encoding: Encodage de la page (UTF-8 ou <meta charset> si None)
+    
+    Returns:
+        Liste des éléments lxml des cartes, dans l'ordre du document
+    """
+    if not content:
+        return []
+    
+    if encoding:
+        document = lxml_html.document_fromstring(content, parser=lxml_html.HTMLParser(encoding=encoding))
+    else:
+        document = parse_document(content)
+    return document.xpath(class_xpath(tag, css_class))
+
+
+def get_classes(element: etree._Element) -> List[str]:
+    """Retourne la liste des classes CSS d'un élément"""
+    return (element.get("class") or "").split()
+
+
+def get_text(element: Optional[etree._Element]) -> str:
+    """
+    Retourne le texte d'un élément, comme BeautifulSoup.get_text(strip=True)
+    
+    Chaque fragment de texte est nettoyé puis concaténé sans séparateur, ce qui
+    conserve les mêmes titres/entreprises (et donc les mêmes JobOffer.id)
+    qu'avec l'ancien parsing BeautifulSoup.
+    
+    Args:
+        element: Element lxml (ou None)
+    
+    Returns:
+        Texte nettoyé (chaîne vide si element est None)
+    """
+    if element is None:
+        return ""
+    return "".join(fragment.strip() for fragment in element.itertext())
+
+
+def get_multiline_text(element: Optional[etree._Element]) -> str:
+    """
+    Retourne le texte d'un élément, un fragment non vide par ligne
+    
+    Args:
+        element: Element lxml (ou None)
+    
+    Returns:
+        Texte avec sauts de ligne entre les fragments
+    """
+    if element is None:
+        return ""
+    return "\n".join(fragment.strip() for fragment in element.itertext() if fragment.strip())
+
+
+def parse_document(content: bytes) -> etree._Element:
+    """
+    Parse une page complète avec lxml (UTF-8 par défaut, sinon <meta charset>)
+    
+    Args:
+        content: Corps HTML brut
+    
+    Returns:
+        Racine du document
+    """
+    try:
+        content.decode("utf-8")
+        parser = lxml_html.HTMLParser(encoding="utf-8")
+    except UnicodeDecodeError:
+        parser = None
+    return lxml_html.document_fromstring(content, parser=parser)
+
+
+def extract_job_details(description_text: str) -> Dict[str, str]:
+    """
+    Extrait les champs structurés du texte complet d'une offre
+    
+    Args:
+        description_text: Description complète (une ligne par paragraphe)
+    
+    Returns:
+        Dictionnaire {description, requirements, contract_type, application_email}
+        (valeurs vides si non trouvées)
+    """
+    lines = description_text.splitlines()
+    
+    # Le profil recherché commence au premier titre de section reconnu
+    requirements = ""
+    for index, line in enumerate(lines):
+        if REQUIREMENTS_HEADINGS.match(line):
+            requirements = "\n".join(lines[index:])
+            break
+    
+    upper_text = description_text.upper()
+    contract_type = ""
+    if re.search(r"\bCDI\b", upper_text):
+        contract_type = "CDI"
+    elif re.search(r"\bCDD\b", upper_text):
+        contract_type = "CDD"
+    
+    application_email = find_application_email(description_text)
+    
+    return {
+        "description": description_text,
+        "requirements": requirements,
+        "contract_type": contract_type,
+        "application_email": application_email
+    }
+
+
+def find_application_email(text: str) -> str:
+    """
+    Cherche une adresse de candidature dans le texte d'une offre
+    
+    Seule une adresse précédée, sur la même ligne, d'une formulation de candidature
+    ("envoyez votre CV à", "candidatures:", "postuler")
+    est retenue: les contacts RGPD ou génériques sont ignorés.
+    
+    Args:
+        text: Description complète
+    
+    Returns:
+        Adresse trouvée, ou chaîne vide
+    """
+    for match in EMAIL_PATTERN.finditer(text):
+        line_start = text.rfind("\n", 0, match.start()) + 1
+        context = text[max(line_start, match.start() - APPLICATION_WORDING_WINDOW):match.start()]
+        if APPLICATION_WORDING.search(context):
+            return match.group(0)
+    return ""
@@ -0,0 +1,158 @@
+"""
+Pool de sessions HTTP partagées entre les scrapers (keep-alive par hôte)
+"""
+
+import threading
+from typing import Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from loguru import logger
+
+from .fixture_transport import FixtureAdapter, FixtureStore
+from config import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    SCRAPER_TRANSPORT_MODE,
+    FIXTURES_DIR,
+    REPLAY_LATENCY_MS
+)
+
+
+class SessionPool:
+    """Maintient une session requests par hôte pour réutiliser les connexions TCP/TLS"""
+    
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 4,
+        transport_mode: str = "live",
+        fixture_store: Optional[FixtureStore] = None,
+        replay_latency_ms: float = 0
+    ):
+        """
+        Initialise le pool
+        
+        Args:
+            pool_connections: Nombre de pools de connexions conservés par session
+            pool_maxsize: Nombre maximum de connexions keep-alive par hôte
+            transport_mode: "live" (réseau), "record" (réseau + enregistrement des
+                réponses) ou "replay" (réponses enregistrées uniquement)
+            fixture_store: Stockage des fixtures (modes record et replay)
+            replay_latency_ms: Latence artificielle des réponses rejouées
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.transport_mode = transport_mode
+        self.fixture_store = fixture_store
+        self.replay_latency_ms = replay_latency_ms
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+    
+    def get_session(self, host: str) -> requests.Session:
+        """
+        Retourne la session associée à un hôte (créée au premier appel)
+        
+        Args:
+            host: Nom d'hôte (ex: fr.indeed.com)
+        
+        Returns:
+            Session requests avec keep-alive
+        """
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                if self.transport_mode in ("record", "replay"):
+                    adapter = FixtureAdapter(
+                        self.fixture_store,
+                        mode=self.transport_mode,
+                        latency_ms=self.replay_latency_ms,
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize
+                    )
+                else:
+                    adapter = HTTPAdapter(
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize
+                    )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[host] = session
+                logger.debug(f"HTTP session created for {host} (pool_maxsize={self.pool_maxsize})")
+            return session
+    
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Calcule les compteurs de réutilisation des connexions par hôte
+        
+        Returns:
+            Dictionnaire {hôte: {requests, connections, reused}}
+        """
+        stats = {}
+        
+        with self._lock:
+            sessions = dict(self._sessions)
+        
+        for host, session in sessions.items():
+            total_requests = 0
+            total_connections = 0
+            
+            for adapter in set(session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools.get(key)
+                    if pool is None:
+                        continue
+                    total_requests += pool.num_requests
+                    total_connections += pool.num_connections
+            
+            stats[host] = {
+                "requests": total_requests,
+                "connections": total_connections,
+                "reused": max(0, total_requests - total_connections)
+            }
+        
+        return stats
+    
+    def log_stats(self):
+        """Écrit les compteurs de réutilisation dans les logs"""
+        for host, host_stats in self.get_stats().items():
+            logger.info(
+                f"HTTP pool {host}: {host_stats['requests']} requests, "
+                f"{host_stats['connections']} connections opened, "
+                f"{host_stats['reused']} reused"
+            )
+    
+    def close_all(self):
+        """Ferme toutes les sessions"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_session_pool: Optional[SessionPool] = None
+_session_pool_lock = threading.Lock()
+
+
+def get_session_pool() -> SessionPool:
+    """
+    Retourne le pool de sessions partagé par tous les scrapers
+    
+    Returns:
+        Instance unique de SessionPool
+    """
+    global _session_pool
+    
+    with _session_pool_lock:
+        if _session_pool is None:
+            _session_pool = SessionPool(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+                transport_mode=SCRAPER_TRANSPORT_MODE,
+                fixture_store=FixtureStore(FIXTURES_DIR),
+                replay_latency_ms=REPLAY_LATENCY_MS
+            )
+            if SCRAPER_TRANSPORT_MODE != "live":
+                logger.info(f"HTTP transport mode: {SCRAPER_TRANSPORT_MODE} (fixtures in {FIXTURES_DIR})")
+        return _session_pool
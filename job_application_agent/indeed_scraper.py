@@ -1,13 +1,21 @@
-from typing import List, Optional
+import re
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import requests
-from bs4 import BeautifulSoup
 from loguru import logger
 
 from .base_scraper import BaseScraper
+from .query_planner import SearchQuery
 from utils.models import JobOffer
-from utils.web_utils import sleep_random, get_user_agent
-from config import SCRAPING_DELAY_MIN, SCRAPING_DELAY_MAX
+from utils.web_utils import get_user_agent, parse_posted_date
+from utils.html_parsing import (
+    select_cards,
+    get_classes,
+    get_text,
+    get_multiline_text,
+    parse_document,
+    extract_job_details
+)
 
 
 class IndeedScraper(BaseScraper):
@@ -16,6 +24,7 @@ class IndeedScraper(BaseScraper):
     def __init__(self):
         super().__init__(name="indeed", use_selenium=False)
         self.base_url = "https://fr.indeed.com"
+        self.page_size = 10  # Pas du paramètre "start" d'Indeed
     
     def scrape(self, max_offers: int = 50) -> List[JobOffer]:
         """
@@ -29,44 +38,60 @@ class IndeedScraper(BaseScraper):
         """
         offers = []
         
-        # Recherches multiples pour couvrir les critères
-        search_queries = [
-            "communication Lyon",
-            "événementiel Lyon",
-            "chargé communication Lyon",
-            "event manager Lyon",
-            "communication remote",
-            "événementiel remote"
-        ]
+        # Plan de recherches (domaine × lieux), ordonné par rendement des exécutions précédentes
+        plan = self.plan_queries()
+        for query in plan:
+            logger.info(f"Searching Indeed for: {self._query_text(query)}")
         
-        for query in search_queries:
-            if len(offers) >= max_offers:
-                break
-            
-            logger.info(f"Searching Indeed for: {query}")
-            
-            try:
-                page_offers = self._scrape_search_page(query, max_offers - len(offers))
-                offers.extend(page_offers)
-                sleep_random(SCRAPING_DELAY_MIN, SCRAPING_DELAY_MAX)
-                
-            except Exception as e:
-                logger.error(f"Error scraping Indeed for '{query}': {e}")
+        # Toutes les requêtes partent en parallèle (concurrence plafonnée par hôte)
+        results = self.run_queries(
+            self._scrape_query,
+            [(query, max_offers) for query in plan]
+        )
+        
+        for query, result in zip(plan, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error scraping Indeed for '{self._query_text(query)}': {result}")
                 continue
+            offers.extend(result)
         
+        self.record_query_results(plan)
         logger.info(f"Indeed scraper found {len(offers)} offers")
         return offers[:max_offers]
     
-    def _scrape_search_page(self, query: str, max_results: int) -> List[JobOffer]:
-        """Scrape une page de résultats de recherche"""
-        offers = []
+    def _query_text(self, query: SearchQuery) -> str:
+        """Texte de recherche Indeed (le lieu fait partie de la requête)"""
+        return f"{query.keywords} {query.location}"
+    
+    def watermark_key(self, query: SearchQuery) -> str:
+        """Texte de recherche tel qu'il servait de clé avant le plan de recherches ("communication Lyon")"""
+        location = query.location if query.is_remote else query.location.title()
+        return f"{query.keywords} {location}"
+    
+    def _scrape_query(self, query: SearchQuery, max_results: int) -> List[JobOffer]:
+        """Scrape les pages de résultats d'une requête (pagination avec préchargement)"""
+        # Frontière des offres déjà vues lors des exécutions précédentes
+        watermark = self.get_watermark(self.watermark_key(query))
+        date_window = self.get_date_window(watermark)
+        
+        offers = self.paginate(
+            fetch_page=lambda page: self._fetch_search_page(self._query_text(query), page, date_window),
+            parse_page=lambda response, remaining: self._parse_search_page(response, watermark, remaining, query.key),
+            max_results=max_results
+        )
         
+        self.save_watermark(self.watermark_key(query), offers)
+        return offers
+    
+    def _fetch_search_page(self, query: str, page: int, date_window: int) -> requests.Response:
+        """Télécharge une page de résultats de recherche"""
         # Paramètres de recherche
         params = {
             "q": query,
             "l": "",  # Localisation gérée dans la requête
             "sort": "date",
-            "fromage": "7"  # Offres des 7 derniers jours
+            "fromage": str(date_window),  # Jours depuis la dernière exécution (7 max)
+            "start": str(page * self.page_size)
         }
         
         headers = {
@@ -74,63 +99,106 @@ class IndeedScraper(BaseScraper):
             "Accept-Language": "fr-FR,fr;q=0.9,en;q=0.8"
         }
         
+        return self.fetch(f"{self.base_url}/jobs", params=params, headers=headers)
+    
+    def _parse_search_page(
+        self,
+        response: requests.Response,
+        watermark: Optional[dict],
+        max_results: int,
+        query_key: Optional[str] = None
+    ) -> Tuple[List[JobOffer], bool]:
+        """Parse une page de résultats, retourne (offres, True si la pagination doit s'arrêter)"""
         try:
-            # Requête
-            response = requests.get(
-                f"{self.base_url}/jobs",
-                params=params,
-                headers=headers,
-                timeout=30
-            )
-            response.raise_for_status()
+            # Page inchangée depuis la dernière exécution: pas de nouveau parsing
+            cached_offers = self.get_cached_offers(response)
+            if cached_offers is not None:
+                offers, reached_seen = self.select_new_offers(cached_offers, watermark, max_results, query_key)
+                return offers, reached_seen or not cached_offers
             
-            # Parser le HTML
-            soup = BeautifulSoup(response.content, "html.parser")
-            
-            # Trouver les cartes d'offres
-            job_cards = soup.find_all("div", class_="job_seen_beacon")
+            # Parser le HTML avec lxml et ne garder que les cartes d'offres
+            job_cards = select_cards(response.content, "div", "job_seen_beacon")
             
             logger.debug(f"Found {len(job_cards)} job cards on page")
             
-            for card in job_cards[:max_results]:
-                offer = self.parse_job_offer(card)
-                if offer:
-                    offers.append(offer)
-            
+            offers, reached_seen = self.parse_page_cards(response, job_cards, watermark, max_results, query_key)
+            return offers, reached_seen or not job_cards
+        
         except Exception as e:
-            logger.error(f"Error fetching Indeed search page: {e}")
+            logger.error(f"Error parsing Indeed search page: {e}")
+            return [], True
+    
+    def get_detail_url(self, offer: JobOffer) -> Optional[str]:
+        """URL de la page de l'offre (plutôt que le lien de redirection des résultats)"""
+        if offer.job_key:
+            return f"{self.base_url}/viewjob?jk={offer.job_key}"
+        return offer.url
+    
+    def parse_job_detail(self, content: bytes) -> Dict[str, str]:
+        """Parse la page de détail Indeed (#jobDescriptionText)"""
+        document = parse_document(content)
+        description_elems = document.xpath("//div[@id='jobDescriptionText']")
+        if not description_elems:
+            return {}
+        return extract_job_details(get_multiline_text(description_elems[0]))
+    
+    def extract_job_key(self, element) -> Optional[str]:
+        """Extrait l'identifiant Indeed (jk) d'une carte"""
+        keys = element.xpath(".//a[@data-jk][1]/@data-jk")
+        if keys:
+            return keys[0]
         
-        return offers
+        for href in element.xpath(".//a/@href"):
+            match = re.search(r"[?&]jk=([0-9a-f]+)", href)
+            if match:
+                return match.group(1)
+        return None
     
     def parse_job_offer(self, element) -> Optional[JobOffer]:
-        """Parse une carte d'offre Indeed"""
+        """Parse une carte d'offre Indeed (élément lxml), en un seul parcours de la carte"""
         try:
+            title_elem = company_elem = location_elem = description_elem = date_elem = None
+            
+            for node in element.iter("h2", "span", "div"):
+                classes = get_classes(node)
+                test_id = node.get("data-testid")
+                
+                if title_elem is None and node.tag == "h2" and "jobTitle" in classes:
+                    title_elem = node
+                elif company_elem is None and test_id == "company-name":
+                    company_elem = node
+                elif location_elem is None and test_id == "text-location":
+                    location_elem = node
+                elif description_elem is None and node.tag == "div" and "job-snippet" in classes:
+                    description_elem = node
+                elif date_elem is None and node.tag == "span" and "date" in classes:
+                    date_elem = node
+            
             # Titre
-            title_elem = element.find("h2", class_="jobTitle")
-            if not title_elem:
+            if title_elem is None:
                 return None
-            title = title_elem.get_text(strip=True)
+            title = get_text(title_elem)
             
             # Entreprise
-            company_elem = element.find("span", {"data-testid": "company-name"})
-            company = company_elem.get_text(strip=True) if company_elem else "Non spécifié"
+            company = get_text(company_elem) or "Non spécifié"
             
             # Localisation
-            location_elem = element.find("div", {"data-testid": "text-location"})
-            location = location_elem.get_text(strip=True) if location_elem else "Non spécifié"
+            location = get_text(location_elem) or "Non spécifié"
             
             # URL
-            link_elem = title_elem.find("a")
-            if not link_elem or not link_elem.get("href"):
+            link_elem = title_elem.find(".//a")
+            if link_elem is None or not link_elem.get("href"):
                 return None
-            job_url = self.base_url + link_elem["href"]
+            job_url = self.base_url + link_elem.get("href")
             
             # Description courte
-            description_elem = element.find("div", class_="job-snippet")
-            description = description_elem.get_text(strip=True) if description_elem else ""
+            description = get_text(description_elem)
+            
+            # Date de publication
+            posted_date = parse_posted_date(get_text(date_elem)) if date_elem is not None else None
             
             # Type de contrat (essayer de détecter dans le texte)
-            full_text = element.get_text().upper()
+            full_text = element.text_content().upper()
             contract_type = "Non spécifié"
             if "CDI" in full_text:
                 contract_type = "CDI"
@@ -146,8 +214,10 @@ class IndeedScraper(BaseScraper):
                 description=description,
                 requirements="",
                 url=job_url,
+                job_key=link_elem.get("data-jk") or self.extract_job_key(element) or "",
                 source="indeed",
                 language="fr",  # Sera détecté par le filtre
+                posted_date=posted_date,
                 application_type="form",  # Indeed utilise généralement des formulaires
                 application_url=job_url,
                 scraped_at=datetime.now()
@@ -1,24 +1,113 @@
-from typing import List
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, List
 from loguru import logger
-from langdetect import detect
 
 from utils.models import JobOffer
 from utils.ai_helper import AIHelper
+from .keyword_matcher import KeywordMatcher
+from .domain_classifier import DomainClassifier
+from .language_detector import get_language_detector
 from config import (
     LOCATION_KEYWORDS,
     CONTRACT_TYPES,
     EXCLUDE_KEYWORDS,
+    DOMAIN_TITLE_KEYWORDS,
+    DOMAIN_MODEL_ENABLED,
+    DOMAIN_BATCH_SIZE,
+    DOMAIN_BATCH_MAX_TOKENS,
     OPENAI_API_KEY
 )
 
 
+# Les règles sont réordonnées toutes les REORDER_EVERY offres examinées
+REORDER_EVERY = 50
+
+# Offres examinées avant de remplacer l'estimation de coût d'une règle par sa mesure
+MIN_MEASURED_OFFERS = 20
+
+
+@dataclass
+class FilterRule:
+    """Critère de filtrage, avec son coût estimé et les mesures de son exécution"""
+    
+    name: str
+    check: Callable[[JobOffer], bool]
+    cost_estimate: float  # secondes par offre, avant mesure
+    external: bool = False  # peut appeler un service externe (IA): toujours après les règles locales
+    examined: int = 0
+    rejected: int = 0
+    seconds: float = 0.0
+    
+    @property
+    def cost(self) -> float:
+        """Coût moyen par offre (mesuré, ou estimé tant que les mesures sont trop peu nombreuses)"""
+        if self.examined < MIN_MEASURED_OFFERS:
+            return self.cost_estimate
+        return self.seconds / self.examined
+    
+    @property
+    def rejection_rate(self) -> float:
+        """Part des offres rejetées (lissée: 1/2 sans mesure)"""
+        return (self.rejected + 1) / (self.examined + 2)
+    
+    @property
+    def rank(self) -> float:
+        """Coût par offre rejetée: les règles les moins chères et les plus sélectives d'abord"""
+        return self.cost / self.rejection_rate
+
+
 class JobFilter:
     """Filtre les offres d'emploi selon les critères définis"""
     
     def __init__(self):
         self.ai_helper = AIHelper(api_key=OPENAI_API_KEY)
+        
+        # Listes de mots-clés compilées une fois (une seule passe par champ de texte)
+        self.location_matcher = KeywordMatcher(LOCATION_KEYWORDS)
+        self.exclude_matcher = KeywordMatcher(EXCLUDE_KEYWORDS)
+        self.domain_matcher = KeywordMatcher(DOMAIN_TITLE_KEYWORDS)
+        
+        # Détecteur de langue partagé (profils chargés une fois, résultats mémorisés)
+        self.language_detector = get_language_detector()
+        
+        # Classifieur local consulté avant l'IA (None si désactivé)
+        self.domain_classifier = DomainClassifier() if DOMAIN_MODEL_ENABLED else None
+        
+        # Verdicts de domaine obtenus à l'avance par prefetch_domains (id de l'offre -> verdict)
+        self._domain_verdicts = {}
+        
+        # Résultats des règles déjà évalués par prefetch_domains (id de l'offre -> {règle: résultat})
+        self._rule_outcomes = {}
+        
+        # Critères, réordonnés selon leur coût et leur sélectivité mesurés
+        self.rules: List[FilterRule] = []
+        self.register_rule("location", self.check_location, cost_estimate=5e-6)
+        self.register_rule("contract_type", self.check_contract_type, cost_estimate=2e-6)
+        self.register_rule("exclusions", self.check_exclusions, cost_estimate=2e-5)
+        self.register_rule("language", self.check_language, cost_estimate=5e-4)
+        self.register_rule("domain", self.check_domain, cost_estimate=1.0, external=True)
+        self._examined = 0
+        self._run_stats = {}
         logger.info("JobFilter initialized")
     
+    def register_rule(self, name: str, check: Callable[[JobOffer], bool], cost_estimate: float, external: bool = False):
+        """
+        Ajoute un critère de filtrage
+        
+        Args:
+            name: Nom de la règle (télémétrie)
+            check: Fonction retournant True si l'offre passe le critère
+            cost_estimate: Coût estimé par offre en secondes (remplacé par la mesure)
+            external: True si la règle peut appeler un service externe (exécutée après les règles locales)
+        """
+        self.rules.append(FilterRule(name=name, check=check, cost_estimate=cost_estimate, external=external))
+        self.reorder_rules()
+    
+    def reorder_rules(self):
+        """Trie les règles: locales puis externes, chacune par coût par offre rejetée croissant"""
+        self.rules.sort(key=lambda rule: (rule.external, rule.rank))
+    
     def filter_offers(self, offers: List[JobOffer]) -> List[JobOffer]:
         """
         Filtre une liste d'offres selon tous les critères
@@ -29,41 +118,111 @@ class JobFilter:
         Returns:
             Liste d'offres filtrées
         """
-        filtered = []
+        self.prefetch_domains(offers)
+        return list(self.filter_stream(offers))
+    
+    def filter_stream(self, offers: Iterable[JobOffer]) -> Iterator[JobOffer]:
+        """
+        Filtre un flux d'offres au fil de l'eau (chaque offre acceptée est
+        transmise avant la lecture de la suivante)
         
-        for offer in offers:
-            logger.debug(f"Filtering offer: {offer.title} at {offer.company}")
-            
-            # Vérifier chaque critère
-            if not self.check_location(offer):
-                logger.debug(f"Rejected: location '{offer.location}' not matching")
-                continue
-            
-            if not self.check_contract_type(offer):
-                logger.debug(f"Rejected: contract type '{offer.contract_type}' not matching")
-                continue
-            
-            if not self.check_exclusions(offer):
-                logger.debug(f"Rejected: contains excluded keywords")
-                continue
-            
-            if not self.check_domain(offer):
-                logger.debug(f"Rejected: not in communication/événementiel domain")
-                continue
-            
-            # Détecter la langue
-            offer.language = self.detect_language(offer)
+        Args:
+            offers: Offres à filtrer (liste ou générateur alimenté par le scraping)
             
-            # Accepter seulement français et anglais
-            if offer.language not in ["fr", "en"]:
-                logger.debug(f"Rejected: language '{offer.language}' not supported")
-                continue
+        Yields:
+            Offres acceptées
+        """
+        total = 0
+        accepted = 0
+        try:
+            for offer in offers:
+                total += 1
+                if self.accept_offer(offer):
+                    accepted += 1
+                    yield offer
+        finally:
+            # Offres préfiltrées mais jamais lues (flux interrompu)
+            self._rule_outcomes.clear()
+            self._domain_verdicts.clear()
+        
+        logger.info(f"Filtered {accepted}/{total} offers")
+        self.log_rule_stats()
+        self._run_stats = {}
+        if self.domain_classifier:
+            self.domain_classifier.log_stats()
+        if self.ai_helper.verdict_cache:
+            self.ai_helper.verdict_cache.log_stats()
+    
+    def accept_offer(self, offer: JobOffer) -> bool:
+        """
+        Applique tous les critères à une offre (et renseigne sa langue)
+        
+        Les critères sont évalués dans l'ordre courant des règles et s'arrêtent au
+        premier rejet; leur durée et leurs rejets sont mesurés pour l'ordre suivant.
+        Les résultats déjà obtenus par prefetch_domains sont réutilisés.
+        
+        Args:
+            offer: Offre à vérifier
             
-            logger.info(f"✓ Offer accepted: {offer.title} at {offer.company}")
-            filtered.append(offer)
+        Returns:
+            True si l'offre est acceptée
+        """
+        logger.debug(f"Filtering offer: {offer.title} at {offer.company}")
+        
+        outcomes = self._rule_outcomes.pop(offer.id, {})
+        passed = True
+        for rule in self.rules:
+            passed = outcomes[rule.name] if rule.name in outcomes else self._evaluate_rule(rule, offer)
+            if not passed:
+                logger.debug(f"Rejected by rule '{rule.name}'")
+                break
         
-        logger.info(f"Filtered {len(filtered)}/{len(offers)} offers")
-        return filtered
+        self._domain_verdicts.pop(offer.id, None)
+        self._examined += 1
+        if self._examined % REORDER_EVERY == 0:
+            self.reorder_rules()
+        
+        if not passed:
+            return False
+        
+        logger.info(f"✓ Offer accepted: {offer.title} at {offer.company}")
+        return True
+    
+    def _evaluate_rule(self, rule: FilterRule, offer: JobOffer) -> bool:
+        """
+        Évalue une règle sur une offre en mesurant sa durée et son résultat
+        
+        Args:
+            rule: Règle à évaluer
+            offer: Offre à vérifier
+        
+        Returns:
+            True si l'offre passe la règle
+        """
+        start = time.perf_counter()
+        passed = rule.check(offer)
+        elapsed = time.perf_counter() - start
+        
+        rule.examined += 1
+        rule.seconds += elapsed
+        run_stats = self._run_stats.setdefault(rule.name, [0, 0, 0.0])
+        run_stats[0] += 1
+        run_stats[2] += elapsed
+        if not passed:
+            rule.rejected += 1
+            run_stats[1] += 1
+        return passed
+    
+    def log_rule_stats(self):
+        """Écrit la télémétrie des règles de la dernière exécution, dans l'ordre courant"""
+        lines = [f"{'rule':<14} {'examined':>9} {'rejected':>9} {'time ms':>9} {'µs/offer':>9}"]
+        for rule in self.rules:
+            examined, rejected, seconds = self._run_stats.get(rule.name, [0, 0, 0.0])
+            lines.append(
+                f"{rule.name:<14} {examined:9d} {rejected:9d} {seconds * 1000:9.1f} "
+                f"{(seconds / examined * 1e6 if examined else 0):9.1f}"
+            )
+        logger.info("Filter rules:\n" + "\n".join(lines))
     
     def check_location(self, offer: JobOffer) -> bool:
         """
@@ -75,13 +234,10 @@ class JobFilter:
         Returns:
             True si localisation OK, False sinon
         """
-        location_lower = offer.location.lower()
-        
-        for keyword in LOCATION_KEYWORDS:
-            if keyword in location_lower:
-                return True
-        
-        return False
+        keyword = self.location_matcher.search(offer.location)
+        if keyword:
+            logger.debug(f"Location matched '{keyword}'")
+        return keyword is not None
     
     def check_contract_type(self, offer: JobOffer) -> bool:
         """
@@ -115,11 +271,10 @@ class JobFilter:
         Returns:
             True si pas d'exclusions, False si exclusions trouvées
         """
-        # Combiner titre et description
-        full_text = f"{offer.title} {offer.description}".lower()
-        
-        for keyword in EXCLUDE_KEYWORDS:
-            if keyword in full_text:
+        for field in (offer.title, offer.description):
+            keyword = self.exclude_matcher.search(field)
+            if keyword:
+                logger.debug(f"Excluded keyword matched: '{keyword}'")
                 return False
         
         return True
@@ -134,21 +289,21 @@ class JobFilter:
         Returns:
             True si domaine OK, False sinon
         """
-        # Vérification rapide par mots-clés
-        title_lower = offer.title.lower()
-        desc_lower = offer.description.lower()
+        # Vérification rapide par mots-clés: un mot-clé dans le titre suffit
+        keyword = self.domain_matcher.search(offer.title)
+        if keyword:
+            logger.debug(f"Domain keyword matched in title: '{keyword}'")
+            return True
         
-        domain_keywords = [
-            "communication", "événementiel", "event", "marketing",
-            "chargé de communication", "chargée de communication",
-            "event manager", "project manager", "coordinateur",
-            "coordinatrice", "relations publiques", "rp"
-        ]
+        # Verdict déjà obtenu par une classification groupée
+        if offer.id in self._domain_verdicts:
+            return self._domain_verdicts.pop(offer.id)
         
-        # Si un mot-clé est dans le titre, accepter directement
-        for keyword in domain_keywords:
-            if keyword in title_lower:
-                return True
+        # Puis le classifieur local, s'il est assez confiant
+        if self.domain_classifier:
+            verdict = self.domain_classifier.predict(offer)
+            if verdict is not None:
+                return verdict
         
         # Sinon, utiliser l'AI pour une analyse plus fine
         try:
@@ -156,14 +311,86 @@ class JobFilter:
                 job_title=offer.title,
                 job_description=offer.description
             )
+            if self.domain_classifier:
+                self.domain_classifier.record_verdict(offer, is_relevant)
             return is_relevant
         except Exception as e:
             logger.error(f"Error in AI domain detection: {e}")
             # En cas d'erreur AI, vérifier dans la description
-            for keyword in domain_keywords:
-                if keyword in desc_lower:
-                    return True
-            return False
+            return self.domain_matcher.search(offer.description) is not None
+    
+    def prefetch_domains(self, offers: List[JobOffer]):
+        """
+        Classe à l'avance le domaine des offres qui auront besoin de l'IA
+        
+        Les offres passant les critères locaux (lieu, contrat, exclusions, langue) sans
+        mot-clé de titre ni verdict confiant du classifieur local sont envoyées
+        ensemble à l'IA (requêtes groupées) au lieu d'une requête par offre dans
+        check_domain. Les résultats des règles locales sont conservés pour accept_offer.
+        
+        Args:
+            offers: Offres sur le point d'être filtrées (ex: une page de résultats)
+        """
+        pending = []
+        for offer in offers:
+            if offer.id in self._domain_verdicts:
+                continue
+            if not self._prefilter(offer):
+                continue
+            if self.domain_matcher.search(offer.title):
+                continue
+            if self.domain_classifier:
+                verdict = self.domain_classifier.predict(offer)
+                if verdict is not None:
+                    self._domain_verdicts[offer.id] = verdict
+                    continue
+            pending.append(offer)
+        
+        # Une offre seule n'y gagne rien: check_domain s'en charge
+        if len(pending) < 2:
+            return
+        
+        try:
+            verdicts = self.ai_helper.detect_job_domains(
+                [(offer.title, offer.description) for offer in pending],
+                max_prompt_tokens=DOMAIN_BATCH_MAX_TOKENS,
+                max_batch_size=DOMAIN_BATCH_SIZE
+            )
+        except Exception as e:
+            logger.error(f"Error in batch AI domain detection: {e}")
+            return
+        
+        for offer, verdict in zip(pending, verdicts):
+            if verdict is None:
+                continue
+            self._domain_verdicts[offer.id] = verdict
+            if self.domain_classifier:
+                self.domain_classifier.record_verdict(offer, verdict)
+    
+    def _prefilter(self, offer: JobOffer) -> bool:
+        """Évalue les règles locales d'une offre (jusqu'au premier rejet) et mémorise leurs résultats"""
+        outcomes = self._rule_outcomes.setdefault(offer.id, {})
+        for rule in self.rules:
+            if rule.external:
+                continue
+            if rule.name not in outcomes:
+                outcomes[rule.name] = self._evaluate_rule(rule, offer)
+            if not outcomes[rule.name]:
+                return False
+        return True
+    
+    def check_language(self, offer: JobOffer) -> bool:
+        """
+        Détecte la langue de l'offre (renseigne offer.language) et vérifie qu'elle est acceptée
+        
+        Args:
+            offer: Offre à vérifier
+        
+        Returns:
+            True si l'offre est en français ou en anglais
+        """
+        offer.language = self.detect_language(offer)
+        return offer.language in ["fr", "en"]
     
     def detect_language(self, offer: JobOffer) -> str:
         """
@@ -175,17 +402,8 @@ class JobFilter:
         Returns:
             Code langue (fr, en, etc.)
         """
-        try:
-            # Combiner titre et description pour la détection
-            text = f"{offer.title} {offer.description}"
-            
-            # Détecter la langue
-            lang = detect(text)
-            
-            logger.debug(f"Detected language: {lang} for '{offer.title}'")
-            return lang
-            
-        except Exception as e:
-            logger.error(f"Error detecting language: {e}")
-            # Par défaut, français
-            return "fr"
+        # Combiner titre et description pour la détection (seul le début est analysé)
+        lang = self.language_detector.detect(f"{offer.title} {offer.description}")
+        
+        logger.debug(f"Detected language: {lang} for '{offer.title}'")
+        return lang
@@ -0,0 +1,162 @@
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+
+# Seule la marque du pluriel est tolérée après un mot-clé ("events"): le mot-clé doit sinon
+# former un mot entier ("rp" ne correspond plus à "entreprise", ni "intern" à "interne").
+# Les formes féminines sont à lister explicitement ("chargée de communication").
+INFLECTION_SUFFIX = r"(?:s|x)?"
+
+
+def strip_accents(text: str) -> str:
+    """
+    Retire les accents et met en minuscules ("Événementiel" -> "evenementiel")
+    
+    Args:
+        text: Texte brut
+    
+    Returns:
+        Texte sans accents, en minuscules
+    """
+    return unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode("ascii").lower()
+
+
+# Lettres accentuées latines -> lettre de base ("é" -> "e"), un caractère pour un
+# caractère: les positions du texte replié restent celles du texte
+ACCENT_FOLDING = {
+    chr(code): strip_accents(chr(code))
+    for code in range(0xC0, 0x250)
+    if len(strip_accents(chr(code))) == 1
+}
+_ACCENTED = re.compile("[" + "".join(ACCENT_FOLDING) + "]")
+
+
+@lru_cache(maxsize=256)
+def fold_accents(text: str) -> str:
+    """
+    Met en minuscules et retire les accents en conservant la longueur du texte
+    
+    Mémorisé: un même champ est replié une fois pour tous les matchers qui l'analysent.
+    
+    Args:
+        text: Texte brut
+    
+    Returns:
+        Texte replié ("Télétravail" -> "teletravail")
+    """
+    text = text.lower()
+    if text.isascii():
+        return text
+    return _ACCENTED.sub(lambda match: ACCENT_FOLDING[match.group()], text)
+
+
+def _keyword_regex(keyword: str) -> str:
+    """
+    Construit le motif d'un mot-clé: espaces souples, mot entier
+    
+    Args:
+        keyword: Mot-clé replié (fold_accents)
+    
+    Returns:
+        Motif regex à appliquer au texte replié
+    """
+    parts = []
+    for char in keyword:
+        if char.isspace():
+            if parts[-1] != r"[\W_]+":
+                parts.append(r"[\W_]+")
+        else:
+            parts.append(re.escape(char))
+    return r"(?<!\w)" + "".join(parts) + INFLECTION_SUFFIX + r"(?!\w)"
+
+
+def _anchor(keyword: str) -> str:
+    """
+    Choisit la sous-chaîne du mot-clé recherchée avant toute vérification
+    
+    C'est le premier mot du mot-clé replié ("événementiel" -> "evenementiel"),
+    recherché dans le texte replié lui aussi: les accents sont ignorés dans les
+    deux sens, et le motif du mot-clé se vérifie à la position de l'ancre.
+    
+    Args:
+        keyword: Mot-clé replié (fold_accents)
+    
+    Returns:
+        Premier mot du mot-clé
+    """
+    return keyword.split(" ")[0]
+
+
+class KeywordMatcher:
+    """
+    Recherche compilée d'une liste de mots-clés (accents et casse ignorés, mots entiers)
+    
+    Le texte est replié une fois (minuscules, sans accents, même longueur), puis
+    chaque mot-clé est localisé par recherche de sous-chaîne (str.find, en C) sur
+    son ancre; l'expression régulière du mot-clé n'est appliquée qu'aux positions
+    candidates pour vérifier les limites de mots.
+    """
+    
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Compile les mots-clés
+        
+        Args:
+            keywords: Mots-clés (tels que configurés dans settings.py)
+        """
+        self.keywords: Dict[str, str] = {}
+        for keyword in keywords:
+            keyword = " ".join((keyword or "").lower().split())
+            if keyword:
+                self.keywords.setdefault(fold_accents(keyword), keyword)
+        
+        self._entries = []
+        for normalized, keyword in self.keywords.items():
+            self._entries.append((_anchor(normalized), re.compile(_keyword_regex(normalized)), keyword))
+    
+    def _matches(self, text: str, entry) -> bool:
+        """Vérifie un mot-clé à chaque occurrence de son ancre"""
+        anchor, pattern, _ = entry
+        position = text.find(anchor)
+        while position >= 0:
+            if pattern.match(text, position):
+                return True
+            position = text.find(anchor, position + 1)
+        return False
+    
+    def search(self, text: str) -> Optional[str]:
+        """
+        Cherche le premier mot-clé (dans l'ordre de la configuration) présent dans un texte
+        
+        Args:
+            text: Texte à analyser
+        
+        Returns:
+            Mot-clé trouvé (tel que configuré, en minuscules) ou None
+        """
+        if not text:
+            return None
+        
+        text = fold_accents(text)
+        for entry in self._entries:
+            if self._matches(text, entry):
+                return entry[2]
+        return None
+    
+    def find_all(self, text: str) -> List[str]:
+        """
+        Liste les mots-clés présents dans un texte
+        
+        Args:
+            text: Texte à analyser
+        
+        Returns:
+            Mots-clés trouvés (tels que configurés, en minuscules), dans l'ordre de la configuration
+        """
+        if not text:
+            return []
+        
+        text = fold_accents(text)
+        return [entry[2] for entry in self._entries if self._matches(text, entry)]
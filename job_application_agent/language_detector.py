@@ -0,0 +1,142 @@
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
+import langdetect
+from loguru import logger
+
+from config import LANGUAGE_CANDIDATES, LANGUAGE_PREFIX_CHARS
+
+
+# Profils de fréquences de n-grammes de caractères fournis avec langdetect
+PROFILES_DIR = Path(langdetect.__file__).parent / "profiles"
+
+# Lissage des n-grammes absents du profil d'une langue (fréquence ajoutée)
+SMOOTHING = 0.5
+
+# Nombre de textes mémorisés (empreinte du texte analysé -> langue)
+CACHE_SIZE = 10_000
+
+DEFAULT_LANGUAGE = "fr"
+
+
+def _ngrams(text: str) -> List[str]:
+    """N-grammes de 1 à 3 caractères de chaque mot, bornés par des espaces (" le", "le ")"""
+    grams = []
+    for word in re.findall(r"[^\W\d_]+", text.lower()):
+        padded = f" {word} "
+        grams.extend(padded[1:-1])
+        grams.extend(padded[i:i + 2] for i in range(len(padded) - 1))
+        grams.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class LanguageDetector:
+    """
+    Détection de langue par modèle bayésien naïf sur n-grammes de caractères
+    
+    Utilise les profils de langdetect, mais sans son échantillonnage aléatoire:
+    le résultat est déterministe, calculé sur un préfixe borné du texte et
+    mémorisé par empreinte du contenu.
+    """
+    
+    def __init__(
+        self,
+        languages: List[str] = LANGUAGE_CANDIDATES,
+        prefix_chars: int = LANGUAGE_PREFIX_CHARS,
+        cache_size: int = CACHE_SIZE
+    ):
+        """
+        Charge les profils et construit la matrice des log-probabilités
+        
+        Args:
+            languages: Langues candidates (codes des profils langdetect)
+            prefix_chars: Nombre de caractères analysés au début du texte
+            cache_size: Nombre de résultats mémorisés
+        """
+        self.prefix_chars = prefix_chars
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+        profiles = {}
+        for language in languages:
+            try:
+                profiles[language] = json.loads((PROFILES_DIR / language).read_text(encoding="utf-8"))
+            except OSError:
+                logger.warning(f"No language profile for '{language}', ignored")
+        self.languages = list(profiles)
+        
+        # Vocabulaire commun (n-grammes en minuscules) et log P(n-gramme | langue)
+        self.vocabulary: Dict[str, int] = {}
+        counts: Dict[str, Dict[str, float]] = {}
+        for language, profile in profiles.items():
+            for gram, count in profile["freq"].items():
+                gram = gram.lower()
+                self.vocabulary.setdefault(gram, len(self.vocabulary))
+                counts.setdefault(gram, {})
+                counts[gram][language] = counts[gram].get(language, 0) + count
+        
+        self.log_probabilities = np.zeros((len(self.vocabulary), len(self.languages)), dtype=np.float32)
+        for gram, index in self.vocabulary.items():
+            for column, language in enumerate(self.languages):
+                total = profiles[language]["n_words"][len(gram) - 1]
+                self.log_probabilities[index, column] = np.log((counts[gram].get(language, 0) + SMOOTHING) / total)
+    
+    def _classify(self, text: str) -> Optional[str]:
+        """Langue la plus probable, ou None si aucun n-gramme n'est connu"""
+        indices = [self.vocabulary[gram] for gram in _ngrams(text) if gram in self.vocabulary]
+        if not indices or not self.languages:
+            return None
+        
+        scores = self.log_probabilities[np.asarray(indices)].sum(axis=0)
+        return self.languages[int(np.argmax(scores))]
+    
+    def detect(self, text: str) -> str:
+        """
+        Détecte la langue d'un texte
+        
+        Args:
+            text: Texte (seuls les prefix_chars premiers caractères sont analysés)
+        
+        Returns:
+            Code langue (fr, en...), DEFAULT_LANGUAGE si le texte ne permet pas de conclure
+        """
+        prefix = (text or "")[:self.prefix_chars]
+        key = hashlib.blake2b(prefix.encode("utf-8"), digest_size=16).digest()
+        
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        
+        language = self._classify(prefix) or DEFAULT_LANGUAGE
+        
+        with self._lock:
+            self._cache[key] = language
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return language
+
+
+_language_detector: Optional[LanguageDetector] = None
+_language_detector_lock = threading.Lock()
+
+
+def get_language_detector() -> LanguageDetector:
+    """
+    Retourne le détecteur partagé (profils chargés une seule fois par processus)
+    
+    Returns:
+        Instance unique de LanguageDetector configurée depuis settings.py
+    """
+    global _language_detector
+    
+    with _language_detector_lock:
+        if _language_detector is None:
+            _language_detector = LanguageDetector()
+        return _language_detector
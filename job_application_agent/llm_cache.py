@@ -0,0 +1,231 @@
+"""
+Cache persistant des complétions de l'IA (analyse d'offre, CV optimisé, lettre de motivation)
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from loguru import logger
+
+from config import (
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_PATH,
+    LLM_CACHE_TTL_DAYS,
+    LLM_CACHE_MAX_SIZE_MB
+)
+
+
+def make_completion_key(
+    model: str,
+    system_message: str,
+    prompt: str,
+    temperature: float,
+    max_tokens: Optional[int],
+    response_format: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Calcule la clé d'une requête: SHA-256 de tous les paramètres qui déterminent la réponse
+    
+    Args:
+        model: Modèle interrogé
+        system_message: Message système
+        prompt: Prompt utilisateur
+        temperature: Température
+        max_tokens: Nombre maximum de tokens
+        response_format: Format de réponse imposé
+    
+    Returns:
+        Clé hexadécimale
+    """
+    content = json.dumps(
+        [model, system_message, prompt, temperature, max_tokens, response_format],
+        ensure_ascii=False,
+        sort_keys=True
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class CompletionCache:
+    """Cache SQLite des complétions, avec TTL, éviction LRU par taille et statistiques de tokens économisés"""
+    
+    def __init__(self, db_path: Path, ttl_days: float = 30, max_size_mb: float = 50):
+        """
+        Initialise le cache
+        
+        Args:
+            db_path: Fichier SQLite du cache
+            ttl_days: Durée de validité d'une complétion
+            max_size_mb: Taille maximale du cache (éviction des entrées les moins utilisées)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 24 * 3600
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.stats = {"hits": 0, "misses": 0, "stored": 0, "evicted": 0, "saved_prompt_tokens": 0, "saved_completion_tokens": 0}
+        self._lock = threading.Lock()
+        self._init_database()
+    
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+    
+    def _init_database(self):
+        """Crée la table du cache"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS completion_cache (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                content TEXT NOT NULL,
+                prompt_tokens INTEGER NOT NULL,
+                completion_tokens INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        ''')
+        
+        conn.commit()
+        conn.close()
+        self.evict()
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Récupère une complétion encore valide
+        
+        Args:
+            key: Clé de la requête (make_completion_key)
+        
+        Returns:
+            Contenu de la réponse, ou None s'il faut interroger l'IA
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT content, prompt_tokens, completion_tokens FROM completion_cache
+            WHERE key = ? AND stored_at >= ?
+        ''', (key, time.time() - self.ttl_seconds))
+        row = cursor.fetchone()
+        
+        if row:
+            cursor.execute("UPDATE completion_cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+        
+        conn.close()
+        
+        with self._lock:
+            if row:
+                self.stats["hits"] += 1
+                self.stats["saved_prompt_tokens"] += row[1]
+                self.stats["saved_completion_tokens"] += row[2]
+            else:
+                self.stats["misses"] += 1
+        return row[0] if row else None
+    
+    def store(self, key: str, model: str, content: str, prompt_tokens: int = 0, completion_tokens: int = 0):
+        """
+        Enregistre une complétion
+        
+        Args:
+            key: Clé de la requête (make_completion_key)
+            model: Modèle ayant répondu
+            content: Contenu de la réponse
+            prompt_tokens: Tokens du prompt facturés (usage de la réponse)
+            completion_tokens: Tokens de la réponse facturés
+        """
+        now = time.time()
+        
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT OR REPLACE INTO completion_cache (
+                key, model, content, prompt_tokens, completion_tokens, size, stored_at, accessed_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (key, model, content, prompt_tokens, completion_tokens, len(content.encode("utf-8")), now, now))
+        conn.commit()
+        conn.close()
+        
+        with self._lock:
+            self.stats["stored"] += 1
+        self.evict()
+    
+    def evict(self):
+        """Supprime les complétions expirées puis les moins utilisées si le cache est trop gros"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute(
+            "DELETE FROM completion_cache WHERE stored_at < ?",
+            (time.time() - self.ttl_seconds,)
+        )
+        evicted = cursor.rowcount
+        
+        cursor.execute("SELECT COALESCE(SUM(size), 0) FROM completion_cache")
+        total_size = cursor.fetchone()[0]
+        
+        if total_size > self.max_size_bytes:
+            cursor.execute("SELECT key, size FROM completion_cache ORDER BY accessed_at ASC")
+            to_delete = []
+            for key, size in cursor.fetchall():
+                if total_size <= self.max_size_bytes:
+                    break
+                to_delete.append((key,))
+                total_size -= size
+            cursor.executemany("DELETE FROM completion_cache WHERE key = ?", to_delete)
+            evicted += len(to_delete)
+        
+        conn.commit()
+        conn.close()
+        
+        if evicted:
+            with self._lock:
+                self.stats["evicted"] += evicted
+            logger.debug(f"Completion cache: evicted {evicted} entries")
+    
+    def log_stats(self):
+        """Écrit les statistiques du cache dans les logs (taux de succès et tokens économisés)"""
+        with self._lock:
+            stats = dict(self.stats)
+        
+        lookups = stats["hits"] + stats["misses"]
+        if not lookups:
+            return
+        logger.info(
+            f"Completion cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hits'] / lookups * 100:.0f}% served from cache), "
+            f"{stats['saved_prompt_tokens']} prompt + {stats['saved_completion_tokens']} completion tokens saved, "
+            f"{stats['evicted']} evicted"
+        )
+
+
+_completion_cache: Optional[CompletionCache] = None
+_completion_cache_lock = threading.Lock()
+
+
+def get_completion_cache() -> Optional[CompletionCache]:
+    """
+    Retourne le cache de complétions partagé (None si désactivé via LLM_CACHE_ENABLED)
+    
+    Returns:
+        Instance unique de CompletionCache ou None
+    """
+    global _completion_cache
+    
+    if not LLM_CACHE_ENABLED:
+        return None
+    
+    with _completion_cache_lock:
+        if _completion_cache is None:
+            _completion_cache = CompletionCache(
+                db_path=LLM_CACHE_PATH,
+                ttl_days=LLM_CACHE_TTL_DAYS,
+                max_size_mb=LLM_CACHE_MAX_SIZE_MB
+            )
+        return _completion_cache
@@ -8,8 +8,11 @@ Ce script automatise le processus complet de recherche d'emploi et de candidatur
 """
 
 import sys
+import asyncio
+import itertools
+import threading
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Optional
 from loguru import logger
 
 # Ajouter le répertoire parent au path
@@ -20,12 +23,25 @@ from config import (
     DRY_RUN,
     MAX_OFFERS_PER_RUN,
     ENABLED_SCRAPERS,
-    LOGS_DIR
+    LOGS_DIR,
+    ENRICH_OFFER_DETAILS,
+    DUPLICATE_DETECTION,
+    STREAM_QUEUE_SIZE,
+    LLM_CONCURRENCY
 )
 from utils.logger import setup_logger
 from utils.models import JobOffer, ApplicationResult
-from scrapers import get_scraper
+from scrapers.registry import get_scraper, run_scrapers
+from scrapers.offer_enricher import OfferEnricher
+from utils.http_session import get_session_pool
+from utils.driver_pool import get_driver_pool
+from utils.response_cache import get_response_cache
+from utils.ai_helper import AsyncAIHelper
+from utils.llm_cache import get_completion_cache
+from utils.resilience import get_resilience
+from utils.streaming import BoundedStream, process_concurrently
 from filters import JobFilter
+from filters.duplicate_detector import DuplicateDetector
 from cv_generator import CVGenerator
 from cover_letter import CoverLetterGenerator
 from email_manager import EmailSender
@@ -45,11 +61,16 @@ class JobApplicationAgent:
         
         # Initialiser les composants
         self.job_filter = JobFilter()
-        self.cv_generator = CVGenerator()
-        self.cover_letter_generator = CoverLetterGenerator()
+        self.duplicate_detector = DuplicateDetector()
+        # Un seul client IA: CV et lettres partagent les limites LLM_RPM_LIMIT / LLM_TPM_LIMIT
+        self.ai_helper = AsyncAIHelper()
+        self.cv_generator = CVGenerator(ai_helper=self.ai_helper)
+        self.cover_letter_generator = CoverLetterGenerator(ai_helper=self.ai_helper)
         self.email_sender = EmailSender()
         self.database = ApplicationDatabase()
+        self.offer_enricher = OfferEnricher()
         self.exporter = ApplicationExporter()
+        self.offers_scraped = 0
         
         logger.info("All components initialized successfully")
     
@@ -58,43 +79,26 @@ class JobApplicationAgent:
         logger.info("Starting job application automation process")
         
         try:
-            # 1. Scraping des offres
-            logger.info("Step 1: Scraping job offers")
-            all_offers = self._scrape_offers()
-            logger.info(f"Total offers scraped: {len(all_offers)}")
+            # 1-3. Scraping, filtrage et traitement en flux: les premières offres
+            # qualifiées sont traitées pendant que les sources sont encore scrapées
+            logger.info("Steps 1-3: Scraping, filtering and processing offers as they stream in")
+            results = self._process_offers(self._filter_offers(self._scrape_offers()))
             
-            if not all_offers:
+            # Appels à l'IA évités grâce au cache de complétions
+            completion_cache = get_completion_cache()
+            if completion_cache:
+                completion_cache.log_stats()
+            
+            logger.info(f"Total offers scraped: {self.offers_scraped}")
+            
+            if not self.offers_scraped:
                 logger.warning("No offers found. Exiting.")
                 return
             
-            # 2. Filtrage des offres
-            logger.info("Step 2: Filtering job offers")
-            filtered_offers = self._filter_offers(all_offers)
-            logger.info(f"Offers after filtering: {len(filtered_offers)}")
-            
-            if not filtered_offers:
+            if not results:
                 logger.warning("No offers passed filters. Exiting.")
                 return
             
-            # 3. Traitement de chaque offre
-            logger.info("Step 3: Processing qualified offers")
-            results = []
-            
-            for i, offer in enumerate(filtered_offers, 1):
-                logger.info(f"Processing offer {i}/{len(filtered_offers)}: {offer.title} at {offer.company}")
-                
-                try:
-                    result = self._process_offer(offer)
-                    results.append(result)
-                    
-                    # Sauvegarder dans la base de données
-                    self.database.save_application(result)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing offer: {e}")
-                    self.database.log_error(offer.id, "processing_error", str(e))
-                    continue
-            
             # 4. Génération du rapport
             logger.info("Step 4: Generating report")
             self._generate_report(results)
@@ -108,62 +112,148 @@ class JobApplicationAgent:
             logger.error(f"Fatal error in main process: {e}")
             raise
     
-    def _scrape_offers(self) -> List[JobOffer]:
-        """Scrape les offres depuis toutes les sources activées"""
-        all_offers = []
+    def _scrape_offers(self) -> Iterator[List[JobOffer]]:
+        """Scrape les offres depuis toutes les sources activées, page par page"""
+        # Les sources tournent en arrière-plan (HTTP en parallèle, Selenium selon le pool) et
+        # alimentent un flux borné: le scraping se met en pause si le traitement prend du retard
+        stream = BoundedStream(maxsize=STREAM_QUEUE_SIZE)
         
-        for scraper_name in ENABLED_SCRAPERS:
-            logger.info(f"Scraping from: {scraper_name}")
-            
+        def produce():
             try:
-                scraper = get_scraper(scraper_name)
-                
-                with scraper:
-                    offers = scraper.scrape(max_offers=MAX_OFFERS_PER_RUN)
-                    logger.info(f"Found {len(offers)} offers from {scraper_name}")
-                    
-                    # Sauvegarder les offres dans la base
-                    for offer in offers:
-                        self.database.save_job_offer(offer)
-                    
-                    all_offers.extend(offers)
+                run_scrapers(ENABLED_SCRAPERS, lambda scraper_name: self._scrape_source(scraper_name, stream))
+            finally:
+                stream.finish()
+                self._finish_scraping()
+        
+        producer = threading.Thread(target=produce, name="scraping", daemon=True)
+        producer.start()
+        
+        try:
+            yield from stream
+        finally:
+            stream.close()
+            producer.join()
+    
+    def _finish_scraping(self):
+        """Journalise les statistiques de scraping et ferme les navigateurs du pool"""
+        # Statistiques de réutilisation des connexions HTTP, des retries/circuits et du cache
+        get_session_pool().log_stats()
+        get_resilience().log_stats()
+        response_cache = get_response_cache()
+        if response_cache:
+            response_cache.log_stats()
+        if ENRICH_OFFER_DETAILS:
+            self.offer_enricher.log_stats()
+        
+        # Fermer les navigateurs restés ouverts dans le pool
+        driver_pool = get_driver_pool()
+        driver_pool.log_stats()
+        driver_pool.close_all()
+    
+    def _scrape_source(self, scraper_name: str, stream: BoundedStream) -> int:
+        """Scrape une source et transmet ses offres enrichies page par page (exécuté en parallèle des autres sources)"""
+        logger.info(f"Scraping from: {scraper_name}")
+        found = 0
+        
+        try:
+            scraper = get_scraper(scraper_name)
+            
+            with scraper:
+                for offers in scraper.iter_offer_batches(max_offers=MAX_OFFERS_PER_RUN):
+                    # Compléter les nouvelles offres avec leur page de détail
+                    if ENRICH_OFFER_DETAILS:
+                        offers = self.offer_enricher.enrich(scraper, offers, exists=self.database.job_offer_exists)
                     
-            except Exception as e:
-                logger.error(f"Error scraping from {scraper_name}: {e}")
-                self.database.log_error(None, "scraping_error", f"{scraper_name}: {str(e)}")
-                continue
+                    found += len(offers)
+                    if not stream.put(offers):
+                        break
+            
+            logger.info(f"Found {found} offers from {scraper_name}")
+        
+        except Exception as e:
+            logger.error(f"Error scraping from {scraper_name}: {e}")
+            self.database.log_error(None, "scraping_error", f"{scraper_name}: {str(e)}")
         
-        return all_offers
+        return found
     
-    def _filter_offers(self, offers: List[JobOffer]) -> List[JobOffer]:
-        """Filtre les offres selon les critères"""
-        # Filtrer les doublons (offres déjà traitées)
-        new_offers = [
-            offer for offer in offers
-            if not self._is_already_processed(offer)
-        ]
+    def _filter_offers(self, batches: Iterable[List[JobOffer]]) -> Iterator[JobOffer]:
+        """Filtre les offres selon les critères, au fil du scraping"""
         
-        logger.info(f"New offers (not already processed): {len(new_offers)}")
+        def new_offers() -> Iterator[JobOffer]:
+            for offers in batches:
+                self.offers_scraped += len(offers)
+                
+                # Filtrer les doublons (offres déjà traitées), puis sauvegarder les nouvelles
+                fresh = [offer for offer in offers if not self._is_already_processed(offer)]
+                for offer in fresh:
+                    self.database.save_job_offer(offer)
+                
+                logger.info(f"New offers (not already processed): {len(fresh)}/{len(offers)}")
+                
+                # Regrouper les quasi-doublons (même offre sur plusieurs sources)
+                if DUPLICATE_DETECTION and fresh:
+                    fresh = self.duplicate_detector.deduplicate(fresh)
+                
+                # Classer en une requête groupée les offres de la page qui nécessitent l'IA
+                self.job_filter.prefetch_domains(fresh)
+                
+                yield from fresh
         
         # Appliquer les filtres
-        filtered = self.job_filter.filter_offers(new_offers)
-        
-        return filtered
+        return self.job_filter.filter_stream(new_offers())
     
     def _is_already_processed(self, offer: JobOffer) -> bool:
         """Vérifie si une offre a déjà été traitée"""
         return self.database.job_offer_exists(offer)
     
-    def _process_offer(self, offer: JobOffer) -> ApplicationResult:
+    def _process_offers(self, offers: Iterable[JobOffer]) -> List[ApplicationResult]:
+        """
+        Traite les offres au fur et à mesure de leur arrivée, jusqu'à LLM_CONCURRENCY à la fois
+        
+        Returns:
+            Résultats des offres traitées sans erreur
+        """
+        counter = itertools.count(1)
+        
+        async def process(offer: JobOffer) -> Optional[ApplicationResult]:
+            logger.info(f"Processing offer {next(counter)}: {offer.title} at {offer.company}")
+            
+            try:
+                result = await self._process_offer(offer)
+                
+                # Sauvegarder dans la base de données
+                await asyncio.to_thread(self.database.save_application, result)
+                return result
+            
+            except Exception as e:
+                logger.error(f"Error processing offer: {e}")
+                await asyncio.to_thread(self.database.log_error, offer.id, "processing_error", str(e))
+                return None
+        
+        async def process_all() -> List[Optional[ApplicationResult]]:
+            try:
+                return await process_concurrently(offers, process, LLM_CONCURRENCY)
+            finally:
+                await self.ai_helper.aclose()
+        
+        results = asyncio.run(process_all())
+        return [result for result in results if result is not None]
+    
+    async def _process_offer(self, offer: JobOffer) -> ApplicationResult:
         """Traite une offre: génère CV, lettre, et envoie candidature"""
         
-        # Générer le CV optimisé
-        logger.info("Generating optimized CV")
-        cv_path = self.cv_generator.generate_optimized_cv(offer)
+        # Générer le CV optimisé et la lettre de motivation (requêtes à l'IA envoyées ensemble)
+        logger.info("Generating optimized CV and cover letter")
+        cv_path, cover_letter_path = await asyncio.gather(
+            self.cv_generator.generate_optimized_cv_async(offer),
+            self.cover_letter_generator.generate_cover_letter_async(offer)
+        )
         
-        # Générer la lettre de motivation
-        logger.info("Generating cover letter")
-        cover_letter_path = self.cover_letter_generator.generate_cover_letter(offer)
+        # Envoi SMTP bloquant: hors de la boucle asyncio
+        return await asyncio.to_thread(self._submit_application, offer, cv_path, cover_letter_path)
+    
+    def _submit_application(self, offer: JobOffer, cv_path: str, cover_letter_path: str) -> ApplicationResult:
+        """Envoie la candidature et la notification (sauf DRY_RUN)"""
         
         # Envoyer la candidature
         success = False
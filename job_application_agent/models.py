@@ -15,11 +15,13 @@ class JobOffer(BaseModel):
     description: str = Field(..., description="Description complète du poste")
     requirements: str = Field(default="", description="Exigences et qualifications")
     url: str = Field(..., description="URL de l'offre")
+    job_key: str = Field(default="", description="Identifiant de l'offre chez la source (jk Indeed, n° France Travail)")
     source: str = Field(..., description="Source de l'offre (indeed, linkedin, etc.)")
     language: str = Field(default="fr", description="Langue de l'offre (fr, en)")
     posted_date: Optional[datetime] = Field(default=None, description="Date de publication")
     application_type: str = Field(..., description="Type de candidature (email, easy_apply, form)")
     application_url: str = Field(..., description="URL ou email pour candidater")
+    application_email: str = Field(default="", description="Email de candidature lu sur la page détaillée (à confirmer, jamais utilisé pour un envoi automatique)")
     scraped_at: datetime = Field(default_factory=datetime.now, description="Date de scraping")
     
     def __init__(self, **data):
@@ -0,0 +1,183 @@
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from loguru import logger
+
+from .base_scraper import BaseScraper
+from utils.models import JobOffer
+from config import DATABASE_PATH, ENRICHMENT_WORKERS
+
+
+class OfferEnricher:
+    """Complète les offres scrapées avec leur page de détail (description complète, profil, contrat, email)"""
+    
+    def __init__(self, max_workers: int = ENRICHMENT_WORKERS, db_path: Path = DATABASE_PATH):
+        """
+        Initialise l'enrichisseur
+        
+        Args:
+            max_workers: Nombre de pages de détail téléchargées en parallèle
+            db_path: Base SQLite où sont mis en cache les détails (par job_key)
+        """
+        self.max_workers = max(1, max_workers)
+        self.db_path = db_path
+        self.stats = {"enriched": 0, "cached": 0, "skipped": 0, "failed": 0}
+        self._lock = threading.Lock()
+        self._init_database()
+    
+    def _init_database(self):
+        """Crée la table de cache des pages de détail"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS offer_details (
+                source TEXT NOT NULL,
+                job_key TEXT NOT NULL,
+                description TEXT,
+                requirements TEXT,
+                contract_type TEXT,
+                application_email TEXT,
+                fetched_at TIMESTAMP NOT NULL,
+                PRIMARY KEY (source, job_key)
+            )
+        ''')
+        
+        conn.commit()
+        conn.close()
+    
+    def _load_details(self, source: str, job_key: str) -> Optional[Dict[str, str]]:
+        """Récupère les détails déjà téléchargés pour une offre"""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        
+        cursor.execute(
+            "SELECT description, requirements, contract_type, application_email "
+            "FROM offer_details WHERE source = ? AND job_key = ?",
+            (source, job_key)
+        )
+        row = cursor.fetchone()
+        conn.close()
+        
+        return dict(row) if row else None
+    
+    def _save_details(self, source: str, job_key: str, details: Dict[str, str]):
+        """Met en cache les détails d'une offre"""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            INSERT OR REPLACE INTO offer_details (
+                source, job_key, description, requirements, contract_type,
+                application_email, fetched_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            source,
+            job_key,
+            details.get("description", ""),
+            details.get("requirements", ""),
+            details.get("contract_type", ""),
+            details.get("application_email", ""),
+            datetime.now()
+        ))
+        
+        conn.commit()
+        conn.close()
+    
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+    
+    def enrich(
+        self,
+        scraper: BaseScraper,
+        offers: List[JobOffer],
+        exists: Optional[Callable[[JobOffer], bool]] = None
+    ) -> List[JobOffer]:
+        """
+        Télécharge en parallèle les pages de détail des offres et complète leurs champs
+        
+        Args:
+            scraper: Scraper ayant produit les offres (fetch + parsing de la page de détail)
+            offers: Offres à compléter (modifiées sur place)
+            exists: Fonction indiquant si une offre est déjà en base (ignorée dans ce cas)
+        
+        Returns:
+            La liste d'offres, complétée
+        """
+        to_enrich = []
+        for offer in offers:
+            if exists and exists(offer):
+                self._count("skipped")
+            else:
+                to_enrich.append(offer)
+        
+        if not to_enrich:
+            return offers
+        
+        logger.info(f"Enriching {len(to_enrich)} {scraper.name} offers with their detail page")
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(lambda offer: self._enrich_offer(scraper, offer), to_enrich))
+        
+        return offers
+    
+    def _enrich_offer(self, scraper: BaseScraper, offer: JobOffer):
+        """Complète une offre avec les détails en cache ou téléchargés"""
+        try:
+            details = self._load_details(offer.source, offer.job_key) if offer.job_key else None
+            
+            if details is not None:
+                self._count("cached")
+            else:
+                detail_url = scraper.get_detail_url(offer)
+                if not detail_url:
+                    self._count("skipped")
+                    return
+                
+                response = scraper.fetch(detail_url)
+                details = scraper.parse_job_detail(response.content)
+                if not details:
+                    self._count("failed")
+                    return
+                
+                if offer.job_key:
+                    self._save_details(offer.source, offer.job_key, details)
+                self._count("enriched")
+            
+            self._apply_details(offer, details)
+        
+        except Exception as e:
+            logger.warning(f"Could not enrich offer '{offer.title}': {e}")
+            self._count("failed")
+    
+    def _apply_details(self, offer: JobOffer, details: Dict[str, str]):
+        """Reporte les détails sur l'offre sans écraser une information plus complète"""
+        if len(details.get("description") or "") > len(offer.description):
+            offer.description = details["description"]
+        
+        if details.get("requirements") and not offer.requirements:
+            offer.requirements = details["requirements"]
+        
+        if details.get("contract_type") and offer.contract_type == "Non spécifié":
+            offer.contract_type = details["contract_type"]
+        
+        # Adresse proposée à la confirmation humaine: le type et la cible de la candidature ne changent pas
+        if details.get("application_email") and not offer.application_email:
+            offer.application_email = details["application_email"]
+    
+    def log_stats(self):
+        """Écrit les statistiques d'enrichissement dans les logs"""
+        with self._lock:
+            stats = dict(self.stats)
+        
+        logger.info(
+            f"Offer enrichment: {stats['enriched']} fetched, {stats['cached']} from cache, "
+            f"{stats['skipped']} skipped, {stats['failed']} failed"
+        )
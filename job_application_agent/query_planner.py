@@ -0,0 +1,272 @@
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+from loguru import logger
+
+from config import (
+    DATABASE_PATH,
+    DOMAIN_KEYWORDS,
+    LOCATION_KEYWORDS,
+    QUERY_MIN_RUNS,
+    QUERY_MIN_SHARE,
+    QUERY_EXPLORE_EVERY,
+    QUERY_MAX_PER_SOURCE
+)
+
+
+# Mots-clés de localisation désignant le télétravail: une seule recherche "remote"
+REMOTE_KEYWORDS = {"remote", "télétravail", "teletravail", "distanciel", "full remote"}
+
+# Poids de la dernière exécution dans la moyenne glissante de la part d'offres uniques
+YIELD_SMOOTHING = 0.5
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    """Recherche d'un scraper: mots-clés du domaine et lieu"""
+    
+    keywords: str
+    location: str
+    
+    @property
+    def key(self) -> str:
+        """Identifiant stable de la requête (statistiques, déduplication entre requêtes)"""
+        return f"{self.keywords}|{self.location}"
+    
+    @property
+    def is_remote(self) -> bool:
+        """Recherche d'offres en télétravail (toute la France)"""
+        return self.location == "remote"
+
+
+def build_search_queries(
+    domain_keywords: List[str] = DOMAIN_KEYWORDS,
+    location_keywords: List[str] = LOCATION_KEYWORDS
+) -> List[SearchQuery]:
+    """
+    Construit les recherches candidates (mots-clés du domaine × lieux)
+    
+    Les synonymes de télétravail sont regroupés en un seul lieu "remote".
+    
+    Args:
+        domain_keywords: Mots-clés du domaine, du plus large au plus précis
+        location_keywords: Mots-clés de localisation
+    
+    Returns:
+        Recherches dans l'ordre de la configuration
+    """
+    locations = list(dict.fromkeys(
+        "remote" if location in REMOTE_KEYWORDS else location
+        for location in location_keywords if location
+    ))
+    keywords = list(dict.fromkeys(keyword for keyword in domain_keywords if keyword))
+    return [SearchQuery(keyword, location) for keyword in keywords for location in locations]
+
+
+class QueryPlanner:
+    """Ordonne et élague les recherches d'un scraper d'après leur rendement lors des exécutions précédentes"""
+    
+    def __init__(
+        self,
+        db_path: Path = DATABASE_PATH,
+        min_runs: int = QUERY_MIN_RUNS,
+        min_share: float = QUERY_MIN_SHARE,
+        explore_every: int = QUERY_EXPLORE_EVERY,
+        max_queries: int = QUERY_MAX_PER_SOURCE
+    ):
+        """
+        Initialise le planificateur
+        
+        Args:
+            db_path: Base SQLite (applications.db par défaut)
+            min_runs: Exécutions mesurées avant de pouvoir écarter une requête
+            min_share: Part moyenne d'offres uniques en dessous de laquelle une requête est écartée
+            explore_every: Une requête écartée est retentée après ce nombre d'exécutions
+            max_queries: Nombre maximum de requêtes par exécution (0 = illimité)
+        """
+        self.db_path = db_path
+        self.min_runs = min_runs
+        self.min_share = min_share
+        self.explore_every = explore_every
+        self.max_queries = max_queries
+        self._init_database()
+    
+    def _init_database(self):
+        """Crée la table des statistiques de requêtes"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS query_stats (
+                source TEXT NOT NULL,
+                query_key TEXT NOT NULL,
+                runs INTEGER NOT NULL DEFAULT 0,
+                skipped_runs INTEGER NOT NULL DEFAULT 0,
+                results_total INTEGER NOT NULL DEFAULT 0,
+                unique_total INTEGER NOT NULL DEFAULT 0,
+                unique_share REAL,
+                updated_at TIMESTAMP NOT NULL,
+                PRIMARY KEY (source, query_key)
+            )
+        ''')
+        
+        conn.commit()
+        conn.close()
+    
+    def get_stats(self, source: str) -> Dict[str, Dict[str, float]]:
+        """
+        Récupère les statistiques des requêtes d'une source
+        
+        Args:
+            source: Nom du scraper
+        
+        Returns:
+            Dictionnaire {query_key: {runs, skipped_runs, results_total, unique_total, unique_share}}
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT query_key, runs, skipped_runs, results_total, unique_total, unique_share
+            FROM query_stats WHERE source = ?
+        ''', (source,))
+        rows = cursor.fetchall()
+        conn.close()
+        
+        return {
+            row[0]: {
+                "runs": row[1],
+                "skipped_runs": row[2],
+                "results_total": row[3],
+                "unique_total": row[4],
+                "unique_share": row[5]
+            }
+            for row in rows
+        }
+    
+    def plan(self, source: str, candidates: List[SearchQuery]) -> List[SearchQuery]:
+        """
+        Sélectionne et ordonne les requêtes à exécuter
+        
+        Les requêtes jamais mesurées ou à réexplorer passent en premier (ordre de la
+        configuration), puis les autres par part d'offres uniques décroissante. Une
+        requête mesurée sur min_runs exécutions dont la part reste sous min_share est
+        écartée jusqu'à sa prochaine exploration. Avec max_queries, l'exploration
+        dispose d'au moins la moitié des places et les meilleures requêtes mesurées
+        du reste: toutes les requêtes finissent mesurées sans évincer les plus productives.
+        
+        Args:
+            source: Nom du scraper
+            candidates: Recherches candidates
+        
+        Returns:
+            Recherches à exécuter, les plus productives d'abord
+        """
+        stats = self.get_stats(source)
+        exploring, ranked, dropped = [], [], []
+        
+        for query in candidates:
+            query_stats = stats.get(query.key)
+            if not query_stats or query_stats["unique_share"] is None or query_stats["runs"] < self.min_runs:
+                exploring.append(query)
+            elif query_stats["skipped_runs"] >= self.explore_every:
+                exploring.append(query)
+            elif query_stats["unique_share"] < self.min_share:
+                dropped.append(query)
+            else:
+                ranked.append(query)
+        
+        ranked.sort(key=lambda query: stats[query.key]["unique_share"], reverse=True)
+        if self.max_queries:
+            explore_slots = max(self.max_queries - len(ranked), (self.max_queries + 1) // 2)
+            plan = exploring[:explore_slots]
+            plan += ranked[:self.max_queries - len(plan)]
+            dropped.extend(query for query in exploring + ranked if query not in plan)
+        else:
+            plan = exploring + ranked
+        
+        if dropped:
+            logger.info(
+                f"Query plan for {source}: {len(plan)}/{len(candidates)} queries, skipping low-yield "
+                + ", ".join(f"'{query.key}'" for query in dropped)
+            )
+        return plan
+    
+    def record_run(
+        self,
+        source: str,
+        plan: List[SearchQuery],
+        query_keys: Dict[str, Set[str]],
+        candidates: Optional[List[SearchQuery]] = None
+    ):
+        """
+        Met à jour les statistiques après une exécution
+        
+        Une offre compte comme unique pour la première requête du plan qui l'a
+        trouvée: une requête qui ne retrouve que des offres des requêtes
+        précédentes voit sa part baisser.
+        
+        Args:
+            source: Nom du scraper
+            plan: Requêtes exécutées, dans l'ordre du plan
+            query_keys: Identifiants des offres trouvées par chaque requête (query_key -> job_keys)
+            candidates: Recherches candidates (les non planifiées sont comptées comme écartées)
+        """
+        seen: Set[str] = set()
+        unique_counts = {}
+        for query in plan:
+            keys = query_keys.get(query.key, set())
+            unique_counts[query.key] = len(keys - seen)
+            seen |= keys
+        
+        stats = self.get_stats(source)
+        now = datetime.now().isoformat()
+        
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        cursor = conn.cursor()
+        
+        for query in plan:
+            previous = stats.get(query.key, {"runs": 0, "results_total": 0, "unique_total": 0, "unique_share": None})
+            unique_share = previous["unique_share"]
+            # Une exécution sans nouvelle offre ne renseigne pas sur le rendement relatif
+            if seen:
+                share = unique_counts[query.key] / len(seen)
+                unique_share = share if unique_share is None else (
+                    YIELD_SMOOTHING * share + (1 - YIELD_SMOOTHING) * unique_share
+                )
+            
+            cursor.execute('''
+                INSERT OR REPLACE INTO query_stats (
+                    source, query_key, runs, skipped_runs, results_total,
+                    unique_total, unique_share, updated_at
+                ) VALUES (?, ?, ?, 0, ?, ?, ?, ?)
+            ''', (
+                source,
+                query.key,
+                previous["runs"] + 1,
+                previous["results_total"] + len(query_keys.get(query.key, ())),
+                previous["unique_total"] + unique_counts[query.key],
+                unique_share,
+                now
+            ))
+        
+        planned = {query.key for query in plan}
+        for query in candidates or []:
+            if query.key not in planned and query.key in stats:
+                cursor.execute(
+                    "UPDATE query_stats SET skipped_runs = skipped_runs + 1 WHERE source = ? AND query_key = ?",
+                    (source, query.key)
+                )
+        
+        conn.commit()
+        conn.close()
+        
+        total = sum(len(query_keys.get(query.key, ())) for query in plan)
+        logger.info(
+            f"Query overlap for {source}: {len(seen)} unique offers out of {total} results "
+            f"across {len(plan)} queries"
+        )
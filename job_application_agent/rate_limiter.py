@@ -0,0 +1,209 @@
+"""
+Limitation de débit par hôte (token bucket), utilisable depuis des threads et depuis asyncio
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from loguru import logger
+
+from config import RATE_LIMIT_DEFAULT_RPS, RATE_LIMIT_DEFAULT_BURST, RATE_LIMIT_HOSTS
+
+
+class TokenBucket:
+    """Seau à jetons: `rate` jetons par seconde, au plus `capacity` jetons accumulés"""
+    
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialise le seau (plein)
+        
+        Args:
+            rate: Jetons ajoutés par seconde (requêtes/s en régime permanent)
+            capacity: Nombre maximum de jetons (taille des rafales)
+        """
+        self.rate = max(rate, 1e-6)
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self, tokens: float = 1.0) -> float:
+        """
+        Réserve des jetons et retourne le temps d'attente avant de pouvoir les utiliser
+        
+        Le solde peut devenir négatif: les appelants suivants attendent d'autant plus,
+        ce qui garantit un ordre équitable sans boucle d'attente active.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= tokens
+            
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+    
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Attend (en bloquant le thread courant) que les jetons soient disponibles
+        
+        Args:
+            tokens: Nombre de jetons à consommer
+        
+        Returns:
+            Temps d'attente effectif en secondes
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+    
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """
+        Attend (sans bloquer la boucle asyncio) que les jetons soient disponibles
+        
+        Args:
+            tokens: Nombre de jetons à consommer
+        
+        Returns:
+            Temps d'attente effectif en secondes
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+def parse_host_limits(spec: str) -> Dict[str, Tuple[float, float]]:
+    """
+    Parse la configuration des limites par hôte
+    
+    Args:
+        spec: Chaîne "hôte=rps:burst,hôte=rps" (burst optionnel)
+    
+    Returns:
+        Dictionnaire {hôte: (rps, burst)}
+    """
+    limits = {}
+    
+    for item in spec.split(","):
+        if "=" not in item:
+            continue
+        host, value = item.split("=", 1)
+        rate, _, burst = value.partition(":")
+        try:
+            limits[host.strip().lower()] = (
+                float(rate),
+                float(burst) if burst else RATE_LIMIT_DEFAULT_BURST
+            )
+        except ValueError:
+            logger.warning(f"Invalid rate limit for '{host.strip()}': {value}")
+    
+    return limits
+
+
+class RateLimiter:
+    """Registre de token buckets, un par hôte"""
+    
+    def __init__(
+        self,
+        default_rate: float = 0.5,
+        default_burst: float = 2,
+        host_limits: Optional[Dict[str, Tuple[float, float]]] = None
+    ):
+        """
+        Initialise le registre
+        
+        Args:
+            default_rate: Requêtes/s par défaut pour un hôte non configuré
+            default_burst: Rafale par défaut
+            host_limits: Limites spécifiques {hôte: (rps, burst)}
+        """
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.host_limits = host_limits or {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._waited: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def get_bucket(self, host: str) -> TokenBucket:
+        """
+        Retourne le seau associé à un hôte (créé au premier appel)
+        
+        Args:
+            host: Nom d'hôte
+        
+        Returns:
+            TokenBucket de l'hôte
+        """
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self.host_limits.get(host, (self.default_rate, self.default_burst))
+                bucket = TokenBucket(rate=rate, capacity=burst)
+                self._buckets[host] = bucket
+                logger.debug(f"Rate limiter for {host}: {rate} req/s, burst {burst}")
+            return bucket
+    
+    def set_default_limit(self, host: str, rate: float, burst: float):
+        """
+        Déclare la limite par défaut d'un hôte (celle de RATE_LIMIT_HOSTS reste prioritaire)
+        
+        Args:
+            host: Nom d'hôte
+            rate: Requêtes/s
+            burst: Rafale
+        """
+        with self._lock:
+            self.host_limits.setdefault(host, (rate, burst))
+    
+    def _record_wait(self, host: str, wait: float):
+        with self._lock:
+            self._waited[host] = self._waited.get(host, 0.0) + wait
+    
+    def acquire(self, host: str) -> float:
+        """Attend un jeton pour `host` (version bloquante)"""
+        wait = self.get_bucket(host).acquire()
+        self._record_wait(host, wait)
+        return wait
+    
+    async def acquire_async(self, host: str) -> float:
+        """Attend un jeton pour `host` (version asyncio)"""
+        wait = await self.get_bucket(host).acquire_async()
+        self._record_wait(host, wait)
+        return wait
+    
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Retourne le temps total passé à attendre par hôte
+        
+        Returns:
+            Dictionnaire {hôte: secondes d'attente}
+        """
+        with self._lock:
+            return dict(self._waited)
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Retourne le limiteur partagé par tous les scrapers
+    
+    Returns:
+        Instance unique de RateLimiter configurée depuis settings.py
+    """
+    global _rate_limiter
+    
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter(
+                default_rate=RATE_LIMIT_DEFAULT_RPS,
+                default_burst=RATE_LIMIT_DEFAULT_BURST,
+                host_limits=parse_host_limits(RATE_LIMIT_HOSTS)
+            )
+        return _rate_limiter
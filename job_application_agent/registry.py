@@ -0,0 +1,217 @@
+"""
+Registre des scrapers: métadonnées déclaratives et import paresseux des modules
+"""
+
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+from loguru import logger
+
+from config import DRIVER_POOL_SIZE
+
+
+# Groupe d'entry points permettant à un paquet externe de déclarer ses scrapers:
+#   [project.entry-points."job_application_agent.scrapers"]
+#   monsite = "mon_paquet.specs:MONSITE_SPEC"
+ENTRY_POINT_GROUP = "job_application_agent.scrapers"
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ScraperSpec:
+    """Description d'un scraper, disponible sans importer son module"""
+    
+    name: str
+    module: str = ""  # Module à importer (ex: scrapers.indeed_scraper)
+    class_name: str = ""
+    host: str = ""
+    needs_selenium: bool = False
+    rate_limit: Optional[Tuple[float, float]] = None  # (requêtes/s, rafale) par défaut pour l'hôte
+    supports_pagination: bool = False
+    supports_incremental: bool = False
+    implemented: bool = True
+    description: str = ""
+
+
+BUILTIN_SCRAPERS: Dict[str, ScraperSpec] = {
+    spec.name: spec for spec in (
+        ScraperSpec(
+            name="indeed",
+            module="scrapers.indeed_scraper",
+            class_name="IndeedScraper",
+            host="fr.indeed.com",
+            rate_limit=(0.5, 2),
+            supports_pagination=True,
+            supports_incremental=True,
+            description="Indeed France (HTML)"
+        ),
+        ScraperSpec(
+            name="france_travail",
+            module="scrapers.france_travail_scraper",
+            class_name="FranceTravailScraper",
+            host="candidat.francetravail.fr",
+            rate_limit=(1, 3),
+            supports_pagination=True,
+            supports_incremental=True,
+            description="France Travail (HTML)"
+        ),
+        ScraperSpec(
+            name="hellowork",
+            host="www.hellowork.com",
+            implemented=False,
+            description="HelloWork (non implémenté)"
+        ),
+        ScraperSpec(
+            name="linkedin",
+            host="www.linkedin.com",
+            needs_selenium=True,
+            implemented=False,
+            description="LinkedIn, nécessite authentification (non implémenté)"
+        ),
+        ScraperSpec(
+            name="wttj",
+            host="www.welcometothejungle.com",
+            needs_selenium=True,
+            implemented=False,
+            description="Welcome to the Jungle (non implémenté)"
+        ),
+    )
+}
+
+_entry_point_specs: Optional[Dict[str, object]] = None
+
+
+def _discover_entry_points() -> Dict[str, object]:
+    """Liste les entry points de scrapers installés (sans les charger)"""
+    global _entry_point_specs
+    
+    if _entry_point_specs is None:
+        from importlib.metadata import entry_points
+        
+        try:
+            discovered = entry_points(group=ENTRY_POINT_GROUP)
+        except TypeError:
+            # Python < 3.10
+            discovered = entry_points().get(ENTRY_POINT_GROUP, [])
+        _entry_point_specs = {entry_point.name: entry_point for entry_point in discovered}
+    
+    return _entry_point_specs
+
+
+def get_spec(name: str) -> ScraperSpec:
+    """
+    Retourne les métadonnées d'un scraper
+    
+    Args:
+        name: Nom du scraper (indeed, france_travail...)
+    
+    Returns:
+        ScraperSpec du scraper (les entry points externes priment sur les scrapers intégrés)
+    """
+    entry_point = _discover_entry_points().get(name)
+    if entry_point is not None:
+        spec = entry_point.load()
+        if not isinstance(spec, ScraperSpec):
+            raise TypeError(f"Entry point '{name}' must reference a ScraperSpec, got {type(spec).__name__}")
+        return spec
+    
+    if name not in BUILTIN_SCRAPERS:
+        raise ValueError(f"Unknown scraper: {name}")
+    return BUILTIN_SCRAPERS[name]
+
+
+def list_scrapers() -> List[str]:
+    """Retourne les noms de tous les scrapers déclarés (intégrés et entry points)"""
+    return sorted(set(BUILTIN_SCRAPERS) | set(_discover_entry_points()))
+
+
+def get_scraper(name: str):
+    """
+    Importe le module du scraper (au premier appel) et retourne une instance
+    
+    Args:
+        name: Nom du scraper
+    
+    Returns:
+        Instance de BaseScraper
+    """
+    spec = get_spec(name)
+    if not spec.implemented:
+        raise NotImplementedError(f"Scraper '{name}' is not implemented yet")
+    
+    if spec.host and spec.rate_limit:
+        from utils.rate_limiter import get_rate_limiter
+        get_rate_limiter().set_default_limit(spec.host, *spec.rate_limit)
+    
+    module = importlib.import_module(spec.module)
+    scraper_class = getattr(module, spec.class_name)
+    return scraper_class()
+
+
+def plan_scrapers(names: List[str]) -> Tuple[List[ScraperSpec], List[ScraperSpec]]:
+    """
+    Répartit les scrapers activés selon leurs besoins d'exécution
+    
+    Args:
+        names: Noms des scrapers activés
+    
+    Returns:
+        Tuple (scrapers HTTP, scrapers Selenium), sans les scrapers non implémentés
+    """
+    http_specs, selenium_specs = [], []
+    
+    for name in names:
+        try:
+            spec = get_spec(name)
+        except (ValueError, TypeError, ImportError) as e:
+            logger.error(f"Skipping scraper {name}: {e}")
+            continue
+        
+        if not spec.implemented:
+            logger.warning(f"Skipping scraper {name}: not implemented yet")
+            continue
+        
+        (selenium_specs if spec.needs_selenium else http_specs).append(spec)
+    
+    return http_specs, selenium_specs
+
+
+def run_scrapers(names: List[str], scrape_source: Callable[[str], T]) -> List[T]:
+    """
+    Exécute une fonction de scraping par source, en planifiant la concurrence
+    d'après les métadonnées
+    
+    Les scrapers HTTP (hôtes distincts, débit régulé par hôte) tournent tous en
+    parallèle; les scrapers Selenium sont limités à la taille du pool de navigateurs.
+    
+    Args:
+        names: Noms des scrapers activés
+        scrape_source: Fonction recevant le nom d'un scraper (doit gérer ses erreurs)
+    
+    Returns:
+        Résultats dans l'ordre des scrapers planifiés (HTTP puis Selenium)
+    """
+    http_specs, selenium_specs = plan_scrapers(names)
+    logger.info(
+        f"Scraper plan: {len(http_specs)} HTTP in parallel, "
+        f"{len(selenium_specs)} Selenium (max {DRIVER_POOL_SIZE} at a time)"
+    )
+    
+    results = []
+    
+    with ThreadPoolExecutor(max_workers=max(1, len(http_specs))) as http_executor:
+        http_futures = [http_executor.submit(scrape_source, spec.name) for spec in http_specs]
+        
+        if selenium_specs:
+            with ThreadPoolExecutor(max_workers=max(1, DRIVER_POOL_SIZE)) as selenium_executor:
+                selenium_futures = [selenium_executor.submit(scrape_source, spec.name) for spec in selenium_specs]
+                selenium_results = [future.result() for future in selenium_futures]
+        else:
+            selenium_results = []
+        
+        results.extend(future.result() for future in http_futures)
+    
+    results.extend(selenium_results)
+    return results
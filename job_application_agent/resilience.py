@@ -0,0 +1,297 @@
+"""
+Résilience des requêtes HTTP: retries classifiés avec backoff et circuit breakers par hôte
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+import requests
+from loguru import logger
+
+from config import (
+    HTTP_MAX_RETRIES,
+    HTTP_BACKOFF_BASE,
+    HTTP_BACKOFF_MAX,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_SECONDS
+)
+
+
+# Codes HTTP justifiant une nouvelle tentative (les autres 4xx sont définitifs)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(requests.RequestException):
+    """Levée sans requête réseau quand le circuit d'un hôte est ouvert"""
+
+
+def is_retryable(response: Optional[requests.Response] = None, error: Optional[Exception] = None) -> bool:
+    """
+    Indique si un échec est transitoire (429, 5xx, timeout, connexion refusée/coupée)
+    
+    Args:
+        response: Réponse reçue (None si exception)
+        error: Exception levée par la requête
+    
+    Returns:
+        True si la requête peut être retentée
+    """
+    if error is not None:
+        return isinstance(error, (requests.Timeout, requests.ConnectionError))
+    return response is not None and response.status_code in RETRYABLE_STATUS_CODES
+
+
+def parse_retry_after(response: Optional[requests.Response]) -> Optional[float]:
+    """
+    Lit l'en-tête Retry-After (secondes ou date HTTP)
+    
+    Args:
+        response: Réponse HTTP
+    
+    Returns:
+        Délai demandé en secondes ou None
+    """
+    if response is None:
+        return None
+    
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, base: float = 1.0, maximum: float = 30.0, retry_after: Optional[float] = None) -> float:
+    """
+    Calcule l'attente avant une nouvelle tentative (backoff exponentiel à jitter complet)
+    
+    Args:
+        attempt: Numéro de la tentative échouée (0 = première)
+        base: Délai de base en secondes
+        maximum: Délai maximum en secondes
+        retry_after: Délai imposé par le serveur (Retry-After), prioritaire
+    
+    Returns:
+        Délai en secondes
+    """
+    if retry_after is not None:
+        return min(retry_after, maximum)
+    return random.uniform(0, min(maximum, base * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """Circuit breaker d'un hôte: fermé, ouvert (échec immédiat) puis semi-ouvert (une requête d'essai)"""
+    
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 600):
+        """
+        Initialise le circuit
+        
+        Args:
+            failure_threshold: Échecs consécutifs avant ouverture
+            reset_seconds: Durée d'ouverture avant une requête d'essai
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        # Requête d'essai en cours (semi-ouvert) et son départ: les autres requêtes sont
+        # refusées jusqu'à son résultat, ou jusqu'à reset_seconds si elle n'en rapporte aucun
+        self.trial_in_flight = False
+        self.trial_started_at = 0.0
+        self._lock = threading.Lock()
+    
+    def allow_request(self) -> bool:
+        """
+        Indique si une requête peut partir
+        
+        Après reset_seconds, le circuit passe en semi-ouvert et laisse partir une
+        seule requête d'essai; les suivantes échouent jusqu'à son succès ou son échec.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.state == "open" and now - self.opened_at >= self.reset_seconds:
+                self.state = "half_open"
+                self.trial_in_flight = False
+            
+            if self.state == "closed":
+                return True
+            if self.state == "half_open" and (
+                not self.trial_in_flight or now - self.trial_started_at >= self.reset_seconds
+            ):
+                self.trial_in_flight = True
+                self.trial_started_at = now
+                return True
+            return False
+    
+    def record_success(self):
+        """Referme le circuit"""
+        with self._lock:
+            self.state = "closed"
+            self.consecutive_failures = 0
+            self.trial_in_flight = False
+    
+    def record_failure(self) -> bool:
+        """
+        Comptabilise un échec
+        
+        Returns:
+            True si cet échec vient d'ouvrir le circuit
+        """
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == "half_open" or (
+                self.state == "closed" and self.consecutive_failures >= self.failure_threshold
+            ):
+                self.state = "open"
+                self.opened_at = time.monotonic()
+                self.trial_in_flight = False
+                return True
+            return False
+
+
+class ResilienceManager:
+    """Politique de retry et circuit breakers partagés par tous les scrapers, avec statistiques par hôte"""
+    
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        failure_threshold: int = 5,
+        reset_seconds: float = 600
+    ):
+        """
+        Initialise le gestionnaire
+        
+        Args:
+            max_retries: Nouvelles tentatives maximum par requête
+            backoff_base: Délai de base du backoff exponentiel
+            backoff_max: Délai maximum entre deux tentatives (Retry-After compris)
+            failure_threshold: Échecs consécutifs avant ouverture du circuit d'un hôte
+            reset_seconds: Durée d'ouverture du circuit avant une requête d'essai
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+    
+    def get_breaker(self, host: str) -> CircuitBreaker:
+        """Retourne le circuit breaker d'un hôte (créé au premier appel)"""
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_seconds)
+                self._breakers[host] = breaker
+                self._stats[host] = {"retries": 0, "failures": 0, "short_circuited": 0}
+            return breaker
+    
+    def _count(self, host: str, stat: str):
+        with self._lock:
+            self._stats[host][stat] += 1
+    
+    def check(self, host: str):
+        """
+        Vérifie que le circuit de l'hôte laisse passer une requête
+        
+        Raises:
+            CircuitOpenError: si l'hôte est considéré comme hors service
+        """
+        if not self.get_breaker(host).allow_request():
+            self._count(host, "short_circuited")
+            raise CircuitOpenError(f"Circuit open for {host}: failing fast")
+    
+    def record_success(self, host: str):
+        """Comptabilise une réponse valide"""
+        self.get_breaker(host).record_success()
+    
+    def record_failure(self, host: str):
+        """Comptabilise un échec transitoire (ouvre le circuit au-delà du seuil)"""
+        self._count(host, "failures")
+        if self.get_breaker(host).record_failure():
+            logger.warning(
+                f"Circuit opened for {host} after {self.failure_threshold} consecutive failures, "
+                f"failing fast for {self.reset_seconds:.0f}s"
+            )
+    
+    def wait_before_retry(self, host: str, attempt: int, response: Optional[requests.Response] = None) -> bool:
+        """
+        Attend avant une nouvelle tentative si la politique le permet
+        
+        Args:
+            host: Hôte de la requête
+            attempt: Numéro de la tentative échouée (0 = première)
+            response: Réponse en échec (pour Retry-After)
+        
+        Returns:
+            True si une nouvelle tentative doit être faite, False si les retries sont épuisés
+        """
+        if attempt >= self.max_retries:
+            return False
+        
+        delay = backoff_delay(attempt, self.backoff_base, self.backoff_max, parse_retry_after(response))
+        self._count(host, "retries")
+        logger.debug(f"Retrying {host} in {delay:.1f}s (attempt {attempt + 2}/{self.max_retries + 1})")
+        time.sleep(delay)
+        return True
+    
+    def get_stats(self) -> Dict[str, Dict[str, object]]:
+        """
+        Retourne l'état des circuits et les compteurs par hôte
+        
+        Returns:
+            Dictionnaire {hôte: {state, retries, failures, short_circuited}}
+        """
+        with self._lock:
+            return {
+                host: {"state": self._breakers[host].state, **stats}
+                for host, stats in self._stats.items()
+            }
+    
+    def log_stats(self):
+        """Écrit l'état des circuits et les retries dans les logs (résumé d'exécution)"""
+        for host, stats in self.get_stats().items():
+            log = logger.warning if stats["state"] != "closed" else logger.info
+            log(
+                f"HTTP resilience {host}: circuit {stats['state']}, {stats['retries']} retries, "
+                f"{stats['failures']} transient failures, {stats['short_circuited']} requests failed fast"
+            )
+
+
+_resilience: Optional[ResilienceManager] = None
+_resilience_lock = threading.Lock()
+
+
+def get_resilience() -> ResilienceManager:
+    """
+    Retourne le gestionnaire de résilience partagé par tous les scrapers
+    
+    Returns:
+        Instance unique de ResilienceManager configurée depuis settings.py
+    """
+    global _resilience
+    
+    with _resilience_lock:
+        if _resilience is None:
+            _resilience = ResilienceManager(
+                max_retries=HTTP_MAX_RETRIES,
+                backoff_base=HTTP_BACKOFF_BASE,
+                backoff_max=HTTP_BACKOFF_MAX,
+                failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+                reset_seconds=CIRCUIT_RESET_SECONDS
+            )
+        return _resilience
@@ -0,0 +1,349 @@
+"""
+Cache disque des réponses HTTP des pages de recherche (revalidation ETag / Last-Modified)
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode, urlsplit, urlunsplit, parse_qsl
+import requests
+from loguru import logger
+
+from config import (
+    HTTP_CACHE_ENABLED,
+    HTTP_CACHE_PATH,
+    HTTP_CACHE_TTL_SECONDS,
+    HTTP_CACHE_MAX_AGE_SECONDS,
+    HTTP_CACHE_MAX_SIZE_MB
+)
+
+
+def normalize_url(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Normalise une URL et ses paramètres pour en faire une clé de cache stable
+    
+    Args:
+        url: URL (avec ou sans query string)
+        params: Paramètres supplémentaires
+    
+    Returns:
+        URL normalisée (schéma/hôte en minuscules, paramètres triés, sans fragment)
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query.extend((str(k), "" if v is None else str(v)) for k, v in params.items())
+    query.sort()
+    
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path or "/",
+        urlencode(query),
+        ""
+    ))
+
+
+def make_cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Retourne la clé de cache (SHA-256 de l'URL normalisée)"""
+    return hashlib.sha256(normalize_url(url, params).encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Cache persistant SQLite des réponses HTTP, avec TTL, éviction LRU par taille et statistiques"""
+    
+    def __init__(
+        self,
+        db_path: Path,
+        ttl_seconds: int = 3600,
+        max_age_seconds: int = 7 * 24 * 3600,
+        max_size_mb: float = 200
+    ):
+        """
+        Initialise le cache
+        
+        Args:
+            db_path: Fichier SQLite du cache
+            ttl_seconds: Durée pendant laquelle une réponse est servie sans revalidation
+            max_age_seconds: Âge au-delà duquel une entrée est supprimée
+            max_size_mb: Taille maximale du cache (éviction des entrées les moins utilisées)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_age_seconds = max_age_seconds
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "stored": 0, "evicted": 0}
+        self._lock = threading.Lock()
+        self._init_database()
+    
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+    
+    def _init_database(self):
+        """Crée la table du cache"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS http_cache (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status_code INTEGER NOT NULL,
+                headers TEXT,
+                content BLOB,
+                etag TEXT,
+                last_modified TEXT,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                parsed TEXT
+            )
+        ''')
+        
+        conn.commit()
+        conn.close()
+    
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Récupère une entrée du cache
+        
+        Args:
+            key: Clé de cache
+        
+        Returns:
+            Dictionnaire de l'entrée ou None
+        """
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        
+        cursor.execute("SELECT * FROM http_cache WHERE key = ?", (key,))
+        row = cursor.fetchone()
+        
+        if row:
+            cursor.execute("UPDATE http_cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+        
+        conn.close()
+        return dict(row) if row else None
+    
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Vrai si l'entrée peut être servie sans revalidation"""
+        return time.time() - entry["stored_at"] < self.ttl_seconds
+    
+    def conditional_headers(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Construit les en-têtes de requête conditionnelle pour une entrée
+        
+        Args:
+            entry: Entrée du cache
+        
+        Returns:
+            En-têtes If-None-Match / If-Modified-Since
+        """
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+    
+    def to_response(self, entry: Dict[str, Any]) -> requests.Response:
+        """
+        Reconstruit un objet Response à partir d'une entrée
+        
+        Args:
+            entry: Entrée du cache
+        
+        Returns:
+            Réponse marquée from_cache=True
+        """
+        response = requests.Response()
+        response.status_code = entry["status_code"]
+        response.url = entry["url"]
+        response._content = entry["content"]
+        response.headers.update(json.loads(entry["headers"] or "{}"))
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers) or "utf-8"
+        response.from_cache = True
+        response.cache_key = entry["key"]
+        return response
+    
+    def record_hit(self, revalidated: bool = False):
+        """Comptabilise une réponse servie depuis le cache"""
+        self._count("revalidated" if revalidated else "hits")
+    
+    def record_miss(self):
+        """Comptabilise une réponse téléchargée"""
+        self._count("misses")
+    
+    def touch(self, key: str):
+        """Prolonge la fraîcheur d'une entrée après une réponse 304"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        now = time.time()
+        cursor.execute(
+            "UPDATE http_cache SET stored_at = ?, accessed_at = ? WHERE key = ?",
+            (now, now, key)
+        )
+        conn.commit()
+        conn.close()
+    
+    def store(self, key: str, response: requests.Response):
+        """
+        Enregistre une réponse 200 (le résultat de parsing associé est invalidé)
+        
+        Args:
+            key: Clé de cache
+            response: Réponse HTTP
+        """
+        content = response.content
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name.lower() in ("content-type", "etag", "last-modified")
+        }
+        now = time.time()
+        
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT OR REPLACE INTO http_cache (
+                key, url, status_code, headers, content, etag, last_modified,
+                size, stored_at, accessed_at, parsed
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL)
+        ''', (
+            key,
+            response.url,
+            response.status_code,
+            json.dumps(headers),
+            content,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            len(content),
+            now,
+            now
+        ))
+        conn.commit()
+        conn.close()
+        
+        self._count("stored")
+        self.evict()
+    
+    def get_parsed(self, key: str) -> Optional[Any]:
+        """
+        Récupère le résultat de parsing mémorisé pour une entrée
+        
+        Args:
+            key: Clé de cache
+        
+        Returns:
+            Données JSON décodées ou None
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute("SELECT parsed FROM http_cache WHERE key = ?", (key,))
+        row = cursor.fetchone()
+        conn.close()
+        
+        if not row or row[0] is None:
+            return None
+        return json.loads(row[0])
+    
+    def set_parsed(self, key: str, data: Any):
+        """
+        Mémorise le résultat de parsing d'une entrée (évite de re-parser une page inchangée)
+        
+        Args:
+            key: Clé de cache
+            data: Données sérialisables en JSON
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute(
+            "UPDATE http_cache SET parsed = ? WHERE key = ?",
+            (json.dumps(data, ensure_ascii=False), key)
+        )
+        conn.commit()
+        conn.close()
+    
+    def evict(self):
+        """Supprime les entrées trop anciennes puis les moins utilisées si le cache est trop gros"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute(
+            "DELETE FROM http_cache WHERE stored_at < ?",
+            (time.time() - self.max_age_seconds,)
+        )
+        evicted = cursor.rowcount
+        
+        cursor.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache")
+        total_size = cursor.fetchone()[0]
+        
+        if total_size > self.max_size_bytes:
+            cursor.execute("SELECT key, size FROM http_cache ORDER BY accessed_at ASC")
+            to_delete = []
+            for key, size in cursor.fetchall():
+                if total_size <= self.max_size_bytes:
+                    break
+                to_delete.append((key,))
+                total_size -= size
+            cursor.executemany("DELETE FROM http_cache WHERE key = ?", to_delete)
+            evicted += len(to_delete)
+        
+        conn.commit()
+        conn.close()
+        
+        if evicted:
+            with self._lock:
+                self.stats["evicted"] += evicted
+            logger.debug(f"HTTP cache: evicted {evicted} entries")
+    
+    def log_stats(self):
+        """Écrit les statistiques du cache dans les logs"""
+        with self._lock:
+            stats = dict(self.stats)
+        
+        lookups = stats["hits"] + stats["revalidated"] + stats["misses"]
+        hit_rate = (stats["hits"] + stats["revalidated"]) / lookups * 100 if lookups else 0
+        logger.info(
+            f"HTTP cache: {stats['hits']} hits, {stats['revalidated']} revalidated (304), "
+            f"{stats['misses']} misses ({hit_rate:.0f}% served from cache), "
+            f"{stats['evicted']} evicted"
+        )
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Retourne le cache de réponses partagé (None si désactivé via HTTP_CACHE_ENABLED)
+    
+    Returns:
+        Instance unique de ResponseCache ou None
+    """
+    global _response_cache
+    
+    if not HTTP_CACHE_ENABLED:
+        return None
+    
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache(
+                db_path=HTTP_CACHE_PATH,
+                ttl_seconds=HTTP_CACHE_TTL_SECONDS,
+                max_age_seconds=HTTP_CACHE_MAX_AGE_SECONDS,
+                max_size_mb=HTTP_CACHE_MAX_SIZE_MB
+            )
+        return _response_cache
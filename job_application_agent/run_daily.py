@@ -6,8 +6,11 @@ Recherche les offres, génère les documents, et envoie le rapport HTML par emai
 
 import sys
 import os
+import asyncio
+import itertools
+import threading
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List
 from datetime import datetime
 
 # Ajouter le répertoire au path
@@ -28,12 +31,25 @@ from config import (
     NOTIFICATION_EMAIL,
     CANDIDATE_EMAIL,
     CANDIDATE_EMAIL_PASSWORD,
-    OUTPUT_DIR
+    OUTPUT_DIR,
+    ENRICH_OFFER_DETAILS,
+    DUPLICATE_DETECTION,
+    STREAM_QUEUE_SIZE,
+    LLM_CONCURRENCY
 )
 from utils.logger import setup_logger
 from utils.models import JobOffer, ApplicationResult
-from scrapers import get_scraper
+from scrapers.registry import get_scraper, run_scrapers
+from scrapers.offer_enricher import OfferEnricher
+from utils.http_session import get_session_pool
+from utils.driver_pool import get_driver_pool
+from utils.response_cache import get_response_cache
+from utils.ai_helper import AsyncAIHelper
+from utils.llm_cache import get_completion_cache
+from utils.resilience import get_resilience
+from utils.streaming import BoundedStream, process_concurrently
 from filters import JobFilter
+from filters.duplicate_detector import DuplicateDetector
 from cv_generator import CVGenerator
 from cover_letter import CoverLetterGenerator
 from email_manager import EmailSender
@@ -54,13 +70,18 @@ class DailyJobApplicationRunner:
         logger.info("=" * 70)
         
         self.test_data_path = test_data_path
+        self.offers_scraped = 0
         
         # Initialiser les composants
         self.job_filter = JobFilter()
-        self.cv_generator = CVGenerator()
-        self.cover_letter_generator = CoverLetterGenerator()
+        self.duplicate_detector = DuplicateDetector()
+        # Un seul client IA: CV et lettres partagent les limites LLM_RPM_LIMIT / LLM_TPM_LIMIT
+        self.ai_helper = AsyncAIHelper()
+        self.cv_generator = CVGenerator(ai_helper=self.ai_helper)
+        self.cover_letter_generator = CoverLetterGenerator(ai_helper=self.ai_helper)
         self.email_sender = EmailSender()
         self.database = ApplicationDatabase()
+        self.offer_enricher = OfferEnricher()
         self.html_reporter = HTMLReporter()
         
         logger.info("All components initialized")
@@ -68,28 +89,28 @@ class DailyJobApplicationRunner:
     def run(self):
         """Exécute le processus complet"""
         try:
-            # 1. Scraping
-            logger.info("\n📍 STEP 1: Scraping job offers...")
-            all_offers = self._scrape_offers()
-            logger.info(f"✓ Total offers scraped: {len(all_offers)}")
+            # 1-3. Scraping, filtrage et traitement en flux: les premières offres
+            # qualifiées sont traitées pendant que les sources sont encore scrapées
+            logger.info("\n📍 STEPS 1-3: Scraping, filtering and processing offers as they stream in...")
+            results = self._process_offers(self._filter_offers(self._scrape_offers()))
             
-            if not all_offers:
+            # Appels à l'IA évités grâce au cache de complétions
+            completion_cache = get_completion_cache()
+            if completion_cache:
+                completion_cache.log_stats()
+            
+            logger.info(f"✓ Total offers scraped: {self.offers_scraped}")
+            
+            if not self.offers_scraped:
                 logger.warning("No offers found. Exiting.")
                 return False
             
-            # 2. Filtrage
-            logger.info("\n📍 STEP 2: Filtering job offers...")
-            filtered_offers = self._filter_offers(all_offers)
-            logger.info(f"✓ Offers after filtering: {len(filtered_offers)}")
+            logger.info(f"✓ Offers after filtering: {len(results)}")
             
-            if not filtered_offers:
+            if not results:
                 logger.warning("No offers passed filters.")
                 return False
             
-            # 3. Traitement des offres
-            logger.info(f"\n📍 STEP 3: Processing {len(filtered_offers)} qualified offers...")
-            results = self._process_offers(filtered_offers)
-            
             successful = sum(1 for r in results if r.success)
             logger.info(f"✓ Processed: {successful}/{len(results)} successful")
             
@@ -100,7 +121,7 @@ class DailyJobApplicationRunner:
             
             # 5. Envoi du rapport par email
             logger.info("\n📍 STEP 5: Sending report via email...")
-            email_sent = self._send_report_email(html_path, len(filtered_offers), successful)
+            email_sent = self._send_report_email(html_path, len(results), successful)
             
             if email_sent:
                 logger.info(f"✓ Report sent to {NOTIFICATION_EMAIL}")
@@ -110,8 +131,8 @@ class DailyJobApplicationRunner:
             # Résumé final
             logger.info("\n" + "=" * 70)
             logger.info("DAILY JOB APPLICATION RUNNER - COMPLETED SUCCESSFULLY")
-            logger.info(f"Total offers found: {len(all_offers)}")
-            logger.info(f"Offers qualified: {len(filtered_offers)}")
+            logger.info(f"Total offers found: {self.offers_scraped}")
+            logger.info(f"Offers qualified: {len(results)}")
             logger.info(f"Candidatures ready: {successful}")
             logger.info(f"Report sent to: {NOTIFICATION_EMAIL}")
             logger.info("=" * 70 + "\n")
@@ -122,8 +143,8 @@ class DailyJobApplicationRunner:
             logger.error(f"Fatal error: {e}", exc_info=True)
             return False
     
-    def _scrape_offers(self) -> List[JobOffer]:
-        """Scrape les offres depuis toutes les sources ou charge les données de test"""
+    def _scrape_offers(self) -> Iterator[List[JobOffer]]:
+        """Scrape les offres depuis toutes les sources ou charge les données de test, page par page"""
         
         if self.test_data_path:
             logger.info(f"  Loading test data from: {self.test_data_path}")
@@ -136,62 +157,117 @@ class DailyJobApplicationRunner:
             all_offers = [JobOffer(**offer) for offer in raw_offers]
             
             logger.info(f"  Loaded {len(all_offers)} offers from test data.")
-            return all_offers
+            yield all_offers
+            return
         
-        all_offers = []
+        # Les sources tournent en arrière-plan (HTTP en parallèle, Selenium selon le pool) et
+        # alimentent un flux borné: le scraping se met en pause si le traitement prend du retard
+        stream = BoundedStream(maxsize=STREAM_QUEUE_SIZE)
         
-        for scraper_name in ENABLED_SCRAPERS:
-            logger.info(f"  Scraping from: {scraper_name}")
-            
+        def produce():
             try:
-                scraper = get_scraper(scraper_name)
-                
-                with scraper:
-                    offers = scraper.scrape(max_offers=MAX_OFFERS_PER_RUN)
-                    logger.info(f"    Found {len(offers)} offers")
-                    
-                    # Sauvegarder dans la base
-                    for offer in offers:
-                        self.database.save_job_offer(offer)
-                    
-                    all_offers.extend(offers)
+                run_scrapers(ENABLED_SCRAPERS, lambda scraper_name: self._scrape_source(scraper_name, stream))
+            finally:
+                stream.finish()
+                self._finish_scraping()
+        
+        producer = threading.Thread(target=produce, name="scraping", daemon=True)
+        producer.start()
+        
+        try:
+            yield from stream
+        finally:
+            stream.close()
+            producer.join()
+    
+    def _finish_scraping(self):
+        """Journalise les statistiques de scraping et ferme les navigateurs du pool"""
+        # Statistiques de réutilisation des connexions HTTP, des retries/circuits et du cache
+        get_session_pool().log_stats()
+        get_resilience().log_stats()
+        response_cache = get_response_cache()
+        if response_cache:
+            response_cache.log_stats()
+        if ENRICH_OFFER_DETAILS:
+            self.offer_enricher.log_stats()
+        
+        # Fermer les navigateurs restés ouverts dans le pool
+        driver_pool = get_driver_pool()
+        driver_pool.log_stats()
+        driver_pool.close_all()
+    
+    def _scrape_source(self, scraper_name: str, stream: BoundedStream) -> int:
+        """Scrape une source et transmet ses offres enrichies page par page (exécuté en parallèle des autres sources)"""
+        logger.info(f"  Scraping from: {scraper_name}")
+        found = 0
+        
+        try:
+            scraper = get_scraper(scraper_name)
+            
+            with scraper:
+                for offers in scraper.iter_offer_batches(max_offers=MAX_OFFERS_PER_RUN):
+                    # Compléter les nouvelles offres avec leur page de détail
+                    if ENRICH_OFFER_DETAILS:
+                        offers = self.offer_enricher.enrich(scraper, offers, exists=self.database.job_offer_exists)
                     
-            except Exception as e:
-                logger.error(f"  Error scraping {scraper_name}: {e}")
-                continue
+                    found += len(offers)
+                    if not stream.put(offers):
+                        break
+            
+            logger.info(f"    Found {found} offers from {scraper_name}")
+        
+        except Exception as e:
+            logger.error(f"  Error scraping {scraper_name}: {e}")
         
-        return all_offers
+        return found
     
-    def _filter_offers(self, offers: List[JobOffer]) -> List[JobOffer]:
-        """Filtre les offres"""
-        # Éliminer les doublons
-        new_offers = [
-            offer for offer in offers
-            if not self.database.job_offer_exists(offer)
-        ]
+    def _filter_offers(self, batches: Iterable[List[JobOffer]]) -> Iterator[JobOffer]:
+        """Filtre les offres au fil du scraping"""
         
-        logger.info(f"  New offers (not already processed): {len(new_offers)}")
+        def new_offers() -> Iterator[JobOffer]:
+            for offers in batches:
+                self.offers_scraped += len(offers)
+                
+                # Éliminer les doublons (offres déjà traitées), puis sauvegarder les nouvelles
+                fresh = [offer for offer in offers if not self.database.job_offer_exists(offer)]
+                if not self.test_data_path:
+                    for offer in fresh:
+                        self.database.save_job_offer(offer)
+                
+                logger.info(f"  New offers (not already processed): {len(fresh)}/{len(offers)}")
+                
+                # Regrouper les quasi-doublons (même offre sur plusieurs sources)
+                if DUPLICATE_DETECTION and fresh:
+                    fresh = self.duplicate_detector.deduplicate(fresh)
+                
+                # Classer en une requête groupée les offres de la page qui nécessitent l'IA
+                self.job_filter.prefetch_domains(fresh)
+                
+                yield from fresh
         
         # Appliquer les filtres
-        filtered = self.job_filter.filter_offers(new_offers)
-        
-        return filtered
+        return self.job_filter.filter_stream(new_offers())
     
-    def _process_offers(self, offers: List[JobOffer]) -> List[ApplicationResult]:
-        """Traite les offres: génère CV et lettre"""
-        results = []
+    def _process_offers(self, offers: Iterable[JobOffer]) -> List[ApplicationResult]:
+        """
+        Traite les offres au fur et à mesure de leur arrivée: génère CV et lettre
+        
+        Jusqu'à LLM_CONCURRENCY offres sont traitées en même temps (appels à l'IA
+        asynchrones, dans les limites LLM_RPM_LIMIT / LLM_TPM_LIMIT).
+        """
+        counter = itertools.count(1)
         
-        for i, offer in enumerate(offers, 1):
-            logger.info(f"  [{i}/{len(offers)}] {offer.title} @ {offer.company}")
+        async def process(offer: JobOffer) -> ApplicationResult:
+            i = next(counter)
+            logger.info(f"  [{i}] {offer.title} @ {offer.company}")
             
             try:
-                # Générer le CV
-                cv_path = self.cv_generator.generate_optimized_cv(offer)
-                logger.info(f"      ✓ CV generated")
-                
-                # Générer la lettre
-                cover_letter_path = self.cover_letter_generator.generate_cover_letter(offer)
-                logger.info(f"      ✓ Cover letter generated")
+                # Générer le CV et la lettre (requêtes indépendantes, envoyées ensemble)
+                cv_path, cover_letter_path = await asyncio.gather(
+                    self.cv_generator.generate_optimized_cv_async(offer),
+                    self.cover_letter_generator.generate_cover_letter_async(offer)
+                )
+                logger.info(f"      ✓ [{i}] CV and cover letter generated")
                 
                 # Créer le résultat
                 result = ApplicationResult(
@@ -203,13 +279,11 @@ class DailyJobApplicationRunner:
                     notification_sent=False
                 )
                 
-                results.append(result)
-                
                 # Sauvegarder dans la base
-                self.database.save_application(result)
+                await asyncio.to_thread(self.database.save_application, result)
                 
             except Exception as e:
-                logger.error(f"      ✗ Error: {e}")
+                logger.error(f"      ✗ [{i}] Error: {e}")
                 
                 # Créer un résultat d'erreur
                 result = ApplicationResult(
@@ -221,10 +295,17 @@ class DailyJobApplicationRunner:
                     notification_sent=False
                 )
                 
-                results.append(result)
-                self.database.log_error(offer.id, "processing_error", str(e))
+                await asyncio.to_thread(self.database.log_error, offer.id, "processing_error", str(e))
+            
+            return result
+        
+        async def process_all() -> List[ApplicationResult]:
+            try:
+                return await process_concurrently(offers, process, LLM_CONCURRENCY)
+            finally:
+                await self.ai_helper.aclose()
         
-        return results
+        return asyncio.run(process_all())
     
     def _send_report_email(self, html_path: str, total_offers: int, successful: int) -> bool:
         """Envoie le rapport HTML par email"""
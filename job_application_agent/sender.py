@@ -203,6 +203,12 @@ Camille Coupet
         """Génère le corps de l'email de notification"""
         from datetime import datetime
         
+        # Adresse trouvée sur la page de l'offre: jamais utilisée automatiquement, à vérifier
+        suggested_email = (
+            f"\n📧 Email de candidature trouvé sur l'offre (à vérifier): {job_offer.application_email}"
+            if job_offer.application_email else ""
+        )
+        
         if success:
             body = f"""Bonjour Camille,
 
@@ -216,7 +222,7 @@ Une candidature a été envoyée avec succès !
 📅 Date: {datetime.now().strftime("%d/%m/%Y à %H:%M")}
 🌐 Langue: {"Français" if job_offer.language == "fr" else "Anglais"}
 
-Type de candidature: {job_offer.application_type}
+Type de candidature: {job_offer.application_type}{suggested_email}
 
 Les documents envoyés sont joints à cet email.
 
@@ -238,7 +244,7 @@ Une erreur s'est produite lors de l'envoi d'une candidature.
 
 ❌ Erreur: {error_message or "Erreur inconnue"}
 
-Type de candidature: {job_offer.application_type}
+Type de candidature: {job_offer.application_type}{suggested_email}
 
 Vous pouvez candidater manuellement en utilisant les documents joints.
 
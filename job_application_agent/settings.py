@@ -21,17 +21,90 @@ OUTPUT_DIR.mkdir(exist_ok=True)
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
 
+# Génération des documents en parallèle (AsyncAIHelper): offres traitées simultanément et
+# quotas de l'API OpenAI (requêtes et tokens par minute, selon le tier du compte)
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "4"))
+LLM_RPM_LIMIT = float(os.getenv("LLM_RPM_LIMIT", "500"))
+LLM_TPM_LIMIT = float(os.getenv("LLM_TPM_LIMIT", "200000"))
+
 # Email
 CANDIDATE_EMAIL = os.getenv("CANDIDATE_EMAIL", "camille.coupet.candidatures@gmail.com")
 CANDIDATE_EMAIL_PASSWORD = os.getenv("CANDIDATE_EMAIL_PASSWORD", "")
 NOTIFICATION_EMAIL = os.getenv("NOTIFICATION_EMAIL", "ccoupet02@gmail.com")
 
 # Configuration scraping
-SCRAPING_DELAY_MIN = float(os.getenv("SCRAPING_DELAY_MIN", "2"))
-SCRAPING_DELAY_MAX = float(os.getenv("SCRAPING_DELAY_MAX", "5"))
+# Limitation de débit par hôte (token bucket): requêtes/s et taille de rafale
+# Chaque scraper déclare la limite de son hôte (scrapers/registry.py);
+# RATE_LIMIT_HOSTS la surcharge: "hôte=rps:burst,hôte=rps:burst"
+RATE_LIMIT_DEFAULT_RPS = float(os.getenv("RATE_LIMIT_DEFAULT_RPS", "0.5"))
+RATE_LIMIT_DEFAULT_BURST = float(os.getenv("RATE_LIMIT_DEFAULT_BURST", "2"))
+RATE_LIMIT_HOSTS = os.getenv("RATE_LIMIT_HOSTS", "")
+SCRAPING_MAX_CONCURRENCY_PER_HOST = int(os.getenv("SCRAPING_MAX_CONCURRENCY_PER_HOST", "2"))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "30"))
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "4"))
 MAX_OFFERS_PER_RUN = int(os.getenv("MAX_OFFERS_PER_RUN", "50"))
 HEADLESS_BROWSER = os.getenv("HEADLESS_BROWSER", "true").lower() == "true"
 
+# Résilience HTTP: retries des échecs transitoires (429, 5xx, timeouts) avec backoff
+# exponentiel (Retry-After respecté) et circuit breaker par hôte: après
+# CIRCUIT_FAILURE_THRESHOLD échecs consécutifs, l'hôte échoue immédiatement pendant
+# CIRCUIT_RESET_SECONDS (soit en pratique le reste de l'exécution)
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+HTTP_BACKOFF_BASE = float(os.getenv("HTTP_BACKOFF_BASE", "1"))
+HTTP_BACKOFF_MAX = float(os.getenv("HTTP_BACKOFF_MAX", "30"))
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RESET_SECONDS = float(os.getenv("CIRCUIT_RESET_SECONDS", "600"))
+
+# Transport HTTP: "live" (réseau), "record" (réseau + enregistrement des réponses dans FIXTURES_DIR)
+# ou "replay" (rejeu hors ligne des réponses enregistrées, sans rate limiting ni cache)
+SCRAPER_TRANSPORT_MODE = os.getenv("SCRAPER_TRANSPORT_MODE", "live").lower()
+FIXTURES_DIR = DATA_DIR / os.getenv("FIXTURES_DIR", "fixtures")
+REPLAY_LATENCY_MS = float(os.getenv("REPLAY_LATENCY_MS", "0"))
+
+# Pool de navigateurs Selenium partagé entre les scrapers
+DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "2"))
+DRIVER_MAX_PAGES = int(os.getenv("DRIVER_MAX_PAGES", "50"))  # Pages chargées avant recyclage du navigateur
+SELENIUM_IDLE_MS = int(os.getenv("SELENIUM_IDLE_MS", "500"))  # Stabilité du DOM/réseau = contenu chargé
+SELENIUM_LOAD_TIMEOUT = float(os.getenv("SELENIUM_LOAD_TIMEOUT", "30"))
+
+# Cache disque des pages de recherche (revalidation ETag / Last-Modified)
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"
+HTTP_CACHE_PATH = DATA_DIR / os.getenv("HTTP_CACHE_PATH", "http_cache.db")
+HTTP_CACHE_TTL_SECONDS = int(os.getenv("HTTP_CACHE_TTL_SECONDS", "3600"))
+HTTP_CACHE_MAX_AGE_SECONDS = int(os.getenv("HTTP_CACHE_MAX_AGE_SECONDS", str(7 * 24 * 3600)))
+HTTP_CACHE_MAX_SIZE_MB = float(os.getenv("HTTP_CACHE_MAX_SIZE_MB", "200"))
+
+# Scraping incrémental: arrêt dès que l'on atteint des offres déjà vues (high-water marks)
+INCREMENTAL_SCRAPING = os.getenv("INCREMENTAL_SCRAPING", "true").lower() == "true"
+WATERMARK_STOP_AFTER = int(os.getenv("WATERMARK_STOP_AFTER", "3"))  # Offres déjà vues consécutives
+WATERMARK_MAX_KEYS = int(os.getenv("WATERMARK_MAX_KEYS", "300"))
+SCRAPING_MAX_PAGES = int(os.getenv("SCRAPING_MAX_PAGES", "3"))  # Pages de résultats par requête
+
+# Planification des recherches (DOMAIN_KEYWORDS × LOCATION_KEYWORDS): après QUERY_MIN_RUNS
+# exécutions, une requête apportant moins de QUERY_MIN_SHARE des offres uniques de sa source
+# est écartée, puis retentée toutes les QUERY_EXPLORE_EVERY exécutions. QUERY_MAX_PER_SOURCE
+# plafonne les requêtes d'une exécution (6: le volume des recherches fixes d'Indeed; 0 = illimité)
+QUERY_MIN_RUNS = int(os.getenv("QUERY_MIN_RUNS", "3"))
+QUERY_MIN_SHARE = float(os.getenv("QUERY_MIN_SHARE", "0.05"))
+QUERY_EXPLORE_EVERY = int(os.getenv("QUERY_EXPLORE_EVERY", "5"))
+QUERY_MAX_PER_SOURCE = int(os.getenv("QUERY_MAX_PER_SOURCE", "6"))
+
+# Enrichissement des offres par leur page de détail
+ENRICH_OFFER_DETAILS = os.getenv("ENRICH_OFFER_DETAILS", "true").lower() == "true"
+ENRICHMENT_WORKERS = int(os.getenv("ENRICHMENT_WORKERS", "4"))
+
+# Détection des quasi-doublons entre sources (index MinHash LSH à côté de applications.db)
+DUPLICATE_DETECTION = os.getenv("DUPLICATE_DETECTION", "true").lower() == "true"
+DUPLICATE_INDEX_PATH = DATA_DIR / os.getenv("DUPLICATE_INDEX_PATH", "duplicates.db")
+DUPLICATE_SIMILARITY = float(os.getenv("DUPLICATE_SIMILARITY", "0.6"))  # Jaccard estimé (MinHash)
+DUPLICATE_TTL_DAYS = float(os.getenv("DUPLICATE_TTL_DAYS", "30"))  # Au-delà, une offre republiée est de nouveau traitée
+
+# Pipeline en flux: pages d'offres en attente entre le scraping et le filtrage/la génération
+# (au-delà, le scraping se met en pause)
+STREAM_QUEUE_SIZE = int(os.getenv("STREAM_QUEUE_SIZE", "4"))
+
 # Filtres
 LOCATION_KEYWORDS = os.getenv("LOCATION_KEYWORDS", "Lyon,remote,télétravail,distanciel,full remote").split(",")
 LOCATION_KEYWORDS = [k.strip().lower() for k in LOCATION_KEYWORDS]
@@ -45,9 +118,51 @@ DOMAIN_KEYWORDS = os.getenv(
 ).split(",")
 DOMAIN_KEYWORDS = [k.strip().lower() for k in DOMAIN_KEYWORDS]
 
+# Mots-clés de titre acceptant directement une offre (sans classification du domaine),
+# comparés en mots entiers, sans accents ni casse (formes féminines à lister)
+DOMAIN_TITLE_KEYWORDS = os.getenv(
+    "DOMAIN_TITLE_KEYWORDS",
+    "communication,événementiel,événementielle,event,marketing,chargé de communication,"
+    "chargée de communication,event manager,project manager,coordinateur,coordinatrice,"
+    "relations publiques,rp"
+).split(",")
+DOMAIN_TITLE_KEYWORDS = [k.strip().lower() for k in DOMAIN_TITLE_KEYWORDS]
+
 EXCLUDE_KEYWORDS = os.getenv("EXCLUDE_KEYWORDS", "stage,alternance,apprentissage,intern,internship").split(",")
 EXCLUDE_KEYWORDS = [k.strip().lower() for k in EXCLUDE_KEYWORDS]
 
+# Classifieur local du domaine (entraîné par train_domain_model.py): l'IA n'est consultée
+# que si la probabilité prédite est entre 1 - DOMAIN_MODEL_CONFIDENCE et DOMAIN_MODEL_CONFIDENCE
+DOMAIN_MODEL_ENABLED = os.getenv("DOMAIN_MODEL_ENABLED", "true").lower() == "true"
+DOMAIN_MODEL_PATH = DATA_DIR / os.getenv("DOMAIN_MODEL_PATH", "domain_model.npz")
+DOMAIN_MODEL_CONFIDENCE = float(os.getenv("DOMAIN_MODEL_CONFIDENCE", "0.9"))
+DOMAIN_MODEL_MIN_SAMPLES = int(os.getenv("DOMAIN_MODEL_MIN_SAMPLES", "100"))
+
+# Cache des verdicts de domaine de l'IA (offres republiées classées sans appel à l'API);
+# invalidé par modèle et par version du prompt
+DOMAIN_CACHE_ENABLED = os.getenv("DOMAIN_CACHE_ENABLED", "true").lower() == "true"
+DOMAIN_CACHE_PATH = DATA_DIR / os.getenv("DOMAIN_CACHE_PATH", "llm_cache.db")
+DOMAIN_CACHE_TTL_DAYS = float(os.getenv("DOMAIN_CACHE_TTL_DAYS", "30"))
+
+# Cache des complétions de l'IA (analyse, CV, lettre): un lot relancé ne rappelle pas l'API;
+# LLM_CACHE_BYPASS ignore les réponses en cache (elles sont remplacées par les nouvelles)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_BYPASS = os.getenv("LLM_CACHE_BYPASS", "false").lower() == "true"
+LLM_CACHE_PATH = DATA_DIR / os.getenv("LLM_CACHE_PATH", "llm_cache.db")
+LLM_CACHE_TTL_DAYS = float(os.getenv("LLM_CACHE_TTL_DAYS", "7"))
+LLM_CACHE_MAX_SIZE_MB = float(os.getenv("LLM_CACHE_MAX_SIZE_MB", "50"))
+
+# Classification groupée du domaine: offres par requête et budget de tokens du prompt (tiktoken)
+DOMAIN_BATCH_SIZE = int(os.getenv("DOMAIN_BATCH_SIZE", "25"))
+DOMAIN_BATCH_MAX_TOKENS = int(os.getenv("DOMAIN_BATCH_MAX_TOKENS", "6000"))
+
+# Filtrage en masse de l'historique (filter_backlog.py): processus de détection de langue
+FILTER_WORKERS = int(os.getenv("FILTER_WORKERS", "4"))
+
+# Détection de langue (profils de n-grammes de langdetect, préfixe du titre + description)
+LANGUAGE_CANDIDATES = [l.strip() for l in os.getenv("LANGUAGE_CANDIDATES", "fr,en,de,es,it,pt,nl").split(",") if l.strip()]
+LANGUAGE_PREFIX_CHARS = int(os.getenv("LANGUAGE_PREFIX_CHARS", "1000"))
+
 # Planification
 RUN_FREQUENCY = os.getenv("RUN_FREQUENCY", "daily")
 RUN_TIME = os.getenv("RUN_TIME", "09:00")
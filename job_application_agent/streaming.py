@@ -0,0 +1,158 @@
+"""
+Flux bornés entre les étapes du pipeline (scraping -> filtrage -> génération)
+"""
+
+import asyncio
+import queue
+import threading
+from typing import AsyncIterator, Awaitable, Callable, Generic, Iterable, Iterator, List, TypeVar
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_FINISHED = object()
+
+
+class BoundedStream(Generic[T]):
+    """
+    File bornée entre des producteurs (threads de scraping) et un consommateur
+    
+    Un producteur est bloqué tant que la file est pleine (contre-pression); quand
+    le consommateur s'arrête (close), les put() en attente retournent False pour
+    que les producteurs abandonnent leur travail.
+    """
+    
+    def __init__(self, maxsize: int = 4):
+        """
+        Initialise le flux
+        
+        Args:
+            maxsize: Nombre maximum d'éléments en attente de consommation
+        """
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, maxsize))
+        self._closed = threading.Event()
+    
+    @property
+    def closed(self) -> bool:
+        """Indique si le consommateur a arrêté la lecture"""
+        return self._closed.is_set()
+    
+    def put(self, item: T) -> bool:
+        """
+        Ajoute un élément (bloquant tant que la file est pleine)
+        
+        Args:
+            item: Élément à transmettre
+        
+        Returns:
+            True si l'élément a été transmis, False si le consommateur s'est arrêté
+        """
+        while not self._closed.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def finish(self):
+        """Signale la fin de la production (le consommateur s'arrête après les éléments en attente)"""
+        while not self._closed.is_set():
+            try:
+                self._queue.put(_FINISHED, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+    
+    def close(self):
+        """Arrête la consommation et débloque les producteurs (et le consommateur en attente)"""
+        self._closed.set()
+        try:
+            # File pleine: le consommateur n'est pas bloqué et verra _closed au prochain élément
+            self._queue.put_nowait(_FINISHED)
+        except queue.Full:
+            pass
+    
+    def __iter__(self) -> Iterator[T]:
+        """Lit les éléments jusqu'à finish() ou close() (attente bloquante, sans scrutation)"""
+        while not self._closed.is_set():
+            item = self._queue.get()
+            if item is _FINISHED or self._closed.is_set():
+                return
+            yield item
+
+
+async def aiterate(iterator: Iterator[T]) -> AsyncIterator[T]:
+    """
+    Consomme un itérateur bloquant depuis une boucle asyncio (chaque next() dans un thread)
+    
+    Args:
+        iterator: Itérateur bloquant (ex: BaseScraper.iter_offers)
+    
+    Yields:
+        Éléments de l'itérateur
+    """
+    finished = object()
+    try:
+        while True:
+            item = await asyncio.to_thread(next, iterator, finished)
+            if item is finished:
+                return
+            yield item
+    finally:
+        # close() peut attendre la fin d'un producteur (ex: iter_offer_batches): hors de la boucle
+        close = getattr(iterator, "close", None)
+        if close:
+            await asyncio.to_thread(close)
+
+
+async def process_concurrently(
+    items: Iterable[T],
+    worker: Callable[[T], Awaitable[R]],
+    concurrency: int = 4
+) -> List[R]:
+    """
+    Applique une coroutine à chaque élément d'un flux, au plus `concurrency` à la fois
+    
+    L'élément suivant n'est lu qu'une fois une place libérée: le flux amont (scraping,
+    filtrage) garde sa contre-pression.
+    
+    Args:
+        items: Éléments (itérable bloquant, lu depuis un thread)
+        worker: Coroutine de traitement d'un élément (gère ses propres erreurs)
+        concurrency: Nombre maximum d'éléments en cours de traitement
+    
+    Returns:
+        Résultats dans l'ordre des éléments
+    
+    Raises:
+        Exception: Erreur du flux amont, propagée une fois les éléments en cours traités
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    tasks = []
+    
+    async def run(item: T) -> R:
+        try:
+            return await worker(item)
+        finally:
+            semaphore.release()
+    
+    stream = aiterate(iter(items))
+    try:
+        while True:
+            await semaphore.acquire()
+            try:
+                item = await stream.__anext__()
+            except StopAsyncIteration:
+                break
+            tasks.append(asyncio.create_task(run(item)))
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        raise
+    finally:
+        # Aucune tâche orpheline, même si le flux amont échoue
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    return [task.result() for task in tasks]
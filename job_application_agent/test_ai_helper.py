@@ -0,0 +1,107 @@
+"""
+Tests de la classification de domaine groupée: réponses tronquées, division des lots, cache de verdicts
+"""
+
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from utils import ai_helper
+from utils.ai_helper import AIHelper
+from utils.verdict_cache import VerdictCache
+
+
+JOBS = [
+    ("Chargé de communication", "Communication interne et externe."),
+    ("Comptable", "Tenue de la comptabilité générale."),
+    ("Chef de projet communication", "Pilotage des campagnes."),
+    ("Développeur Python", "Développement d'API."),
+    ("Assistant communication événementielle", "Organisation de salons."),
+]
+
+
+class StubCompletions:
+    """API de chat simulée: verdict selon le titre, réponse tronquée au-delà de max_offers offres par requête"""
+    
+    def __init__(self, max_offers: int, skip_ids=()):
+        self.max_offers = max_offers
+        self.skip_ids = set(skip_ids)
+        self.batch_sizes = []
+        self.single_calls = 0
+    
+    def create(self, messages, response_format=None, **params):
+        prompt = messages[-1]["content"]
+        if response_format is None:
+            self.single_calls += 1
+            return self._reply("OUI" if "communication" in prompt.split("Description:")[0] else "NON")
+        
+        numbers = [int(number) for number in re.findall(r"^Offre (\d+)$", prompt, re.MULTILINE)]
+        titles = re.findall(r"^Titre: (.*)$", prompt, re.MULTILINE)
+        self.batch_sizes.append(len(numbers))
+        verdicts = [
+            {"id": number, "relevant": "communication" in title}
+            for number, title in zip(numbers, titles) if number not in self.skip_ids
+        ]
+        content = json.dumps({"verdicts": verdicts})
+        if len(numbers) > self.max_offers:
+            content = content[:len(content) // 2]
+        return self._reply(content)
+    
+    @staticmethod
+    def _reply(content: str):
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=None)
+
+
+@pytest.fixture
+def make_helper(tmp_path, monkeypatch):
+    """AIHelper sans réseau: client OpenAI simulé, cache de verdicts dans tmp_path, sans cache de complétions"""
+    def make(completions: StubCompletions) -> AIHelper:
+        client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        monkeypatch.setattr(ai_helper, "OpenAI", lambda api_key: client)
+        monkeypatch.setattr(ai_helper, "get_verdict_cache", lambda: VerdictCache(db_path=tmp_path / "verdicts.db"))
+        monkeypatch.setattr(ai_helper, "get_completion_cache", lambda: None)
+        helper = AIHelper(api_key="test")
+        # Estimation du nombre de tokens sans télécharger l'encodage tiktoken
+        helper._encoding = False
+        return helper
+    return make
+
+
+def test_truncated_batches_are_halved_until_answers_fit(make_helper):
+    completions = StubCompletions(max_offers=2)
+    helper = make_helper(completions)
+    
+    results = helper.detect_job_domains(JOBS)
+    
+    assert results == [True, False, True, False, True]
+    # 5 tronqué -> 2 + 3, puis 3 tronqué -> 1 + 2
+    assert completions.batch_sizes == [5, 2, 3, 1, 2]
+    assert completions.single_calls == 0
+
+
+def test_batches_respect_size_limit(make_helper):
+    completions = StubCompletions(max_offers=25)
+    helper = make_helper(completions)
+    
+    assert helper.detect_job_domains(JOBS, max_batch_size=2) == [True, False, True, False, True]
+    assert completions.batch_sizes == [2, 2, 1]
+
+
+def test_cached_verdicts_are_not_sent_again(make_helper):
+    completions = StubCompletions(max_offers=25)
+    helper = make_helper(completions)
+    helper.detect_job_domains(JOBS[:3])
+    
+    assert helper.detect_job_domains(JOBS) == [True, False, True, False, True]
+    assert completions.batch_sizes == [3, 2]
+
+
+def test_missing_verdicts_fall_back_to_single_calls(make_helper):
+    completions = StubCompletions(max_offers=25, skip_ids={1})
+    helper = make_helper(completions)
+    
+    assert helper.detect_job_domains(JOBS[:3]) == [True, False, True]
+    assert completions.batch_sizes == [3]
+    assert completions.single_calls == 1
@@ -0,0 +1,83 @@
+"""
+Tests de la détection de doublons MinHash: regroupement entre sources, entreprise et lieu, index persistant
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+from utils.models import JobOffer
+from filters.duplicate_detector import DuplicateDetector
+
+
+DESCRIPTION = (
+    "Au sein de l'équipe marketing, vous pilotez la communication interne et externe, "
+    "rédigez les contenus des réseaux sociaux et organisez les événements clients."
+)
+
+
+def make_offer(
+    source: str,
+    location: str = "Lyon",
+    company: str = "Acme SAS",
+    description: str = DESCRIPTION,
+    title: str = "Chargé de communication H/F"
+) -> JobOffer:
+    return JobOffer(
+        title=title,
+        company=company,
+        location=location,
+        contract_type="CDI",
+        description=description,
+        url=f"https://example.com/{source}",
+        source=source,
+        application_type="form",
+        application_url=f"https://example.com/{source}"
+    )
+
+
+def test_cross_source_copies_keep_most_complete_description(tmp_path):
+    detector = DuplicateDetector(db_path=tmp_path / "dedup.db")
+    snippet = make_offer("indeed", "Lyon 3e", description=DESCRIPTION[:80])
+    full = make_offer("france_travail", "Lyon", description=DESCRIPTION + " Poste basé à Lyon.")
+    other = make_offer("indeed", title="Assistant événementiel", description="Organisation de salons professionnels.")
+    
+    assert detector.deduplicate([snippet, full, other]) == [full, other]
+
+
+def test_unknown_company_does_not_merge_offers(tmp_path):
+    detector = DuplicateDetector(db_path=tmp_path / "dedup.db")
+    first = make_offer("indeed", company="Non spécifié")
+    second = make_offer("france_travail", "Lyon 2e", company="Non spécifié")
+    
+    assert detector.deduplicate([first, second]) == [first, second]
+
+
+def test_different_locations_are_distinct_offers(tmp_path):
+    detector = DuplicateDetector(db_path=tmp_path / "dedup.db")
+    lyon = make_offer("indeed", "Lyon")
+    remote = make_offer("indeed", "Télétravail")
+    remote_copy = make_offer("france_travail", "Full Remote")
+    
+    assert detector.deduplicate([lyon, remote, remote_copy]) == [lyon, remote]
+
+
+def test_offer_seen_in_previous_run_is_dropped(tmp_path):
+    DuplicateDetector(db_path=tmp_path / "dedup.db").deduplicate([make_offer("indeed", "Lyon")])
+    
+    detector = DuplicateDetector(db_path=tmp_path / "dedup.db")
+    repost = make_offer("france_travail", "Lyon (69)")
+    
+    assert detector.deduplicate([repost]) == []
+
+
+def test_expired_entries_no_longer_match(tmp_path):
+    DuplicateDetector(db_path=tmp_path / "dedup.db").deduplicate([make_offer("indeed", "Lyon")])
+    conn = sqlite3.connect(tmp_path / "dedup.db")
+    conn.execute("UPDATE dedup_offers SET indexed_at = ?", (datetime.now() - timedelta(days=31),))
+    conn.commit()
+    conn.close()
+    
+    detector = DuplicateDetector(db_path=tmp_path / "dedup.db", ttl_days=30)
+    repost = make_offer("france_travail", "Lyon (69)")
+    
+    assert detector.deduplicate([repost]) == [repost]
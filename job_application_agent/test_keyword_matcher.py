@@ -0,0 +1,27 @@
+"""
+Tests de KeywordMatcher: accents ignorés dans les deux sens, mots entiers
+"""
+
+from filters.keyword_matcher import KeywordMatcher
+
+
+def test_unaccented_keyword_matches_accented_text():
+    assert KeywordMatcher(["teletravail"]).search("Télétravail partiel") == "teletravail"
+    assert KeywordMatcher(["evenementiel"]).search("Chargé de projet Événementiel") == "evenementiel"
+
+
+def test_accented_keyword_matches_unaccented_text():
+    assert KeywordMatcher(["télétravail"]).search("TELETRAVAIL possible") == "télétravail"
+    assert KeywordMatcher(["événementiel"]).search("chef de projet evenementiel") == "événementiel"
+
+
+def test_whole_words_only():
+    matcher = KeywordMatcher(["rp", "intern", "chargé de communication"])
+    assert matcher.search("Entreprise internationale, poste interne") is None
+    assert matcher.search("Chargé-de  communication (H/F)") == "chargé de communication"
+
+
+def test_repeated_anchor_is_checked_at_each_occurrence():
+    matcher = KeywordMatcher(["chargé de communication", "events"])
+    assert matcher.search("Chargée d'accueil, chargé de communication") == "chargé de communication"
+    assert matcher.find_all("Event manager, events") == ["events"]
@@ -0,0 +1,81 @@
+"""
+Tests du planificateur de requêtes: construction des recherches, ordre par rendement, élagage, plafond
+"""
+
+from scrapers.query_planner import QueryPlanner, SearchQuery, build_search_queries
+
+
+def make_queries(*keywords: str):
+    return [SearchQuery(keyword, "Lyon") for keyword in keywords]
+
+
+def keys(plan):
+    return [query.keywords for query in plan]
+
+
+def make_planner(tmp_path, **options) -> QueryPlanner:
+    settings = {"min_runs": 1, "min_share": 0.2, "explore_every": 2, "max_queries": 0}
+    settings.update(options)
+    return QueryPlanner(db_path=tmp_path / "app.db", **settings)
+
+
+def test_remote_synonyms_are_merged_into_one_location():
+    queries = build_search_queries(["communication", "communication", "événementiel"], ["Lyon", "remote", "télétravail", ""])
+    
+    assert [query.key for query in queries] == [
+        "communication|Lyon",
+        "communication|remote",
+        "événementiel|Lyon",
+        "événementiel|remote"
+    ]
+    assert queries[1].is_remote and not queries[0].is_remote
+
+
+def test_queries_are_ordered_by_unique_share_and_low_yield_dropped(tmp_path):
+    planner = make_planner(tmp_path)
+    measured = make_queries("large", "précis", "redondant")
+    # "précis" apporte 7 offres sur 10, "large" 3, "redondant" aucune nouvelle
+    planner.record_run("indeed", measured, {
+        "large|Lyon": {"a", "b", "c"},
+        "précis|Lyon": set("abcdefghij"),
+        "redondant|Lyon": {"a", "b"}
+    })
+    
+    plan = planner.plan("indeed", measured + make_queries("nouveau"))
+    
+    # Jamais mesurée d'abord, puis par part décroissante
+    assert keys(plan) == ["nouveau", "précis", "large"]
+
+
+def test_dropped_query_is_explored_again(tmp_path):
+    planner = make_planner(tmp_path)
+    candidates = make_queries("large", "redondant")
+    planner.record_run("indeed", candidates, {"large|Lyon": {"a", "b"}, "redondant|Lyon": {"a"}})
+    
+    for _ in range(2):
+        plan = planner.plan("indeed", candidates)
+        assert keys(plan) == ["large"]
+        planner.record_run("indeed", plan, {"large|Lyon": {"a", "b"}}, candidates)
+    
+    assert keys(planner.plan("indeed", candidates)) == ["redondant", "large"]
+
+
+def test_cap_shares_slots_between_exploration_and_best_queries(tmp_path):
+    planner = make_planner(tmp_path, max_queries=4)
+    measured = make_queries("m1", "m2", "m3")
+    planner.record_run("indeed", measured, {"m1|Lyon": set("ab"), "m2|Lyon": set("cdef"), "m3|Lyon": set("ghi")})
+    new = make_queries("n1", "n2", "n3", "n4", "n5")
+    
+    first = planner.plan("indeed", measured + new)
+    assert keys(first) == ["n1", "n2", "m2", "m3"]
+    
+    # Les requêtes explorées sont mesurées: les suivantes prennent leur place
+    planner.record_run("indeed", first, {"n1|Lyon": {"x"}, "n2|Lyon": {"y"}, "m2|Lyon": set("cdef"), "m3|Lyon": set("ghi")})
+    assert keys(planner.plan("indeed", measured + new)) == ["n3", "n4", "m2", "m3"]
+
+
+def test_no_cap_plans_every_candidate(tmp_path):
+    planner = make_planner(tmp_path)
+    candidates = make_queries(*(f"q{i}" for i in range(14)))
+    
+    assert planner.plan("indeed", candidates) == candidates
@@ -0,0 +1,93 @@
+"""
+Tests du seau à jetons: rafale, attente proportionnelle au déficit, réservations successives
+"""
+
+import asyncio
+
+import pytest
+
+from utils import rate_limiter
+from utils.rate_limiter import RateLimiter, TokenBucket, parse_host_limits
+
+
+class Clock:
+    """Horloge monotone contrôlée par le test"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(rate_limiter.time, "sleep", delays.append)
+    return delays
+
+
+def test_burst_is_served_immediately_then_waits_for_refill(clock, sleeps):
+    bucket = TokenBucket(rate=0.5, capacity=2)
+    
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    # Solde -1 à 0,5 jeton/s: 2 secondes d'attente
+    assert bucket.acquire() == pytest.approx(2.0)
+    assert sleeps == [pytest.approx(2.0)]
+
+
+def test_successive_reservations_queue_behind_each_other(clock):
+    bucket = TokenBucket(rate=2, capacity=1)
+    
+    waits = [bucket._reserve() for _ in range(4)]
+    
+    assert waits == [0, pytest.approx(0.5), pytest.approx(1.0), pytest.approx(1.5)]
+
+
+def test_refill_is_capped_at_capacity(clock):
+    bucket = TokenBucket(rate=1, capacity=2)
+    bucket._reserve(2)
+    
+    clock.now += 1
+    assert bucket._reserve() == 0
+    assert bucket._reserve() == pytest.approx(1.0)
+    
+    # Une longue pause ne cumule pas plus que la rafale
+    clock.now += 60
+    assert bucket._reserve(2) == 0
+    assert bucket._reserve() == pytest.approx(1.0)
+
+
+def test_async_acquire_waits_without_blocking_the_loop(clock, monkeypatch):
+    delays = []
+    
+    async def fake_sleep(delay):
+        delays.append(delay)
+    
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", fake_sleep)
+    bucket = TokenBucket(rate=4, capacity=1)
+    
+    async def acquire_three():
+        return await asyncio.gather(*(bucket.acquire_async() for _ in range(3)))
+    
+    assert asyncio.run(acquire_three()) == [0, pytest.approx(0.25), pytest.approx(0.5)]
+    assert delays == [pytest.approx(0.25), pytest.approx(0.5)]
+
+
+def test_hosts_have_separate_buckets_and_recorded_waits(clock, sleeps):
+    limiter = RateLimiter(default_rate=1, default_burst=1, host_limits=parse_host_limits("fr.indeed.com=0.5:1,bad=x"))
+    
+    limiter.acquire("fr.indeed.com")
+    limiter.acquire("fr.indeed.com")
+    limiter.acquire("francetravail.io")
+    
+    assert limiter.get_stats() == {"fr.indeed.com": pytest.approx(2.0), "francetravail.io": 0}
+    assert "bad" not in limiter.host_limits
@@ -0,0 +1,147 @@
+"""
+Tests de la résilience HTTP: circuit breaker, backoff et Retry-After, retries de BaseScraper
+"""
+
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from utils import resilience
+from utils.resilience import CircuitBreaker, CircuitOpenError, ResilienceManager, backoff_delay, parse_retry_after
+from scrapers.base_scraper import BaseScraper
+
+
+URL = "https://fr.indeed.com/jobs"
+
+
+class Clock:
+    """Horloge monotone contrôlée par le test"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(resilience.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(resilience.time, "sleep", delays.append)
+    return delays
+
+
+def make_response(status_code: int, **headers) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = URL
+    response.headers.update(headers)
+    return response
+
+
+def make_scraper(manager: ResilienceManager, outcomes):
+    """Scraper minimal pour BaseScraper._send_with_retries: chaque requête consomme une réponse ou lève une exception"""
+    def get(url, **kwargs):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    
+    session = SimpleNamespace(get=get)
+    return SimpleNamespace(
+        resilience=manager,
+        rate_limiter=None,
+        session_pool=SimpleNamespace(get_session=lambda host: session)
+    )
+
+
+def test_circuit_opens_after_threshold_and_lets_one_trial_through(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=60)
+    
+    assert not breaker.record_failure()
+    assert breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow_request()
+    
+    clock.now += 60
+    assert breaker.allow_request()
+    assert breaker.state == "half_open"
+    # Une seule requête d'essai tant qu'elle n'a pas rapporté son résultat
+    assert not breaker.allow_request()
+    
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow_request()
+
+
+def test_failed_trial_reopens_circuit(clock):
+    breaker = CircuitBreaker(failure_threshold=5, reset_seconds=60)
+    for _ in range(5):
+        breaker.record_failure()
+    
+    clock.now += 60
+    assert breaker.allow_request()
+    assert breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow_request()
+
+
+def test_lost_trial_is_replaced_after_reset_delay(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=60)
+    breaker.record_failure()
+    clock.now += 60
+    assert breaker.allow_request()
+    
+    clock.now += 60
+    assert breaker.allow_request()
+
+
+def test_backoff_is_bounded_and_retry_after_is_capped(monkeypatch):
+    monkeypatch.setattr(resilience.random, "uniform", lambda low, high: high)
+    
+    assert backoff_delay(0, base=1, maximum=30) == 1
+    assert backoff_delay(3, base=1, maximum=30) == 8
+    assert backoff_delay(10, base=1, maximum=30) == 30
+    assert backoff_delay(0, base=1, maximum=30, retry_after=120) == 30
+    assert parse_retry_after(make_response(429, **{"Retry-After": "12"})) == 12
+    assert parse_retry_after(make_response(429, **{"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0
+    assert parse_retry_after(make_response(429)) is None
+
+
+def test_retry_after_drives_the_wait_between_attempts(sleeps):
+    manager = ResilienceManager(max_retries=2, backoff_max=30)
+    scraper = make_scraper(manager, [make_response(429, **{"Retry-After": "5"}), make_response(200)])
+    
+    response = BaseScraper._send_with_retries(scraper, URL, None, {})
+    
+    assert response.status_code == 200
+    assert sleeps == [5]
+    # Le 429 ne compte pas comme une panne de l'hôte
+    assert manager.get_stats()["fr.indeed.com"] == {"state": "closed", "retries": 1, "failures": 0, "short_circuited": 0}
+
+
+def test_exhausted_retries_open_circuit_and_fail_fast(sleeps):
+    manager = ResilienceManager(max_retries=2, failure_threshold=3, reset_seconds=600)
+    scraper = make_scraper(manager, [requests.ConnectionError(), make_response(503), make_response(502)])
+    
+    response = BaseScraper._send_with_retries(scraper, URL, None, {})
+    
+    assert response.status_code == 502
+    assert len(sleeps) == 2
+    with pytest.raises(CircuitOpenError):
+        BaseScraper._send_with_retries(scraper, URL, None, {})
+    assert manager.get_stats()["fr.indeed.com"]["state"] == "open"
+    assert manager.get_stats()["fr.indeed.com"]["short_circuited"] == 1
+
+
+def test_client_errors_are_not_retried(sleeps):
+    manager = ResilienceManager(max_retries=3)
+    scraper = make_scraper(manager, [make_response(404)])
+    
+    assert BaseScraper._send_with_retries(scraper, URL, None, {}).status_code == 404
+    assert sleeps == []
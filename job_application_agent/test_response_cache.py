@@ -0,0 +1,102 @@
+"""
+Tests du cache de réponses HTTP: clé normalisée, TTL, revalidation ETag, éviction
+"""
+
+import sqlite3
+import time
+from types import SimpleNamespace
+
+import requests
+
+from utils.response_cache import ResponseCache, make_cache_key
+from scrapers.base_scraper import BaseScraper
+
+
+URL = "https://fr.indeed.com/jobs"
+
+
+def make_response(content: bytes = b"<html>page</html>", status_code: int = 200, **headers) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = URL
+    response._content = content
+    response.headers.update(headers)
+    return response
+
+
+def make_scraper(cache: ResponseCache, responses):
+    """Scraper minimal pour BaseScraper.fetch: réponses réseau simulées, en-têtes envoyés conservés"""
+    sent = []
+    
+    def send(url, params, headers):
+        sent.append(headers)
+        return responses.pop(0)
+    
+    return SimpleNamespace(response_cache=cache, _send_with_retries=send), sent
+
+
+def test_cache_key_ignores_parameter_order_host_case_and_fragment():
+    assert make_cache_key("https://FR.indeed.com/jobs?q=a&l=b#top") == make_cache_key(URL, {"l": "b", "q": "a"})
+    assert make_cache_key(URL, {"q": "a"}) != make_cache_key(URL, {"q": "b"})
+
+
+def test_fresh_entry_is_served_without_request(tmp_path):
+    cache = ResponseCache(tmp_path / "http.db", ttl_seconds=3600)
+    scraper, sent = make_scraper(cache, [make_response(ETag='"v1"')])
+    
+    first = BaseScraper.fetch(scraper, URL, params={"q": "a"})
+    second = BaseScraper.fetch(scraper, URL, params={"q": "a"})
+    
+    assert len(sent) == 1
+    assert not first.from_cache and second.from_cache
+    assert second.content == b"<html>page</html>"
+    assert cache.stats["hits"] == 1 and cache.stats["misses"] == 1
+
+
+def test_stale_entry_is_revalidated_with_etag(tmp_path):
+    cache = ResponseCache(tmp_path / "http.db", ttl_seconds=0)
+    scraper, sent = make_scraper(cache, [make_response(ETag='"v1"'), make_response(b"", status_code=304)])
+    
+    BaseScraper.fetch(scraper, URL)
+    cache.set_parsed(make_cache_key(URL), [{"title": "offre"}])
+    revalidated = BaseScraper.fetch(scraper, URL)
+    
+    assert sent[1]["If-None-Match"] == '"v1"'
+    assert revalidated.from_cache and revalidated.content == b"<html>page</html>"
+    # Page inchangée: le résultat de parsing reste utilisable
+    assert cache.get_parsed(make_cache_key(URL)) == [{"title": "offre"}]
+    assert cache.stats["revalidated"] == 1
+
+
+def test_changed_page_replaces_entry_and_drops_parsed_offers(tmp_path):
+    cache = ResponseCache(tmp_path / "http.db", ttl_seconds=0)
+    scraper, _ = make_scraper(cache, [make_response(ETag='"v1"'), make_response(b"<html>new</html>", ETag='"v2"')])
+    
+    BaseScraper.fetch(scraper, URL)
+    cache.set_parsed(make_cache_key(URL), [{"title": "offre"}])
+    response = BaseScraper.fetch(scraper, URL)
+    
+    assert not response.from_cache
+    entry = cache.get(make_cache_key(URL))
+    assert entry["content"] == b"<html>new</html>" and entry["etag"] == '"v2"'
+    assert cache.get_parsed(make_cache_key(URL)) is None
+
+
+def test_eviction_drops_expired_then_least_recently_used(tmp_path):
+    cache = ResponseCache(tmp_path / "http.db", max_age_seconds=3600, max_size_mb=3000 / (1024 * 1024))
+    for key in ("old", "a", "b"):
+        cache.store(key, make_response(b"x" * 1000))
+    
+    conn = sqlite3.connect(tmp_path / "http.db")
+    # "old" a expiré bien qu'utilisée récemment: seule la limite d'âge peut la retirer
+    conn.execute("UPDATE http_cache SET stored_at = ?, accessed_at = ? WHERE key = 'old'", (time.time() - 7200, time.time() + 60))
+    conn.execute("UPDATE http_cache SET accessed_at = accessed_at - 60 WHERE key = 'a'")
+    conn.commit()
+    conn.close()
+    
+    # 3,5 Ko sans "old" (expirée) pour 3 Ko autorisés: "a" est la moins récemment utilisée
+    cache.store("c", make_response(b"x" * 1500))
+    
+    assert cache.get("old") is None
+    assert cache.get("a") is None
+    assert cache.get("b") is not None and cache.get("c") is not None
@@ -0,0 +1,122 @@
+"""
+Tests des flux bornés: fin de production, arrêt du consommateur, traitement concurrent
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from utils.streaming import BoundedStream, aiterate, process_concurrently
+
+
+def produce(stream: BoundedStream, items, results: list):
+    """Producteur dans un thread: enregistre le retour de chaque put()"""
+    def run():
+        for item in items:
+            results.append(stream.put(item))
+        stream.finish()
+    
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_consumer_reads_every_item_until_finish():
+    stream = BoundedStream(maxsize=2)
+    results = []
+    thread = produce(stream, range(10), results)
+    
+    assert list(stream) == list(range(10))
+    thread.join(timeout=1)
+    assert results == [True] * 10
+
+
+def test_close_unblocks_producer_and_rejects_later_items():
+    stream = BoundedStream(maxsize=1)
+    results = []
+    thread = produce(stream, range(5), results)
+    
+    for item in stream:
+        assert item == 0
+        break
+    stream.close()
+    thread.join(timeout=1)
+    
+    assert not thread.is_alive()
+    assert stream.closed
+    assert results[-1] is False
+    assert stream.put("late") is False
+
+
+def test_close_wakes_a_waiting_consumer():
+    stream = BoundedStream(maxsize=2)
+    consumed = []
+    consumer = threading.Thread(target=lambda: consumed.extend(stream))
+    consumer.start()
+    
+    time.sleep(0.05)
+    stream.close()
+    consumer.join(timeout=1)
+    
+    assert not consumer.is_alive()
+    assert consumed == []
+
+
+def test_aiterate_closes_the_iterator_when_consumer_stops():
+    closed = []
+    
+    def offers():
+        try:
+            yield from range(100)
+        finally:
+            closed.append(True)
+    
+    async def first_two():
+        items = []
+        stream = aiterate(offers())
+        async for item in stream:
+            items.append(item)
+            if len(items) == 2:
+                break
+        await stream.aclose()
+        return items
+    
+    assert asyncio.run(first_two()) == [0, 1]
+    assert closed == [True]
+
+
+def test_process_concurrently_bounds_work_and_keeps_order():
+    running = []
+    peak = []
+    
+    async def worker(item: int) -> int:
+        running.append(item)
+        peak.append(len(running))
+        # Les premiers éléments finissent en dernier
+        await asyncio.sleep(0.01 * (5 - item))
+        running.remove(item)
+        return item * 10
+    
+    results = asyncio.run(process_concurrently(range(5), worker, concurrency=2))
+    
+    assert results == [0, 10, 20, 30, 40]
+    assert max(peak) == 2
+
+
+def test_upstream_error_is_raised_after_running_items_finish():
+    finished = []
+    
+    def items():
+        yield 1
+        raise RuntimeError("scraper down")
+    
+    async def worker(item: int) -> int:
+        await asyncio.sleep(0.01)
+        finished.append(item)
+        return item
+    
+    with pytest.raises(RuntimeError, match="scraper down"):
+        asyncio.run(process_concurrently(items(), worker, concurrency=2))
+    assert finished == [1]
@@ -0,0 +1,123 @@
+"""
+Tests du scraping incrémental: high-water marks, fenêtre de fraîcheur, arrêt sur la zone déjà vue
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+from utils.models import JobOffer
+from scrapers.base_scraper import BaseScraper
+from scrapers.watermarks import HighWaterMarkStore
+from config import WATERMARK_STOP_AFTER
+
+
+def make_offer(job_key: str, posted_date: datetime = None) -> JobOffer:
+    return JobOffer(
+        title=f"Offre {job_key}",
+        company="Acme",
+        location="Lyon",
+        contract_type="CDI",
+        description="",
+        url=f"https://example.com/{job_key}",
+        job_key=job_key,
+        source="stub",
+        posted_date=posted_date,
+        application_type="form",
+        application_url=f"https://example.com/{job_key}"
+    )
+
+
+class StubScraper(BaseScraper):
+    """Scraper sans réseau ni base: les cartes sont des offres déjà construites"""
+    
+    def __init__(self):
+        self.name = "stub"
+        self.response_cache = None
+        self._claimed_keys = {}
+        self._query_keys = {}
+        self._claims_lock = threading.Lock()
+        self.stats = {"pages": 0, "cards": 0, "duplicate_cards": 0, "offers": 0, "fetch_seconds": 0.0, "parse_seconds": 0.0}
+        self._stats_lock = threading.Lock()
+        self.parsed = []
+    
+    def scrape(self, max_offers: int = 50):
+        return []
+    
+    def extract_job_key(self, element):
+        return element.job_key
+    
+    def parse_job_offer(self, element):
+        self.parsed.append(element.job_key)
+        return element
+
+
+def test_update_keeps_recent_keys_first_and_newest_date(tmp_path):
+    store = HighWaterMarkStore(db_path=tmp_path / "app.db", max_keys=3)
+    recent = datetime(2026, 10, 10)
+    
+    store.update("indeed", "communication Lyon", [make_offer("a", recent), make_offer("b")])
+    store.update("indeed", "communication Lyon", [make_offer("c", recent - timedelta(days=5)), make_offer("d")])
+    
+    watermark = store.get("indeed", "communication Lyon")
+    assert watermark["seen_keys"] == ["c", "d", "a"]
+    # Une offre plus ancienne ne fait pas reculer la frontière
+    assert watermark["newest_posted_at"] == recent
+    assert store.get("indeed", "communication remote") is None
+
+
+def test_already_seen_by_key_or_older_posting_day():
+    scraper = StubScraper()
+    watermark = {"seen_keys": ["a"], "newest_posted_at": datetime(2026, 10, 10, 18), "updated_at": datetime.now()}
+    
+    assert scraper.is_already_seen(watermark, "a")
+    assert scraper.is_already_seen(watermark, "z", datetime(2026, 10, 9, 23))
+    # Même jour que la frontière: la date seule ne suffit pas
+    assert not scraper.is_already_seen(watermark, "z", datetime(2026, 10, 10, 8))
+    assert not scraper.is_already_seen(None, "a")
+
+
+def test_date_window_covers_time_since_last_run():
+    scraper = StubScraper()
+    
+    def window(elapsed: timedelta) -> int:
+        return scraper.get_date_window({"updated_at": datetime.now() - elapsed})
+    
+    assert scraper.get_date_window(None) == 7
+    assert window(timedelta(hours=2)) == 1
+    assert window(timedelta(days=2)) == 3
+    assert window(timedelta(days=10)) == 7
+
+
+def test_isolated_seen_cards_are_tolerated_before_stopping():
+    scraper = StubScraper()
+    seen = [f"s{i}" for i in range(WATERMARK_STOP_AFTER)]
+    watermark = {"seen_keys": ["sponsored"] + seen, "newest_posted_at": None, "updated_at": datetime.now()}
+    cards = [make_offer(key) for key in ["n1", "sponsored", "n2"] + seen + ["n3"]]
+    
+    offers, reached_seen = scraper.parse_new_cards(cards, watermark, max_results=50)
+    
+    assert [offer.job_key for offer in offers] == ["n1", "n2"]
+    assert reached_seen
+    # Les cartes déjà vues ne sont pas parsées
+    assert scraper.parsed == ["n1", "n2"]
+
+
+def test_cached_page_stops_like_a_parsed_page():
+    watermark = {"seen_keys": ["sponsored"], "newest_posted_at": None, "updated_at": datetime.now()}
+    cards = [make_offer(key) for key in ["n1", "sponsored", "n2", "n3"]]
+    
+    parsed = StubScraper().parse_new_cards(cards, watermark, max_results=50)
+    cached = StubScraper().select_new_offers(cards, watermark, max_results=50)
+    
+    assert [offer.job_key for offer in cached[0]] == [offer.job_key for offer in parsed[0]] == ["n1", "n2", "n3"]
+    assert cached[1] == parsed[1] is False
+
+
+def test_cards_claimed_by_another_query_are_skipped():
+    scraper = StubScraper()
+    scraper.claim_card("n1", "événementiel|lyon")
+    
+    offers, _ = scraper.parse_new_cards([make_offer("n1"), make_offer("n2")], None, 50, "communication|lyon")
+    
+    assert [offer.job_key for offer in offers] == ["n2"]
+    assert scraper.get_stats()["duplicate_cards"] == 1
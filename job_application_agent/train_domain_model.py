@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Réentraîne le classifieur local du domaine (communication/événementiel)
+Données: verdicts de l'IA enregistrés par JobFilter et offres ayant donné lieu à une candidature
+
+Usage:
+    python train_domain_model.py [--holdout 0.2] [--seed 42] [--confidence 0.9]
+
+Affiche la précision et le rappel sur les offres mises de côté, et la part des
+offres que le modèle décide sans l'IA au seuil de confiance.
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Ajouter le répertoire au path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.logger import setup_logger
+from filters.domain_classifier import DomainClassifier
+from config import DOMAIN_MODEL_CONFIDENCE, LOGS_DIR
+
+
+def main():
+    """Point d'entrée"""
+    parser = argparse.ArgumentParser(description="Réentraînement du classifieur de domaine")
+    parser.add_argument("--holdout", type=float, default=0.2, help="Part des offres réservée à l'évaluation")
+    parser.add_argument("--seed", type=int, default=42, help="Graine du tirage de l'évaluation")
+    parser.add_argument("--confidence", type=float, default=DOMAIN_MODEL_CONFIDENCE, help="Seuil de confiance")
+    args = parser.parse_args()
+    
+    setup_logger(logs_dir=str(LOGS_DIR))
+    
+    classifier = DomainClassifier(confidence=args.confidence)
+    metrics = classifier.train(holdout=args.holdout, seed=args.seed)
+    if metrics is None:
+        return 1
+    
+    print(f"\nDomain model saved to {classifier.model_path}")
+    print(f"evaluated on {metrics['samples']} held-out offers\n")
+    print(f"{'':<24} {'precision':>10} {'recall':>8} {'share':>7}")
+    print(f"{'all offers (p >= 0.5)':<24} {metrics['precision']:10.2f} {metrics['recall']:8.2f} {1:7.0%}")
+    print(
+        f"{'decided locally':<24} {metrics['covered_precision']:10.2f} {metrics['covered_recall']:8.2f} "
+        f"{metrics['coverage']:7.0%}"
+    )
+    print(f"\nThe remaining {1 - metrics['coverage']:.0%} would be sent to the AI (confidence {args.confidence}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+Cache persistant des verdicts de classification du domaine rendus par l'IA
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Optional, Sequence
+from loguru import logger
+
+from config import (
+    DOMAIN_CACHE_ENABLED,
+    DOMAIN_CACHE_PATH,
+    DOMAIN_CACHE_TTL_DAYS
+)
+
+
+def make_verdict_key(title: str, description: str, description_chars: int = 500) -> str:
+    """
+    Calcule la clé d'une offre: SHA-256 du titre et du début de description normalisés
+    
+    Seul le début de description envoyé dans le prompt compte: une offre republiée
+    (autre source, autre jour, autre fin de description) retrouve le même verdict.
+    
+    Args:
+        title: Titre du poste
+        description: Description du poste
+        description_chars: Nombre de caractères de description envoyés à l'IA
+    
+    Returns:
+        Clé hexadécimale
+    """
+    def normalize(text: str) -> str:
+        return " ".join(unicodedata.normalize("NFKC", text or "").lower().split())
+    
+    content = f"{normalize(title)}\n{normalize((description or '')[:description_chars])}"
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class VerdictCache:
+    """Verdicts OUI/NON de l'IA par offre, versionnés par modèle et par prompt, avec TTL"""
+    
+    def __init__(self, db_path: Path, ttl_days: float = 30):
+        """
+        Initialise le cache
+        
+        Args:
+            db_path: Fichier SQLite du cache
+            ttl_days: Durée de validité d'un verdict
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 24 * 3600
+        self.stats = {"hits": 0, "misses": 0, "stored": 0}
+        self._lock = threading.Lock()
+        self._init_database()
+    
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+    
+    def _init_database(self):
+        """Crée la table du cache et supprime les verdicts expirés"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS domain_verdict_cache (
+                key TEXT NOT NULL,
+                model TEXT NOT NULL,
+                prompt_version TEXT NOT NULL,
+                relevant BOOLEAN NOT NULL,
+                title TEXT,
+                stored_at REAL NOT NULL,
+                PRIMARY KEY (key, model, prompt_version)
+            )
+        ''')
+        
+        cursor.execute(
+            "DELETE FROM domain_verdict_cache WHERE stored_at < ?",
+            (time.time() - self.ttl_seconds,)
+        )
+        
+        conn.commit()
+        conn.close()
+    
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+    
+    def get(self, key: str, model: str, prompt_versions: Sequence[str]) -> Optional[bool]:
+        """
+        Récupère un verdict encore valide
+        
+        Args:
+            key: Clé de l'offre (make_verdict_key)
+            model: Modèle ayant rendu le verdict
+            prompt_versions: Versions des prompts de classification acceptées (le plus récent verdict l'emporte)
+        
+        Returns:
+            Verdict, ou None s'il faut interroger l'IA
+        """
+        placeholders = ", ".join("?" * len(prompt_versions))
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            SELECT relevant FROM domain_verdict_cache
+            WHERE key = ? AND model = ? AND prompt_version IN ({placeholders}) AND stored_at >= ?
+            ORDER BY stored_at DESC LIMIT 1
+        ''', (key, model, *prompt_versions, time.time() - self.ttl_seconds))
+        row = cursor.fetchone()
+        conn.close()
+        
+        self._count("hits" if row else "misses")
+        return bool(row[0]) if row else None
+    
+    def store(self, key: str, model: str, prompt_version: str, relevant: bool, title: str = ""):
+        """
+        Enregistre un verdict
+        
+        Args:
+            key: Clé de l'offre (make_verdict_key)
+            model: Modèle ayant rendu le verdict
+            prompt_version: Version du prompt de classification
+            relevant: Verdict
+            title: Titre du poste (lisibilité de la table uniquement)
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT OR REPLACE INTO domain_verdict_cache (key, model, prompt_version, relevant, title, stored_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (key, model, prompt_version, relevant, title, time.time()))
+        conn.commit()
+        conn.close()
+        
+        self._count("stored")
+    
+    def log_stats(self):
+        """Écrit les statistiques du cache dans les logs"""
+        with self._lock:
+            stats = dict(self.stats)
+        
+        lookups = stats["hits"] + stats["misses"]
+        if not lookups:
+            return
+        logger.info(
+            f"Domain verdict cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hits'] / lookups * 100:.0f}% classified without calling the AI)"
+        )
+
+
+_verdict_cache: Optional[VerdictCache] = None
+_verdict_cache_lock = threading.Lock()
+
+
+def get_verdict_cache() -> Optional[VerdictCache]:
+    """
+    Retourne le cache de verdicts partagé (None si désactivé via DOMAIN_CACHE_ENABLED)
+    
+    Returns:
+        Instance unique de VerdictCache ou None
+    """
+    global _verdict_cache
+    
+    if not DOMAIN_CACHE_ENABLED:
+        return None
+    
+    with _verdict_cache_lock:
+        if _verdict_cache is None:
+            _verdict_cache = VerdictCache(db_path=DOMAIN_CACHE_PATH, ttl_days=DOMAIN_CACHE_TTL_DAYS)
+        return _verdict_cache
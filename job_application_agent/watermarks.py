@@ -0,0 +1,115 @@
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+from loguru import logger
+
+from utils.models import JobOffer
+from config import DATABASE_PATH, WATERMARK_MAX_KEYS
+
+
+class HighWaterMarkStore:
+    """Mémorise, par source et par requête, la frontière des offres déjà vues (scraping incrémental)"""
+    
+    def __init__(self, db_path: Path = DATABASE_PATH, max_keys: int = WATERMARK_MAX_KEYS):
+        """
+        Initialise le stockage
+        
+        Args:
+            db_path: Base SQLite (applications.db par défaut)
+            max_keys: Nombre d'identifiants récents conservés par requête
+        """
+        self.db_path = db_path
+        self.max_keys = max_keys
+        self._init_database()
+    
+    def _init_database(self):
+        """Crée la table des high-water marks"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS scrape_watermarks (
+                source TEXT NOT NULL,
+                query_key TEXT NOT NULL,
+                newest_posted_at TIMESTAMP,
+                seen_keys TEXT NOT NULL,
+                updated_at TIMESTAMP NOT NULL,
+                PRIMARY KEY (source, query_key)
+            )
+        ''')
+        
+        conn.commit()
+        conn.close()
+    
+    def get(self, source: str, query_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Récupère la high-water mark d'une requête
+        
+        Args:
+            source: Nom du scraper
+            query_key: Identifiant de la requête (mots-clés + lieu)
+        
+        Returns:
+            Dictionnaire {newest_posted_at, seen_keys (liste, plus récents d'abord), updated_at} ou None
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        cursor = conn.cursor()
+        
+        cursor.execute(
+            "SELECT newest_posted_at, seen_keys, updated_at FROM scrape_watermarks WHERE source = ? AND query_key = ?",
+            (source, query_key)
+        )
+        row = cursor.fetchone()
+        conn.close()
+        
+        if not row:
+            return None
+        
+        return {
+            "newest_posted_at": datetime.fromisoformat(row[0]) if row[0] else None,
+            "seen_keys": json.loads(row[1]),
+            "updated_at": datetime.fromisoformat(row[2])
+        }
+    
+    def update(self, source: str, query_key: str, offers: List[JobOffer]):
+        """
+        Avance la high-water mark avec les offres nouvellement vues
+        
+        Args:
+            source: Nom du scraper
+            query_key: Identifiant de la requête
+            offers: Offres vues pendant cette exécution (ordre de la page)
+        """
+        previous = self.get(source, query_key) or {"newest_posted_at": None, "seen_keys": []}
+        
+        new_keys = [offer.job_key for offer in offers if offer.job_key]
+        seen_keys = list(dict.fromkeys(new_keys + previous["seen_keys"]))[:self.max_keys]
+        
+        posted_dates = [offer.posted_date for offer in offers if offer.posted_date]
+        if previous["newest_posted_at"]:
+            posted_dates.append(previous["newest_posted_at"])
+        newest_posted_at = max(posted_dates) if posted_dates else None
+        
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            INSERT OR REPLACE INTO scrape_watermarks (
+                source, query_key, newest_posted_at, seen_keys, updated_at
+            ) VALUES (?, ?, ?, ?, ?)
+        ''', (
+            source,
+            query_key,
+            newest_posted_at.isoformat() if newest_posted_at else None,
+            json.dumps(seen_keys),
+            datetime.now().isoformat()
+        ))
+        
+        conn.commit()
+        conn.close()
+        
+        logger.debug(f"Watermark updated for {source}/{query_key}: {len(new_keys)} new keys")
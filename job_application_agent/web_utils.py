@@ -1,12 +1,17 @@
 import random
+import re
 import time
-from typing import Optional
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional
 from loguru import logger
 
+# Selenium n'est importé qu'à l'utilisation: les scrapers HTTP n'en dépendent pas
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+from config import SELENIUM_IDLE_MS, SELENIUM_LOAD_TIMEOUT
+
 
 def get_random_delay(min_seconds: float = 2.0, max_seconds: float = 5.0) -> float:
     """
@@ -36,6 +41,48 @@ def sleep_random(min_seconds: float = 2.0, max_seconds: float = 5.0):
     time.sleep(delay)
 
 
+def parse_posted_date(text: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    Convertit une date de publication affichée par un job board en datetime
+    
+    Gère les formats relatifs ("Aujourd'hui", "il y a 3 jours", "Posted 2 days ago",
+    "hier", "30+ jours") et absolus ("12/10/2025").
+    
+    Args:
+        text: Texte de la date tel qu'affiché
+        now: Date de référence (maintenant par défaut)
+    
+    Returns:
+        Date de publication (à la journée) ou None si non reconnue
+    """
+    if not text:
+        return None
+    
+    now = now or datetime.now()
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    text_lower = text.lower()
+    
+    if any(word in text_lower for word in ("aujourd", "instant", "today", "just posted", "heure", "hour")):
+        return today
+    
+    if "hier" in text_lower or "yesterday" in text_lower:
+        return today - timedelta(days=1)
+    
+    absolute = re.search(r"(\d{1,2})/(\d{1,2})/(\d{4})", text_lower)
+    if absolute:
+        day, month, year = (int(part) for part in absolute.groups())
+        try:
+            return datetime(year, month, day)
+        except ValueError:
+            return None
+    
+    relative = re.search(r"(\d+)\+?\s*(jour|day)", text_lower)
+    if relative:
+        return today - timedelta(days=int(relative.group(1)))
+    
+    return None
+
+
 def get_user_agent() -> str:
     """
     Retourne un User-Agent réaliste
@@ -53,7 +100,22 @@ def get_user_agent() -> str:
     return random.choice(user_agents)
 
 
-def setup_selenium_driver(headless: bool = True, user_data_dir: Optional[str] = None) -> webdriver.Chrome:
+@lru_cache(maxsize=1)
+def get_chromedriver_path() -> str:
+    """
+    Résout le chemin du binaire chromedriver (téléchargé si besoin) une seule fois par processus
+    
+    Returns:
+        Chemin du chromedriver
+    """
+    from webdriver_manager.chrome import ChromeDriverManager
+    
+    path = ChromeDriverManager().install()
+    logger.debug(f"Chromedriver resolved: {path}")
+    return path
+
+
+def setup_selenium_driver(headless: bool = True, user_data_dir: Optional[str] = None) -> "webdriver.Chrome":
     """
     Configure et retourne un WebDriver Selenium avec options anti-détection
     
@@ -64,6 +126,10 @@ def setup_selenium_driver(headless: bool = True, user_data_dir: Optional[str] =
     Returns:
         WebDriver Chrome configuré
     """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    
     options = Options()
     
     # Mode headless
@@ -103,7 +169,7 @@ def setup_selenium_driver(headless: bool = True, user_data_dir: Optional[str] =
     
     try:
         # Installer et configurer le driver
-        service = Service(ChromeDriverManager().install())
+        service = Service(get_chromedriver_path())
         driver = webdriver.Chrome(service=service, options=options)
         
         # Script pour masquer l'automation
@@ -117,39 +183,145 @@ def setup_selenium_driver(headless: bool = True, user_data_dir: Optional[str] =
         raise
 
 
-def scroll_page(driver: webdriver.Chrome, scroll_pause_time: float = 1.0):
+# Script injecté dans la page: observe les mutations du DOM et les requêtes fetch/XHR en cours,
+# puis retourne l'état de chargement (idle, nombre d'éléments, hauteur)
+CONTENT_STATE_JS = """
+var selector = arguments[0], idleMs = arguments[1];
+if (!window.__contentWatch) {
+    var watch = window.__contentWatch = {lastActivity: performance.now(), pending: 0};
+    var touch = function () { watch.lastActivity = performance.now(); };
+    new MutationObserver(touch).observe(document.documentElement, {childList: true, subtree: true});
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            watch.pending++; touch();
+            return originalFetch.apply(this, arguments).finally(function () { watch.pending--; touch(); });
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        watch.pending++; touch();
+        this.addEventListener('loadend', function () { watch.pending--; touch(); });
+        return originalSend.apply(this, arguments);
+    };
+}
+var watch = window.__contentWatch;
+return {
+    idle: document.readyState === 'complete' && watch.pending <= 0
+        && performance.now() - watch.lastActivity >= idleMs,
+    count: selector ? document.querySelectorAll(selector).length : 0,
+    height: document.body ? document.body.scrollHeight : 0
+};
+"""
+
+
+def get_content_state(driver: "webdriver.Chrome", item_selector: Optional[str] = None, idle_ms: int = SELENIUM_IDLE_MS) -> Dict[str, Any]:
     """
-    Scroll progressif de la page pour charger le contenu dynamique
+    Retourne l'état de chargement de la page (installe l'observateur au premier appel)
     
     Args:
         driver: WebDriver Selenium
-        scroll_pause_time: Temps de pause entre chaque scroll
+        item_selector: Sélecteur CSS des éléments à compter (cartes d'offres...)
+        idle_ms: Durée sans mutation du DOM ni requête réseau pour considérer la page stable
+    
+    Returns:
+        Dictionnaire {idle, count, height}
     """
-    # Obtenir la hauteur de la page
-    last_height = driver.execute_script("return document.body.scrollHeight")
+    return driver.execute_script(CONTENT_STATE_JS, item_selector, idle_ms)
+
+
+def wait_for_content(
+    driver: "webdriver.Chrome",
+    item_selector: Optional[str] = None,
+    min_items: Optional[int] = None,
+    idle_ms: int = SELENIUM_IDLE_MS,
+    timeout: float = SELENIUM_LOAD_TIMEOUT
+) -> Dict[str, Any]:
+    """
+    Attend que le contenu dynamique soit chargé, sans pause fixe
     
-    while True:
-        # Scroll vers le bas
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+    L'attente se termine dès que `min_items` éléments sont présents, ou dès que
+    la page est stable (aucune mutation du DOM ni requête fetch/XHR pendant `idle_ms`).
+    
+    Args:
+        driver: WebDriver Selenium
+        item_selector: Sélecteur CSS des éléments attendus
+        min_items: Nombre d'éléments à atteindre (None: attendre seulement la stabilité)
+        idle_ms: Durée de stabilité en millisecondes
+        timeout: Attente maximale en secondes
         
-        # Attendre le chargement
-        time.sleep(scroll_pause_time)
+    Returns:
+        Dernier état observé {idle, count, height}
+    """
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException
+    
+    state = {}
+    
+    def loaded(driver):
+        state.update(get_content_state(driver, item_selector, idle_ms))
+        if min_items is not None and item_selector and state["count"] >= min_items:
+            return True
+        return state["idle"]
+    
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(loaded)
+    except TimeoutException:
+        logger.warning(f"Content still loading after {timeout}s ({state.get('count', 0)} items)")
+    
+    return state
+
+
+def scroll_page(
+    driver: "webdriver.Chrome",
+    item_selector: Optional[str] = None,
+    target_items: Optional[int] = None,
+    idle_ms: int = SELENIUM_IDLE_MS,
+    timeout: float = SELENIUM_LOAD_TIMEOUT
+) -> int:
+    """
+    Scroll progressif de la page pour charger le contenu dynamique (listes infinies)
+    
+    Après chaque scroll, on attend que la page soit de nouveau stable plutôt qu'une
+    pause fixe; on s'arrête quand le nombre d'éléments cible est atteint, quand un
+    scroll ne charge plus rien, ou après `timeout` secondes.
+    
+    Args:
+        driver: WebDriver Selenium
+        item_selector: Sélecteur CSS des éléments chargés au scroll
+        target_items: Nombre d'éléments à charger (None: jusqu'en bas de la page)
+        idle_ms: Durée de stabilité en millisecondes
+        timeout: Durée maximale totale en secondes
+    
+    Returns:
+        Nombre d'éléments `item_selector` présents (0 sans sélecteur)
+    """
+    deadline = time.monotonic() + timeout
+    state = wait_for_content(driver, item_selector, target_items, idle_ms, timeout)
+    
+    while not (target_items and state["count"] >= target_items):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.warning(f"Scrolling stopped after {timeout}s ({state['count']} items)")
+            break
+        
+        previous = state
         
-        # Calculer la nouvelle hauteur
-        new_height = driver.execute_script("return document.body.scrollHeight")
+        # Scroll vers le bas puis attente du contenu chargé
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        state = wait_for_content(driver, item_selector, target_items, idle_ms, remaining)
         
-        # Sortir si on a atteint le bas
-        if new_height == last_height:
+        # Sortir si le scroll n'a rien chargé
+        if state["height"] == previous["height"] and state["count"] == previous["count"]:
             break
-            
-        last_height = new_height
     
     # Scroll vers le haut
     driver.execute_script("window.scrollTo(0, 0);")
-    logger.debug("Page scrolled completely")
+    logger.debug(f"Page scrolled completely ({state['count']} items)")
+    return state["count"]
 
 
-def safe_find_element(driver: webdriver.Chrome, by, value, timeout: int = 10):
+def safe_find_element(driver: "webdriver.Chrome", by, value, timeout: int = 10, clickable: bool = False):
     """
     Trouve un élément avec gestion d'erreur
     
@@ -158,6 +330,7 @@ def safe_find_element(driver: webdriver.Chrome, by, value, timeout: int = 10):
         by: Type de sélecteur (By.ID, By.XPATH, etc.)
         value: Valeur du sélecteur
         timeout: Timeout en secondes
+        clickable: Attendre que l'élément soit visible et cliquable
         
     Returns:
         Element trouvé ou None
@@ -166,9 +339,11 @@ def safe_find_element(driver: webdriver.Chrome, by, value, timeout: int = 10):
     from selenium.webdriver.support import expected_conditions as EC
     from selenium.common.exceptions import TimeoutException, NoSuchElementException
     
+    condition = EC.element_to_be_clickable if clickable else EC.presence_of_element_located
+    
     try:
-        element = WebDriverWait(driver, timeout).until(
-            EC.presence_of_element_located((by, value))
+        element = WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            condition((by, value))
         )
         return element
     except (TimeoutException, NoSuchElementException) as e:
@@ -176,35 +351,45 @@ def safe_find_element(driver: webdriver.Chrome, by, value, timeout: int = 10):
         return None
 
 
-def safe_click(driver: webdriver.Chrome, element):
+def safe_click(driver: "webdriver.Chrome", element, wait_for_load: bool = True, timeout: float = 10):
     """
     Clique sur un élément avec gestion d'erreur
     
     Args:
         driver: WebDriver Selenium
         element: Element à cliquer
+        wait_for_load: Attendre que la page soit stable après le clic (contenu chargé par le clic)
+        timeout: Attente maximale en secondes (élément cliquable, puis chargement)
         
     Returns:
         True si succès, False sinon
     """
-    from selenium.common.exceptions import ElementClickInterceptedException, ElementNotInteractableException
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import (
+        ElementClickInterceptedException,
+        ElementNotInteractableException,
+        TimeoutException
+    )
     
     try:
-        # Scroll vers l'élément
-        driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        sleep_random(0.5, 1.0)
+        # Scroll vers l'élément puis attente qu'il soit cliquable
+        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(EC.element_to_be_clickable(element))
         
         # Cliquer
         element.click()
-        return True
         
-    except (ElementClickInterceptedException, ElementNotInteractableException) as e:
+    except (ElementClickInterceptedException, ElementNotInteractableException, TimeoutException) as e:
         logger.warning(f"Could not click element: {e}")
         
         # Essayer avec JavaScript
         try:
             driver.execute_script("arguments[0].click();", element)
-            return True
         except Exception as e2:
             logger.error(f"JavaScript click also failed: {e2}")
             return False
+    
+    if wait_for_load:
+        wait_for_content(driver, timeout=timeout)
+    return True